@@ -0,0 +1,245 @@
+"""
+This module benchmarks the throughput of all detectors in samples per second across grids of window sizes, numbers of
+features and stream lengths. The results are written as JSON and summarized in a table that additionally lists the
+scaling exponent of each detector's run time in the window size. Since the stream length is fixed per row, an exponent
+of 0 indicates a cost per sample independent of the window size, whereas an exponent of 1 or more indicates a cost per
+sample growing at least linearly with the window size.
+
+Execute `python -m benchmarks.detector_throughput --help` for all options.
+"""
+import argparse
+import json
+import os
+import time
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+from threadpoolctl import threadpool_limits
+
+from detectors import (
+    BayesianNonparametricDetectionMethod,
+    ClusteredStatisticalTestDriftDetectionMethod,
+    DiscriminativeDriftDetector2019,
+    EDFS,
+    ImageBasedDriftDetector,
+    NNDVI,
+    OneClassDriftDetector,
+    SemiParametricLogLikelihood,
+    UCDD,
+    UDetect,
+)
+
+DETECTORS: Dict[str, Callable] = {
+    "BayesianNonparametricDetectionMethod": lambda window_size, seed: BayesianNonparametricDetectionMethod(
+        n_samples=window_size, seed=seed
+    ),
+    "ClusteredStatisticalTestDriftDetectionMethod": lambda window_size, seed: (
+        ClusteredStatisticalTestDriftDetectionMethod(n_samples=window_size, n_clusters=2, seed=seed)
+    ),
+    "DiscriminativeDriftDetector2019": lambda window_size, seed: DiscriminativeDriftDetector2019(
+        n_reference_samples=window_size, seed=seed
+    ),
+    "EDFS": lambda window_size, seed: EDFS(window_size=window_size, seed=seed),
+    "ImageBasedDriftDetector": lambda window_size, seed: ImageBasedDriftDetector(n_samples=window_size, seed=seed),
+    "NNDVI": lambda window_size, seed: NNDVI(n_samples=window_size, seed=seed),
+    "OneClassDriftDetector": lambda window_size, seed: OneClassDriftDetector(
+        n_samples=window_size,
+        outlier_detector_kwargs={"nu": 0.5, "kernel": "rbf", "gamma": "auto"},
+        seed=seed,
+    ),
+    "SemiParametricLogLikelihood": lambda window_size, seed: SemiParametricLogLikelihood(
+        n_samples=window_size, n_clusters=2, threshold=0.05, seed=seed
+    ),
+    "UCDD": lambda window_size, seed: UCDD(
+        n_reference_samples=window_size, n_recent_samples=window_size, seed=seed
+    ),
+    "UDetect": lambda window_size, seed: UDetect(n_windows=5, n_samples=window_size, seed=seed),
+}
+
+
+def get_data(n_samples: int, n_features: int, seed: int) -> np.ndarray:
+    """
+    Generate a data stream of normally distributed features without concept drift, so that the throughput reflects
+    the detector's steady state rather than the number of resets.
+
+    :param n_samples: the number of samples
+    :param n_features: the number of features
+    :param seed: the seed
+    :return: the samples, one sample per row
+    """
+    rng = np.random.default_rng(seed)
+    return rng.normal(size=(n_samples, n_features))
+
+
+def benchmark(detector: str, window_size: int, n_features: int, n_samples: int, api: str, seed: int) -> dict:
+    """
+    Measure the time the detector takes to process a data stream.
+
+    :param detector: the name of the detector
+    :param window_size: the number of samples stored by the detector's windows
+    :param n_features: the number of features
+    :param n_samples: the length of the data stream
+    :param api: "update" to pass each sample as dict or "update_batch" to pass the data stream as array
+    :param seed: the seed of the detector and the data stream
+    :return: the configuration and the measured time and throughput
+    """
+    data = get_data(n_samples, n_features, seed)
+    model = DETECTORS[detector](window_size, seed)
+    if api == "update":
+        samples = [dict(enumerate(row)) for row in data.tolist()]
+        start = time.perf_counter()
+        n_drifts = sum(model.update(x) for x in samples)
+        seconds = time.perf_counter() - start
+    elif api == "update_batch":
+        start = time.perf_counter()
+        n_drifts = len(model.update_batch(data))
+        seconds = time.perf_counter() - start
+    else:
+        raise ValueError(f"Unknown api {api}.")
+    return {
+        "detector": detector,
+        "window_size": window_size,
+        "n_features": n_features,
+        "n_samples": n_samples,
+        "api": api,
+        "seconds": seconds,
+        "samples_per_second": n_samples / seconds,
+        "n_drifts": int(n_drifts),
+    }
+
+
+def run(
+    detectors: List[str],
+    window_sizes: List[int],
+    n_features: List[int],
+    stream_lengths: List[int],
+    api: str = "update_batch",
+    max_seconds: Optional[float] = None,
+    seed: int = 42,
+    verbose: bool = False,
+) -> List[dict]:
+    """
+    Benchmark all combinations of the given detectors, window sizes, numbers of features and stream lengths. Once a
+    run exceeds max_seconds, larger window sizes of the same detector, number of features and stream length are
+    skipped.
+
+    :param detectors: the names of the detectors
+    :param window_sizes: the window sizes
+    :param n_features: the numbers of features
+    :param stream_lengths: the stream lengths
+    :param api: "update" or "update_batch"
+    :param max_seconds: the time limit of a single run or None
+    :param seed: the seed
+    :param verbose: True if each result shall be printed, else False
+    :return: the results of all runs
+    """
+    results = []
+    for detector in detectors:
+        for dimensions in n_features:
+            for n_samples in stream_lengths:
+                for window_size in sorted(window_sizes):
+                    if 2 * window_size >= n_samples:
+                        # the detector's windows would never be full
+                        continue
+                    result = benchmark(detector, window_size, dimensions, n_samples, api, seed)
+                    results.append(result)
+                    if verbose:
+                        print(
+                            f"{detector}: window_size={window_size}, n_features={dimensions}, n_samples={n_samples}, "
+                            f"{result['samples_per_second']:.0f} samples/s"
+                        )
+                    if max_seconds is not None and result["seconds"] > max_seconds:
+                        break
+    return results
+
+
+def get_scaling_exponent(results: List[dict]) -> Optional[float]:
+    """
+    Estimate the exponent b of seconds ~ window_size^b by a least squares fit in log-log space.
+
+    :param results: the results of one detector, number of features and stream length
+    :return: the exponent or None if less than two window sizes were measured
+    """
+    if len(results) < 2:
+        return None
+    window_sizes = np.log([result["window_size"] for result in results])
+    seconds = np.log([result["seconds"] for result in results])
+    return float(np.polyfit(window_sizes, seconds, deg=1)[0])
+
+
+def summarize(results: List[dict]) -> str:
+    """
+    Summarize the results in a table with one row per detector, number of features and stream length, listing the
+    throughput per window size and the scaling exponent in the window size.
+
+    :param results: the results
+    :return: the table
+    """
+    window_sizes = sorted({result["window_size"] for result in results})
+    header = ["detector", "n_features", "n_samples"] + [f"w={w} [1/s]" for w in window_sizes] + ["exponent"]
+    rows = []
+    groups = {}
+    for result in results:
+        groups.setdefault((result["detector"], result["n_features"], result["n_samples"]), []).append(result)
+    for (detector, n_features, n_samples), group in groups.items():
+        throughputs = {result["window_size"]: result["samples_per_second"] for result in group}
+        exponent = get_scaling_exponent(group)
+        rows.append(
+            [detector, str(n_features), str(n_samples)]
+            + [f"{throughputs[w]:.0f}" if w in throughputs else "-" for w in window_sizes]
+            + ["-" if exponent is None else f"{exponent:.2f}"]
+        )
+    widths = [max(len(row[i]) for row in [header] + rows) for i in range(len(header))]
+    lines = [" | ".join(cell.ljust(width) for cell, width in zip(row, widths)) for row in [header] + rows]
+    lines.insert(1, "-+-".join("-" * width for width in widths))
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the throughput of all detectors.")
+    parser.add_argument("--detectors", nargs="+", default=list(DETECTORS), choices=list(DETECTORS))
+    parser.add_argument("--window-sizes", nargs="+", type=int, default=[100, 250, 500, 1000])
+    parser.add_argument("--n-features", nargs="+", type=int, default=[2, 8, 32, 128])
+    parser.add_argument("--stream-lengths", nargs="+", type=int, default=[5000, 20000])
+    parser.add_argument("--api", choices=["update", "update_batch"], default="update_batch")
+    parser.add_argument(
+        "--max-seconds",
+        type=float,
+        default=120,
+        help="skip larger window sizes once a run takes longer, defaults to 120",
+    )
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--quick",
+        action="store_true",
+        help="benchmark a small grid only, i.e., window sizes 50 and 100, 2 and 8 features and 500 samples",
+    )
+    parser.add_argument("--output", default=os.path.join("benchmarks", "results"))
+    args = parser.parse_args()
+    if args.quick:
+        args.window_sizes, args.n_features, args.stream_lengths = [50, 100], [2, 8], [500]
+
+    with threadpool_limits(limits=1):
+        results = run(
+            args.detectors,
+            args.window_sizes,
+            args.n_features,
+            args.stream_lengths,
+            api=args.api,
+            max_seconds=args.max_seconds,
+            seed=args.seed,
+            verbose=True,
+        )
+    summary = summarize(results)
+    print(summary)
+
+    os.makedirs(args.output, exist_ok=True)
+    name = f"throughput_{int(time.time())}"
+    with open(os.path.join(args.output, f"{name}.json"), "w") as f:
+        json.dump(results, f, indent=2)
+    with open(os.path.join(args.output, f"{name}.txt"), "w") as f:
+        f.write(summary + "\n")
+
+
+if __name__ == "__main__":
+    main()
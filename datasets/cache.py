@@ -0,0 +1,224 @@
+"""This module provides a materialized columnar cache for file-backed data streams."""
+import json
+import os
+from abc import ABC, abstractmethod
+from os import path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+from river.datasets import base
+
+CACHE_VERSION = 1
+
+
+class ColumnarCache:
+    """
+    ColumnarCache stores a data stream as a feature matrix, the label code of each sample and a table to decode label
+    codes into labels. Feature matrix and label codes are read through memory maps, i.e., replaying the data stream
+    does not parse any files.
+
+    The feature matrix contains each feature as a float, which is how concept drift detectors see features. Since
+    river's classifiers treat features differently depending on their type, the original types are restored when
+    iterating over the cache: integer features are converted to int and non-numeric features, e.g., nominal ARFF
+    attributes, are decoded with a lookup table.
+    """
+
+    block_size = 4096
+
+    def __init__(self, directory: str):
+        """
+        Init a new ColumnarCache by memory-mapping the cache stored in the given directory.
+
+        :param directory: the directory of the cache
+        """
+        with open(path.join(directory, "meta.json")) as f:
+            meta = json.load(f)
+        self.features = np.load(path.join(directory, "features.npy"), mmap_mode="r")
+        self.label_codes = np.load(path.join(directory, "label_codes.npy"), mmap_mode="r")
+        self.feature_names: List[str] = meta["feature_names"]
+        self.labels: List[Any] = meta["labels"]
+        self.integer_columns: List[int] = meta["integer_columns"]
+        self.nominal_columns: Dict[int, Dict[float, Any]] = {
+            int(column): {value: original for value, original in table}
+            for column, table in meta["nominal_columns"].items()
+        }
+
+    def __len__(self):
+        return len(self.label_codes)
+
+    def __iter__(self) -> Iterator[Tuple[dict, Any]]:
+        """
+        Iterate over the samples as feature dicts and labels like river's stream iterators do.
+
+        :return: the features and the label of each sample
+        """
+        for start in range(0, len(self), self.block_size):
+            block = np.asarray(self.features[start: start + self.block_size])
+            columns = [column.tolist() for column in block.T]
+            for i in self.integer_columns:
+                columns[i] = block[:, i].astype(np.int64).tolist()
+            for i, table in self.nominal_columns.items():
+                columns[i] = [table[value] for value in columns[i]]
+            labels = [self.labels[code] for code in self.label_codes[start: start + self.block_size].tolist()]
+            for row, y in zip(zip(*columns), labels):
+                yield dict(zip(self.feature_names, row)), y
+
+    def iter_arrays(self) -> Iterator[Tuple[np.ndarray, Any]]:
+        """
+        Iterate over the samples as rows of the feature matrix and labels.
+
+        :return: the features and the label of each sample
+        """
+        for start in range(0, len(self), self.block_size):
+            block = np.asarray(self.features[start: start + self.block_size])
+            codes = self.label_codes[start: start + self.block_size].tolist()
+            for x, code in zip(block, codes):
+                yield x, self.labels[code]
+
+
+class CachedFileDataset(base.FileDataset, ABC):
+    """
+    CachedFileDataset is the base class of all file-backed data streams. On the first iteration, the file is parsed
+    once by _iter_source and materialized into a ColumnarCache, which is stored in the directory 'cache' next to the
+    file. All further iterations replay the cache. The cache is rebuilt if the file changes. If a data stream contains
+    features that cannot be represented as floats, the file is parsed on every iteration instead.
+    """
+
+    def __init__(self, **desc):
+        super().__init__(**desc)
+        self.full_path = ""
+
+    @property
+    def cache_path(self) -> str:
+        """
+        The directory of the data stream's cache.
+        """
+        return path.join(path.dirname(self.full_path), "cache", self.filename)
+
+    def __iter__(self):
+        cache = self.materialize()
+        if cache is None:
+            return self._iter_source()
+        return iter(cache)
+
+    @abstractmethod
+    def _iter_source(self):
+        """
+        Parse the file.
+
+        :return: an iterator over the features and labels of the file
+        """
+        raise NotImplementedError("This abstract base class does not implement _iter_source.")
+
+    def materialize(self) -> Optional[ColumnarCache]:
+        """
+        Get the cache of the data stream. If no up-to-date cache exists, it is created first.
+
+        :return: the cache or None if the data stream cannot be cached
+        """
+        meta = self._read_meta()
+        if meta is None or meta["source"] != self._get_source_stats():
+            meta = self._write_cache()
+        if not meta["cacheable"]:
+            return None
+        return ColumnarCache(self.cache_path)
+
+    def _get_source_stats(self) -> Dict[str, int]:
+        """
+        Get the size and modification time of the file to detect changes of the file.
+
+        :return: the stats
+        """
+        stats = os.stat(self.full_path)
+        return {"size": stats.st_size, "mtime_ns": stats.st_mtime_ns, "version": CACHE_VERSION}
+
+    def _read_meta(self) -> Optional[dict]:
+        """
+        Read the meta data of the cache.
+
+        :return: the meta data or None if no cache exists
+        """
+        meta_path = path.join(self.cache_path, "meta.json")
+        if not path.exists(meta_path):
+            return None
+        with open(meta_path) as f:
+            return json.load(f)
+
+    def _write_cache(self) -> dict:
+        """
+        Parse the file and write the cache. All files are written to temporary files first and then moved, with the
+        meta data being moved last. Hence, concurrent processes never read incomplete caches. If the data stream
+        contains features that cannot be cached, only the meta data is written to avoid further attempts.
+
+        :return: the meta data
+        """
+        meta = {"source": self._get_source_stats(), "cacheable": False}
+        arrays = self._parse_source()
+        if arrays is not None:
+            features, label_codes, meta_update = arrays
+            meta["cacheable"] = True
+            meta.update(meta_update)
+
+        os.makedirs(self.cache_path, exist_ok=True)
+        suffix = f".{os.getpid()}.tmp"
+        temporary_files = []
+        if arrays is not None:
+            for name, array in (("features.npy", features), ("label_codes.npy", label_codes)):
+                with open(path.join(self.cache_path, name + suffix), "wb") as f:
+                    np.save(f, array)
+                temporary_files.append(name)
+        with open(path.join(self.cache_path, "meta.json" + suffix), "w") as f:
+            json.dump(meta, f)
+        temporary_files.append("meta.json")
+        for name in temporary_files:
+            os.replace(path.join(self.cache_path, name + suffix), path.join(self.cache_path, name))
+        return meta
+
+    def _parse_source(self) -> Optional[Tuple[np.ndarray, np.ndarray, dict]]:
+        """
+        Parse the file into a feature matrix and label codes.
+
+        :return: the feature matrix, the label codes and the meta data required to restore the samples or None if the
+            data stream contains features that cannot be cached
+        """
+        feature_names = None
+        blocks = []
+        rows = []
+        label_codes = []
+        label_indices = {}
+        column_types = []
+        nominal_columns = {}
+        for x, y in self._iter_source():
+            if feature_names is None:
+                feature_names = list(x.keys())
+                column_types = [None] * len(feature_names)
+            try:
+                row = [float(value) for value in x.values()]
+            except (TypeError, ValueError):
+                return None
+            for i, value in enumerate(x.values()):
+                value_type = type(value) if type(value) in (int, float) else object
+                if column_types[i] is None or column_types[i] is int and value_type is float:
+                    column_types[i] = value_type
+                elif (column_types[i] is object) != (value_type is object):
+                    # columns mixing numeric and non-numeric values cannot be restored unambiguously
+                    return None
+                if value_type is object and nominal_columns.setdefault(i, {}).setdefault(row[i], value) != value:
+                    return None
+            rows.append(row)
+            if len(rows) == ColumnarCache.block_size:
+                blocks.append(np.array(rows, dtype=float))
+                rows = []
+            if y not in label_indices:
+                label_indices[y] = len(label_indices)
+            label_codes.append(label_indices[y])
+        if feature_names is None:
+            return None
+        blocks.append(np.array(rows, dtype=float).reshape(-1, len(feature_names)))
+        meta = {
+            "feature_names": feature_names,
+            "labels": list(label_indices.keys()),
+            "integer_columns": [i for i, column_type in enumerate(column_types) if column_type is int],
+            "nominal_columns": {column: list(table.items()) for column, table in nominal_columns.items()},
+        }
+        return np.concatenate(blocks), np.array(label_codes, dtype=np.int64), meta
@@ -3,8 +3,10 @@ from os import path
 from river.datasets import base
 from river import stream
 
+from .cache import CachedFileDataset
 
-class Electricity(base.FileDataset):
+
+class Electricity(CachedFileDataset):
     def __init__(
         self,
         directory_path: str = "datasets/files",
@@ -17,7 +19,7 @@ class Electricity(base.FileDataset):
         )
         self.full_path = path.join(directory_path, self.filename)
 
-    def __iter__(self):
+    def _iter_source(self):
         return stream.iter_arff(
             self.full_path,
             target="class",
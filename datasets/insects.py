@@ -4,13 +4,11 @@ from os import path
 from river import stream
 from river.datasets import base
 
+from .cache import CachedFileDataset
 
-class Insects(base.FileDataset):
-    def __init__(self, **desc):
-        super().__init__(**desc)
-        self.full_path = ""
 
-    def __iter__(self):
+class Insects(CachedFileDataset):
+    def _iter_source(self):
         converters = {f"Att{i}": float for i in range(1, 34)}
         converters["class"] = str
         return stream.iter_csv(
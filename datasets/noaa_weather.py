@@ -3,8 +3,10 @@ from os import path
 from river.datasets import base
 from river import stream
 
+from .cache import CachedFileDataset
 
-class NOAAWeather(base.FileDataset):
+
+class NOAAWeather(CachedFileDataset):
     def __init__(
         self,
         directory_path: str = "datasets/files",
@@ -17,7 +19,7 @@ class NOAAWeather(base.FileDataset):
         )
         self.full_path = path.join(directory_path, self.filename)
 
-    def __iter__(self):
+    def _iter_source(self):
         converters = {f"attribute{i}": float for i in range(1, 9)}
         converters["class"] = int
         return stream.iter_csv(
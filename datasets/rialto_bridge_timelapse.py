@@ -3,8 +3,10 @@ from os import path
 from river.datasets import base
 from river import stream
 
+from .cache import CachedFileDataset
 
-class RialtoBridgeTimelapse(base.FileDataset):
+
+class RialtoBridgeTimelapse(CachedFileDataset):
     def __init__(
         self,
         directory_path: str = "datasets/files",
@@ -17,7 +19,7 @@ class RialtoBridgeTimelapse(base.FileDataset):
         )
         self.full_path = path.join(directory_path, self.filename)
 
-    def __iter__(self):
+    def _iter_source(self):
         converters = {f"att{i}": float for i in range(1, 28)}
         converters["class"] = int
         return stream.iter_csv(
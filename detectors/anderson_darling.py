@@ -0,0 +1,111 @@
+from functools import lru_cache
+
+import numpy as np
+
+# the critical values of the standardized statistic for two samples at the significance levels 0.25, 0.1, 0.05, 0.025,
+# 0.01, 0.005 and 0.001, interpolated from table 2 of Scholz and Stephens (1987) as by anderson_ksamp
+CRITICAL_VALUES = np.array([0.675, 1.281, 1.645, 1.96, 2.326, 2.573, 3.085]) + np.array(
+    [-0.245, 0.25, 0.678, 1.149, 1.822, 2.364, 3.615]
+) + np.array([-0.105, -0.305, -0.362, -0.391, -0.396, -0.345, -0.154])
+
+
+class AndersonDarlingTest:
+    """
+    A two-sample Anderson-Darling test of each feature of recent data against the same feature of fixed reference data.
+    The statistics equal the standardized midrank statistics computed by scipy's anderson_ksamp, but the reference data
+    is sorted only once. The recent data is sorted and merged with the sorted reference data, and the statistics of all
+    features are computed at once.
+
+    Source: Scholz, F. W.; Stephens, M. A. (1987). K-sample Anderson-Darling tests. Journal of the American Statistical
+        Association.
+    """
+
+    def __init__(self, reference_data: np.ndarray):
+        """
+        Init a new AndersonDarlingTest and sort the reference data.
+
+        :param reference_data: the reference data, one sample per row
+        """
+        self.sorted_reference_data = np.sort(reference_data, axis=0)
+
+    def get_statistics(self, data: np.ndarray) -> np.ndarray:
+        """
+        Get the standardized Anderson-Darling statistics of the recent data against the reference data.
+
+        :param data: the recent data, one sample per row
+        :raise: ValueError if both samples of a feature consist of a single distinct value
+        :return: the statistic of each feature
+        """
+        n_reference = len(self.sorted_reference_data)
+        n_recent = len(data)
+        n_total = n_reference + n_recent
+        n_features = self.sorted_reference_data.shape[1]
+        merged = np.concatenate((self.sorted_reference_data, np.sort(data, axis=0))).T
+        # the stable sort merges the two sorted runs in linear time
+        order = np.argsort(merged, axis=1, kind="stable")
+        values = np.take_along_axis(merged, order, axis=1)
+        is_recent = order >= n_reference
+        recent_counts = np.cumsum(is_recent, axis=1)
+
+        first = np.ones(values.shape, dtype=bool)
+        first[:, 1:] = values[:, 1:] != values[:, :-1]
+        # the features and positions of the first occurrences of the distinct values, grouped by feature
+        features, starts = np.nonzero(first)
+        if np.any(np.bincount(features, minlength=n_features) < 2):
+            raise ValueError("anderson_ksamp needs more than one distinct observation")
+        ends = np.full(len(starts), n_total - 1)
+        same_feature = features[1:] == features[:-1]
+        ends[:-1][same_feature] = starts[1:][same_feature] - 1
+
+        n_ties = ends - starts + 1
+        midranks = starts + n_ties / 2
+        recent_at_most = recent_counts[features, ends]
+        recent_ties = recent_at_most - recent_counts[features, starts] + is_recent[features, starts]
+        reference_at_most = ends + 1 - recent_at_most
+        reference_ties = n_ties - recent_ties
+
+        denominator = midranks * (n_total - midranks) - n_total * n_ties / 4
+        statistics = np.zeros(n_features)
+        for n, at_most, ties in [
+            (n_reference, reference_at_most, reference_ties),
+            (n_recent, recent_at_most, recent_ties),
+        ]:
+            inner = n_ties / n_total * (n_total * (at_most - ties / 2) - midranks * n) ** 2 / denominator
+            statistics += np.bincount(features, weights=inner, minlength=n_features) / n
+        statistics *= (n_total - 1) / n_total
+        return (statistics - 1) / np.sqrt(_get_variance(n_reference, n_recent))
+
+
+def _get_variance(n_reference: int, n_recent: int) -> float:
+    """
+    Get the variance of the unstandardized two-sample statistic as computed by anderson_ksamp.
+
+    :param n_reference: the size of the reference data
+    :param n_recent: the size of the recent data
+    :return: the variance
+    """
+    n_total = n_reference + n_recent
+    h, g = _get_harmonic_sums(n_total)
+    k = 2
+    big_h = 1 / n_reference + 1 / n_recent
+    a = (4 * g - 6) * (k - 1) + (10 - 6 * g) * big_h
+    b = (2 * g - 4) * k ** 2 + 8 * h * k + (2 * g - 14 * h - 4) * big_h - 8 * h + 4 * g - 6
+    c = (6 * h + 2 * g - 2) * k ** 2 + (4 * h - 4 * g + 6) * k + (2 * h - 6) * big_h + 4 * h
+    d = (2 * h + 6) * k ** 2 - 4 * h * k
+    return (a * n_total ** 3 + b * n_total ** 2 + c * n_total + d) / (
+        (n_total - 1.0) * (n_total - 2.0) * (n_total - 3.0)
+    )
+
+
+@lru_cache(maxsize=None)
+def _get_harmonic_sums(n_total: int) -> (float, float):
+    """
+    Get the sums h and g of Scholz and Stephens (1987), which only depend on the total number of observations.
+
+    :param n_total: the total number of observations
+    :return: h and g
+    """
+    hs_cs = (1.0 / np.arange(n_total - 1, 1, -1)).cumsum()
+    h = hs_cs[-1] + 1
+    g = (hs_cs / np.arange(2, n_total)).sum()
+    return h, g
@@ -1,7 +1,14 @@
 import time
 from abc import ABC, abstractmethod
+from contextlib import nullcontext
 from typing import Optional
 
+import numpy as np
+
+from .instrumentation import Instrumentation
+
+_not_measured = nullcontext()
+
 
 class SupervisedDriftDetector(ABC):
     """
@@ -20,8 +27,18 @@ class SupervisedDriftDetector(ABC):
 class UnsupervisedDriftDetector(ABC):
     """
     This abstract base class provides a consistent interface for all unsupervised concept drift detectors.
+
+    Besides update, which accepts the features of a single sample as dict, detectors may be updated with the features
+    of a single sample as numpy array using update_array or with a block of samples as 2-D numpy array using
+    update_batch. All three methods are equivalent, i.e., feeding the same samples through either of them yields the
+    same detections.
+
+    Instrumentation is disabled by default. Once enabled, the detector records the time spent in its phases, which
+    can be retrieved with get_instrumentation_snapshot.
     """
 
+    instrumentation: Optional[Instrumentation] = None
+
     def __init__(self, seed: Optional[int] = None):
         if seed is None:
             seed = int(time.time())
@@ -33,3 +50,97 @@ class UnsupervisedDriftDetector(ABC):
         features: dict,
     ) -> bool:
         raise NotImplementedError("This abstract base class does not implement update.")
+
+    def update_array(self, features: np.ndarray) -> bool:
+        """
+        Update the detector with the features of a single sample given as array. Detectors may store the array, so it
+        must not be modified afterwards. Detectors should override this method to avoid the conversion to a dict.
+
+        :param features: the features
+        :return: True if a drift was detected, else False
+        """
+        return self.update(dict(enumerate(features)))
+
+    def update_batch(self, data: np.ndarray) -> np.ndarray:
+        """
+        Update the detector with a block of samples, one sample per row. Samples that are only buffered by the
+        detector, e.g., while filling its data windows, are buffered all at once.
+
+        :param data: the samples
+        :return: the indices of the rows at which a drift was detected
+        """
+        data = np.array(data, dtype=float)
+        drifts = []
+        i = 0
+        while i < len(data):
+            n_buffered = min(self._n_buffering_updates(), len(data) - i)
+            if n_buffered > 0:
+                with self._measure("buffer"):
+                    self._buffer(data[i: i + n_buffered])
+                i += n_buffered
+            else:
+                if self.update_array(data[i]):
+                    drifts.append(i)
+                i += 1
+        return np.array(drifts, dtype=int)
+
+    def _n_buffering_updates(self) -> int:
+        """
+        Get the number of upcoming samples the detector only buffers without testing for concept drift.
+
+        :return: the number of samples
+        """
+        return 0
+
+    def _buffer(self, data: np.ndarray):
+        """
+        Buffer the given samples exactly as update_array would. Detectors returning a positive number of samples in
+        _n_buffering_updates must implement this method.
+
+        :param data: the samples
+        """
+        raise NotImplementedError("This detector does not support buffering blocks of samples.")
+
+    def enable_instrumentation(self):
+        """
+        Enable the instrumentation of the detector, discarding all previous records.
+        """
+        self.instrumentation = Instrumentation()
+
+    def get_instrumentation_snapshot(self) -> Optional[dict]:
+        """
+        Get the records of the instrumentation, see Instrumentation.snapshot.
+
+        :return: the records or None if the instrumentation is disabled
+        """
+        if self.instrumentation is None:
+            return None
+        return self.instrumentation.snapshot(self._get_window_occupancy())
+
+    def _get_window_occupancy(self) -> Optional[int]:
+        """
+        Get the number of samples currently stored in the detector's data windows.
+
+        :return: the number of samples or None if unknown
+        """
+        return None
+
+    def _measure(self, phase: str):
+        """
+        Get a context measuring the given phase if the instrumentation is enabled.
+
+        :param phase: the phase, one of Instrumentation.phases
+        :return: the context
+        """
+        if self.instrumentation is None:
+            return _not_measured
+        return self.instrumentation.measure(phase)
+
+    def _count(self, event: str):
+        """
+        Count the given event if the instrumentation is enabled.
+
+        :param event: the event
+        """
+        if self.instrumentation is not None:
+            self.instrumentation.count(event)
@@ -1,10 +1,9 @@
-from collections import deque
-
 import numpy as np
 from scipy import stats
 from scipy.special import betaln
 
 from .base import UnsupervisedDriftDetector
+from .window import Window
 
 
 class BayesianNonparametricDetectionMethod(UnsupervisedDriftDetector):
@@ -14,6 +13,10 @@ class BayesianNonparametricDetectionMethod(UnsupervisedDriftDetector):
     distributions in binary splits. If the similarity is below a pre-determined threshold for any feature, a concept
     drift is detected.
 
+    The Polya trees of all features are evaluated at once: The boundaries of all partitions are computed once, the
+    samples are binned into the partitions of the deepest level and the counts of the upper levels are obtained by
+    summing up the counts of their children.
+
     Source: Xuan, J.; Lu, J.; Zhang, G. (2020). Bayesian nonparametric unsupervised concept drift detection for data
         stream mining. ACM Transaction on Intelligent Systems and Technology.
     """
@@ -36,11 +39,13 @@ class BayesianNonparametricDetectionMethod(UnsupervisedDriftDetector):
         """
         super().__init__(seed)
         self.n_samples = n_samples
-        self.data_window = deque(maxlen=2 * n_samples)
+        self.data_window = Window(maxlen=2 * n_samples)
         self.const = const
         self.threshold = threshold
         self.max_depth = max_depth
         self.distribution = stats.norm(loc=0, scale=1)
+        n_partitions = 2 ** (max_depth + 1)
+        self.boundaries = self.distribution.ppf(np.arange(1, n_partitions) / n_partitions)
 
     def update(self, features: dict) -> bool:
         """
@@ -49,129 +54,113 @@ class BayesianNonparametricDetectionMethod(UnsupervisedDriftDetector):
         :param features: the features
         :returns: True if a drift was detected else False
         """
-        features = np.fromiter(features.values(), dtype=float)
+        return self.update_array(np.fromiter(features.values(), dtype=float))
+
+    def update_array(self, features: np.ndarray) -> bool:
+        """
+        Update the detector with the most recent observation given as array and determine if a drift occurred.
+
+        :param features: the features
+        :returns: True if a drift was detected else False
+        """
         self.data_window.append(features)
         if len(self.data_window) == self.data_window.maxlen:
-            data = np.array(self.data_window)
-            for i in range(len(features)):
-                sample_one, sample_two = self._get_samples(feature_index=i)
-                log_odd_ratios = self.polya_tree_test(sample_one, sample_two, 0)
-                test_statistic = 1 / (1 + np.exp(-log_odd_ratios))
-                if test_statistic < self.threshold:
-                    self.reset()
-                    return True
+            with self._measure("test"):
+                drift = self._detect_drift()
+            if drift:
+                self.reset()
+                return True
         return False
 
-    def polya_tree_test(
-        self,
-        sample_one: np.array,
-        sample_two: np.array,
-        level: int,
-        partition: str = "",
-    ) -> float:
-        """
-        Perform a Polya tree two-sample test with the given samples by partitioning the data to estimate data
-        distribution. As estimations are gathered over multiple levels in a Polya tree two-sample test, this method
-        is called recursively on shrinking partitions until the configured maximum depth is reached.
-
-        :param sample_one: the first sample
-        :param sample_two: the second sample
-        :param level: the current level in the Polya tree
-        :param partition: the binary index of the partition
-        :return: the test statistic that the hypothesis H0, sample_one == sample_two, is rejected
-        """
-        if level > self.max_depth:
-            return 0
-        partition_left = partition + "0"
-        partition_right = partition + "1"
-        n_one_left, n_two_left = self._get_interval_count(
-            sample_one, sample_two, partition_left
-        )
-        n_one_right, n_two_right = self._get_interval_count(
-            sample_one, sample_two, partition_right
-        )
-        n_left = n_one_left + n_two_left
-        n_right = n_one_right + n_two_right
-        if n_one_left + n_one_right == 0 or n_two_left + n_two_right == 0:
-            return 0
-
-        alpha = self.const * (level + 1) ** 2
-        contribution_num = -betaln(alpha, alpha) + betaln(
-            alpha + n_left, alpha + n_right
-        )
-        contribution_den = (
-            -2 * betaln(alpha, alpha)
-            + betaln(alpha + n_one_left, alpha + n_one_right)
-            + betaln(alpha + n_two_left, alpha + n_two_right)
-        )
-        contribution = contribution_num - contribution_den
-        contribution_left = self.polya_tree_test(
-            sample_one, sample_two, level + 1, partition_left
-        )
-        contribution_right = self.polya_tree_test(
-            sample_one, sample_two, level + 1, partition_right
-        )
-        return contribution + contribution_left + contribution_right
+    def _detect_drift(self) -> bool:
+        """
+        Perform a Polya tree test on each feature.
+
+        :return: True if the test statistic of any feature is below the threshold, else False
+        """
+        data = self._normalize(self.data_window.view())
+        log_odd_ratios = self._get_log_odd_ratios(data[: self.n_samples], data[self.n_samples:])
+        test_statistics = 1 / (1 + np.exp(-log_odd_ratios))
+        return bool(np.any(test_statistics < self.threshold))
 
-    def _get_interval_count(self, sample_one, sample_two, partition) -> (int, int):
+    def _n_buffering_updates(self) -> int:
         """
-        Count the number of samples in the provided partition.
+        Get the number of samples that fit into the data window before it is full and tests are performed.
 
-        :param sample_one: the first sample
-        :param sample_two: the second sample
-        :param partition: the partition
-        :returns: a tuple containing the number of respective items of each sample in the interval
+        :return: the number of samples
         """
-        interval = self._get_interval(partition)
-        n_one = np.sum((sample_one > interval[0]) & (sample_one <= interval[1]))
-        n_two = np.sum((sample_two > interval[0]) & (sample_two <= interval[1]))
-        return n_one, n_two
+        return self.data_window.maxlen - 1 - len(self.data_window)
 
-    def _get_interval(self, partition) -> (float, float):
+    def _buffer(self, data: np.ndarray):
         """
-        Get the interval of the current partition.
+        Add the samples to the data window.
 
-        :param partition: the partition
-        :returns: a tuple containing start and end of the interval
+        :param data: the samples
         """
-        partition_index = int(partition, 2)
-        level = len(partition)
-        quantile_start = partition_index / 2 ** level
-        quantile_end = (partition_index + 1) / 2 ** level
-        interval = self.distribution.ppf([quantile_start, quantile_end])
-        return interval
+        self.data_window.extend(data)
 
-    def _get_samples(self, feature_index):
+    def _get_window_occupancy(self) -> int:
         """
-        Get the normalized samples of the given index.
+        Get the number of samples currently stored in the data window.
 
-        :param feature_index: the index of the feature
-        :return: a tuple containing two normalized samples
+        :return: the number of samples
         """
-        data = np.array(self.data_window)
-        data_slice = data[:, feature_index]
-        normalized_data_slice = self._normalize(data_slice)
-        sample_one = normalized_data_slice[: self.n_samples]
-        sample_two = normalized_data_slice[self.n_samples:]
-        return sample_one, sample_two
-    
+        return len(self.data_window)
+
+    def _get_log_odd_ratios(self, sample_one: np.ndarray, sample_two: np.ndarray) -> np.ndarray:
+        """
+        Perform a Polya tree two-sample test for each feature of the given samples, yielding the same result as the
+        recursive test on each feature. Partitions without any data point of either sample do not contribute to the
+        test statistic.
+
+        :param sample_one: the first sample, one row per data point and one column per feature
+        :param sample_two: the second sample, one row per data point and one column per feature
+        :return: the test statistic that the hypothesis H0, sample_one == sample_two, is rejected for each feature
+        """
+        n_features = sample_one.shape[1]
+        n_partitions = len(self.boundaries) + 1
+        offsets = np.arange(n_features) * n_partitions
+        # the intervals of the partitions are closed on the right, i.e., boundaries belong to the left partition
+        counts = np.stack(
+            [
+                np.bincount(
+                    (np.searchsorted(self.boundaries, sample) + offsets).ravel(), minlength=n_features * n_partitions
+                ).reshape(n_features, n_partitions)
+                for sample in (sample_one, sample_two)
+            ]
+        )
+        log_odd_ratios = np.zeros(n_features)
+        for level in range(self.max_depth, -1, -1):
+            left, right = counts[..., 0::2], counts[..., 1::2]
+            n_left, n_right = left.sum(axis=0), right.sum(axis=0)
+            alpha = self.const * (level + 1) ** 2
+            contribution_num = -betaln(alpha, alpha) + betaln(alpha + n_left, alpha + n_right)
+            contribution_den = (
+                -2 * betaln(alpha, alpha)
+                + betaln(alpha + left[0], alpha + right[0])
+                + betaln(alpha + left[1], alpha + right[1])
+            )
+            empty = (left[0] + right[0] == 0) | (left[1] + right[1] == 0)
+            log_odd_ratios += np.sum(np.where(empty, 0, contribution_num - contribution_den), axis=1)
+            counts = left + right
+        return log_odd_ratios
+
     @staticmethod
     def _normalize(data):
         """
-        Normalize the given data by subtracting the mean and dividing by the interquartile range. If the interquartile
-        range is 0, no division occurs.
+        Normalize the given data by subtracting the mean and dividing by the interquartile range, per feature if the
+        data contains multiple features. If the interquartile range is 0, no division occurs.
 
         :param data: the data
         :return: the normalized data
         """
         normalized = data - np.mean(data, axis=0)
         iqr = stats.iqr(data, axis=0)
-        if iqr != 0:
-            normalized = normalized / iqr
-        return normalized
+        return normalized / np.where(iqr != 0, iqr, 1)
 
     def reset(self):
         """
         Reset the drift detector by deleting the reference data and recent data.
         """
-        self.data_window = deque(maxlen=2 * self.n_samples)
+        self._count("reset")
+        self.data_window.clear()
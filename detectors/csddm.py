@@ -2,11 +2,13 @@ from collections import deque
 from typing import Optional
 
 import numpy as np
-from scipy.stats import anderson_ksamp
+from scipy.spatial import distance
 from sklearn.cluster import KMeans
 from sklearn.decomposition import PCA
 
+from .anderson_darling import CRITICAL_VALUES, AndersonDarlingTest
 from .base import UnsupervisedDriftDetector
+from .window import Window
 
 
 class ClusteredStatisticalTestDriftDetectionMethod(UnsupervisedDriftDetector):
@@ -16,6 +18,12 @@ class ClusteredStatisticalTestDriftDetectionMethod(UnsupervisedDriftDetector):
     then assigned to. Furthermore, the reference data is also used to create a PCA projection to reduce the
     dimensionality of the feature space.
 
+    Each recent sample is projected and assigned to its cluster once on arrival, and the projected recent samples are
+    kept in one window per cluster, in the same way as the projected reference data is split by cluster once after
+    setup. Samples are projected as the PCA does, but from the precomputed projection matrix and projected mean. The
+    projected reference data of each cluster is sorted once after setup, and the Anderson-Darling tests of all
+    components of a cluster are performed at once.
+
     Source: Wan, J. S.; Wang, S. (2021). Concept drift detection based on pre-clustering and statistical testing.
         Journal of Internet Technology.
     """
@@ -39,13 +47,18 @@ class ClusteredStatisticalTestDriftDetectionMethod(UnsupervisedDriftDetector):
         """
         super().__init__(seed)
         self.n_samples = n_samples
-        self.reference_data = []
+        self.reference_data = Window(maxlen=n_samples)
         self.reference_clusters = None
-        self.recent_data = deque(maxlen=n_samples)
-        self.recent_transformed_data = deque(maxlen=n_samples)
+        self.reference_data_in_clusters = []
+        self.reference_tests = []
+        self.recent_data = Window(maxlen=n_samples)
+        self.recent_clusters = deque()
+        self.recent_data_in_clusters = []
         self.n_clusters = n_clusters
         self.n_components = None
         self.kmeans = None
+        self.projection = None
+        self.projected_mean = None
         self.feature_proportion = feature_proportion
         self.pca = None
         self.confidence = confidence
@@ -58,60 +71,98 @@ class ClusteredStatisticalTestDriftDetectionMethod(UnsupervisedDriftDetector):
         :param features: the features
         :return: True if a concept drift occurred, else False
         """
-        features = np.fromiter(features.values(), dtype=float)
+        return self.update_array(np.fromiter(features.values(), dtype=float))
+
+    def update_array(self, features: np.ndarray) -> bool:
+        """
+        Update the drift detector with the given features as array and determine if a concept drift occurred.
+
+        :param features: the features
+        :return: True if a concept drift occurred, else False
+        """
         if self.kmeans is None:
             self.reference_data.append(features)
             if len(self.reference_data) == self.n_samples:
                 self.setup()
         else:
-            self.recent_data.append(features)
-            padded_features = features.reshape((1, *features.shape))
-            self.recent_transformed_data.append(
-                self.pca.transform(padded_features).flatten()
-            )
+            self._add_recent_data(features.reshape((1, *features.shape)))
             if len(self.recent_data) == self.n_samples:
-                if self._detect_drift():
+                with self._measure("test"):
+                    drift = self._detect_drift()
+                if drift:
                     self.reset()
                     return True
         return False
 
+    def _n_buffering_updates(self) -> int:
+        """
+        Get the number of samples that are added to the initial reference data before the PCA and KMeans are set up, or
+        to the recent data before it is full and tested.
+
+        :return: the number of samples
+        """
+        if self.kmeans is None:
+            return self.n_samples - 1 - len(self.reference_data)
+        return max(0, self.n_samples - 1 - len(self.recent_data))
+
+    def _buffer(self, data: np.ndarray):
+        """
+        Add the samples to the initial reference data or the recent data.
+
+        :param data: the samples
+        """
+        if self.kmeans is None:
+            self.reference_data.extend(data)
+        else:
+            self._add_recent_data(data)
+
+    def _add_recent_data(self, data: np.ndarray):
+        """
+        Add the samples to the recent data, project them and add them to the recent data of their clusters. The oldest
+        samples leave the recent data of their clusters if the recent data is full.
+
+        :param data: at most n_samples samples
+        """
+        transformed_data = data @ self.projection - self.projected_mean
+        clusters = np.argmin(distance.cdist(transformed_data, self.kmeans.cluster_centers_, "sqeuclidean"), axis=1)
+        for _ in range(max(0, len(self.recent_data) + len(data) - self.n_samples)):
+            self.recent_data_in_clusters[self.recent_clusters.popleft()].remove_oldest()
+        self.recent_data.extend(data)
+        self.recent_clusters.extend(clusters.tolist())
+        for i, window in enumerate(self.recent_data_in_clusters):
+            window.extend(transformed_data[clusters == i])
+
+    def _get_window_occupancy(self) -> int:
+        """
+        Get the number of samples currently stored in the reference data and the recent data.
+
+        :return: the number of samples
+        """
+        return len(self.reference_data) + len(self.recent_data)
+
     def _detect_drift(self) -> bool:
         """
         Detect if a concept drift detected.
 
         :return: True if a concept drift occurred, else False
         """
-        recent_clusters = self.kmeans.predict(self.recent_transformed_data)
         for i in range(self.n_clusters):
-            reference_data_in_cluster = self.reference_data[
-                self.reference_clusters == i
-            ]
-            recent_data_in_cluster = np.array(self.recent_transformed_data)[
-                recent_clusters == i
-            ]
-            for feature in range(self.n_components):
-                if (
-                    len(reference_data_in_cluster) > 0
-                    and len(recent_data_in_cluster) > 0
-                    and (
-                        len(reference_data_in_cluster) > 1
-                        or len(recent_data_in_cluster) > 1
-                    )
-                ):
-                    statistic, critical_values, _ = anderson_ksamp(
-                        [
-                            reference_data_in_cluster[:, feature],
-                            recent_data_in_cluster[:, feature],
-                        ]
-                    )
-                    if statistic >= critical_values[self._confidence_index]:
-                        return True
+            n_reference = len(self.reference_data_in_clusters[i])
+            recent_data_in_cluster = self.recent_data_in_clusters[i].view()
+            if (
+                n_reference > 0
+                and len(recent_data_in_cluster) > 0
+                and (n_reference > 1 or len(recent_data_in_cluster) > 1)
+            ):
+                statistics = self.reference_tests[i].get_statistics(recent_data_in_cluster)
+                if np.any(statistics >= CRITICAL_VALUES[self._confidence_index]):
+                    return True
         return False
 
     def _get_confidence_index(self):
         """
-        Match the confidence level given in init to the corresponding index of the confidences returned by the
-        anderson_ksamp function.
+        Match the confidence level given in init to the corresponding index of the critical values of the
+        Anderson-Darling test.
 
         :raise: ValueError if the requested confidence level is not supported
         :return: the index
@@ -128,18 +179,28 @@ class ClusteredStatisticalTestDriftDetectionMethod(UnsupervisedDriftDetector):
         Reset the drift detector by deleting the reference data and creating new a PCA projection and KMeans clustering
         with the recent data.
         """
+        self._count("reset")
         self.reference_data = self.recent_data
-        self.recent_data = deque(maxlen=self.n_samples)
+        self.recent_data = Window(maxlen=self.n_samples)
         self.setup()
 
     def setup(self):
         """
         Create a PCA projection and KMeans clustering based on the reference data.
         """
-        self.n_components = int(
-            np.ceil(self.feature_proportion * len(self.reference_data[0]))
-        )
-        self.pca = PCA(n_components=self.n_components, random_state=self.seed)
-        self.reference_data = self.pca.fit_transform(self.reference_data)
-        self.kmeans = KMeans(n_clusters=self.n_clusters, random_state=self.seed)
-        self.reference_clusters = self.kmeans.fit_predict(self.reference_data)
+        with self._measure("refit"):
+            self.n_components = int(
+                np.ceil(self.feature_proportion * len(self.reference_data[0]))
+            )
+            self.pca = PCA(n_components=self.n_components, random_state=self.seed)
+            self.reference_data = self.pca.fit_transform(self.reference_data.view())
+            self.kmeans = KMeans(n_clusters=self.n_clusters, random_state=self.seed)
+            self.reference_clusters = self.kmeans.fit_predict(self.reference_data)
+            self.projection = self.pca.components_.T
+            self.projected_mean = self.pca.mean_ @ self.projection
+            self.reference_data_in_clusters = [
+                self.reference_data[self.reference_clusters == i] for i in range(self.n_clusters)
+            ]
+            self.reference_tests = [AndersonDarlingTest(data) for data in self.reference_data_in_clusters]
+            self.recent_clusters = deque()
+            self.recent_data_in_clusters = [Window(maxlen=self.n_samples) for _ in range(self.n_clusters)]
@@ -1,11 +1,13 @@
 from typing import Optional
 
 import numpy as np
+from scipy.special import expit
+from scipy.stats import rankdata
 from sklearn.linear_model import LogisticRegression
-from sklearn.metrics import roc_auc_score
 from sklearn.model_selection import StratifiedKFold
 
 from .base import UnsupervisedDriftDetector
+from .window import Window
 
 
 class DiscriminativeDriftDetector2019(UnsupervisedDriftDetector):
@@ -17,6 +19,11 @@ class DiscriminativeDriftDetector2019(UnsupervisedDriftDetector):
     TODO difference to 2021
     TODO why wait before trying detection again?
 
+    The folds of the cross validation only depend on the labels and the seed, so they are computed once. The AUC is
+    computed from the ranks of the predictions as normalized Mann-Whitney U statistic. Optionally, the discriminators
+    of both folds are refit by Newton's method starting from their coefficients of the previous check, which converges
+    in few iterations since consecutive checks share most of their data.
+
     Source: Gözüaçık, Ö.; Büyükçakır, A.; Bonab, H.; Can, F. (2019). Unsupervised concept drift detection with a
         discriminative classifier. Proceedings of the 28th ACM International Conference on Information and Knowledge
         Management. ACM.
@@ -27,6 +34,7 @@ class DiscriminativeDriftDetector2019(UnsupervisedDriftDetector):
         n_reference_samples: int = 100,
         recent_samples_proportion: float = 0.1,
         threshold: float = 0.7,
+        warm_start: bool = False,
         seed: Optional[int] = None,
     ):
         """
@@ -36,14 +44,21 @@ class DiscriminativeDriftDetector2019(UnsupervisedDriftDetector):
         :param recent_samples_proportion: the proportion of data used to represent the new concept relative to the
             number of data used to represent current concept
         :param threshold: the threshold above which two concepts can be reliably discerned and a drift is signalled
+        :param warm_start: True if the discriminators shall be refit starting from their coefficients of the previous
+            check instead of being trained by liblinear from scratch, default False. The discriminators minimize the
+            same objective either way, but may differ within the solvers' tolerances.
         """
         super().__init__(seed)
-        self.data = []
         self.n_reference_samples = n_reference_samples
         self.recent_samples_proportion = recent_samples_proportion
         self.n_samples = int(n_reference_samples * (1 + recent_samples_proportion))
+        self.data = Window(maxlen=self.n_samples)
         self.threshold = threshold
         self.kfold = StratifiedKFold(n_splits=2, shuffle=True, random_state=self.seed)
+        self.labels = self._get_labels()
+        self.splits = list(self.kfold.split(np.zeros((self.n_samples, 1)), self.labels))
+        self.warm_start = warm_start
+        self.coefficients = [None] * len(self.splits)
 
     def update(self, features: dict) -> bool:
         """
@@ -52,28 +67,66 @@ class DiscriminativeDriftDetector2019(UnsupervisedDriftDetector):
         :param features: the features
         :returns: True if a drift occurred else False
         """
-        features = np.fromiter(features.values(), dtype=float)
+        return self.update_array(np.fromiter(features.values(), dtype=float))
+
+    def update_array(self, features: np.ndarray) -> bool:
+        """
+        Update the detector with the most recent observation given as array and detect if a drift occurred.
+
+        :param features: the features
+        :returns: True if a drift occurred else False
+        """
         if len(self.data) != self.n_samples:
             self.data.append(features)
         else:
-            if self._detect_drift():
-                self.data = self.data[self.n_reference_samples :]
+            with self._measure("test"):
+                drift = self._detect_drift()
+            if drift:
+                self._count("reset")
+                self.data.remove_oldest(self.n_reference_samples)
+                self.coefficients = [None] * len(self.splits)
                 return True
             else:
                 step = int(np.ceil(self.n_reference_samples * self.recent_samples_proportion))
-                self.data = self.data[step:]
+                self.data.remove_oldest(step)
         return False
 
+    def _n_buffering_updates(self) -> int:
+        """
+        Get the number of samples that are added to the data before the discriminator is trained.
+
+        :return: the number of samples
+        """
+        return self.n_samples - len(self.data)
+
+    def _buffer(self, data: np.ndarray):
+        """
+        Add the samples to the data.
+
+        :param data: the samples
+        """
+        self.data.extend(data)
+
+    def _get_window_occupancy(self) -> int:
+        """
+        Get the number of samples currently stored in the data window.
+
+        :return: the number of samples
+        """
+        return len(self.data)
+
     def _detect_drift(self) -> bool:
         """
         Detect if a drift occurred.
 
         :return: True if a drift occurred, else False
         """
-        labels = self._get_labels()
-        discriminator = LogisticRegression(solver="liblinear", random_state=self.seed)
-        predictions = self._predict(discriminator, np.array(self.data), labels)
-        auc_score = roc_auc_score(labels, predictions)
+        if self.warm_start:
+            predictions = self._predict_warm_started(self.data.view())
+        else:
+            discriminator = LogisticRegression(solver="liblinear", random_state=self.seed)
+            predictions = self._predict(discriminator, self.data.view(), self.labels)
+        auc_score = get_auc_score(self.labels, predictions)
         return auc_score >= self.threshold
 
     def _get_labels(self) -> np.array:
@@ -97,9 +150,100 @@ class DiscriminativeDriftDetector2019(UnsupervisedDriftDetector):
         """
         predictions = np.zeros(self.n_samples)
         # kfold testing is not described in the paper, but used in the source code provided by the authors
-        for train_index, test_index in self.kfold.split(data, labels):
-            discriminator.fit(data[train_index], labels[train_index])
+        for train_index, test_index in self.splits:
+            with self._measure("refit"):
+                discriminator.fit(data[train_index], labels[train_index])
             predictions[test_index] = discriminator.predict_proba(data[test_index])[
                 :, 1
             ]
         return predictions
+
+    def _predict_warm_started(self, data: np.array) -> np.array:
+        """
+        Train and test the discriminators on the given data in the same kfold validation scheme as _predict, refitting
+        the discriminator of each fold starting from its coefficients of the previous check.
+
+        :param data: the data the discriminators are trained on
+        :return: the predictions as decision function values
+        """
+        predictions = np.zeros(self.n_samples)
+        data = np.hstack((data, np.ones((len(data), 1))))
+        for i, (train_index, test_index) in enumerate(self.splits):
+            with self._measure("refit"):
+                self.coefficients[i] = fit_logistic_regression(
+                    data[train_index], self.labels[train_index], self.coefficients[i]
+                )
+            predictions[test_index] = data[test_index] @ self.coefficients[i]
+        return predictions
+
+
+def fit_logistic_regression(
+    data: np.ndarray,
+    labels: np.ndarray,
+    coefficients: Optional[np.ndarray] = None,
+    tolerance: float = 1e-8,
+    max_iter: int = 100,
+) -> np.ndarray:
+    """
+    Fit an L2-regularized logistic regression with regularization strength 1 by Newton's method with backtracking line
+    search. As in liblinear, the intercept is the coefficient of a constant feature and regularized as well.
+
+    :param data: the data including a constant feature, one sample per row
+    :param labels: the labels, either 0 or 1
+    :param coefficients: the initial coefficients, zeros if None
+    :param tolerance: the maximum absolute change of the coefficients at convergence
+    :param max_iter: the maximum number of iterations
+    :return: the coefficients
+    """
+    if coefficients is None:
+        coefficients = np.zeros(data.shape[1])
+    identity = np.eye(data.shape[1])
+    decision = data @ coefficients
+    loss = _get_logistic_loss(coefficients, decision, labels)
+    for _ in range(max_iter):
+        probabilities = expit(decision)
+        gradient = coefficients + data.T @ (probabilities - labels)
+        hessian = identity + (data.T * (probabilities * (1 - probabilities))) @ data
+        step = np.linalg.solve(hessian, gradient)
+        step_size = 1.0
+        while True:
+            new_coefficients = coefficients - step_size * step
+            decision = data @ new_coefficients
+            new_loss = _get_logistic_loss(new_coefficients, decision, labels)
+            if new_loss <= loss - 1e-4 * step_size * (gradient @ step) or step_size < 1e-10:
+                break
+            step_size /= 2
+        coefficients, loss = new_coefficients, new_loss
+        if np.max(np.abs(step_size * step)) < tolerance:
+            break
+    return coefficients
+
+
+def _get_logistic_loss(coefficients: np.ndarray, decision: np.ndarray, labels: np.ndarray) -> float:
+    """
+    Get the objective of the L2-regularized logistic regression fit by fit_logistic_regression.
+
+    :param coefficients: the coefficients
+    :param decision: the decision function values of the samples given the coefficients
+    :param labels: the labels, either 0 or 1
+    :return: the objective
+    """
+    return coefficients @ coefficients / 2 + np.sum(np.logaddexp(0, decision) - labels * decision)
+
+
+def get_auc_score(labels: np.ndarray, predictions: np.ndarray) -> float:
+    """
+    Get the area under the ROC curve from the ranks of the predictions, i.e., the Mann-Whitney U statistic of the
+    predictions of positive samples normalized by the number of pairs of positive and negative samples. Ties count as
+    half, as in roc_auc_score.
+
+    :param labels: the labels, either 0 or 1
+    :param predictions: the predictions
+    :return: the area under the ROC curve
+    """
+    positive = labels == 1
+    n_positive = np.count_nonzero(positive)
+    n_negative = len(labels) - n_positive
+    ranks = rankdata(predictions)
+    u_statistic = np.sum(ranks[positive]) - n_positive * (n_positive + 1) / 2
+    return u_statistic / (n_positive * n_negative)
@@ -1,5 +1,5 @@
 from enum import Enum, auto
-from typing import Dict, List, Optional
+from typing import List, Optional, Sequence
 
 import numpy as np
 
@@ -19,6 +19,10 @@ class EDFS(UnsupervisedDriftDetector):
     drift in a feature subspace is detected via majority vote. Concept drift is detected on a global scale if a single
     subspace drifts.
 
+    Features drawn into several subspaces are monitored by a single univariate detector, since the univariate detectors
+    of a feature would be identical. The majority votes of all subspaces are evaluated at once from a boolean matrix of
+    subspace memberships.
+
     Currently, only random feature subspace selection is supported.
 
     Source: Korycki, L.; Krawczyk, B. (2019). Unsupervised drift detector ensembles for data stream mining. IEEE
@@ -49,7 +53,10 @@ class EDFS(UnsupervisedDriftDetector):
         self.feature_percentage = feature_percentage
         self.n_features = 0
         self.n_features_per_space = 0
-        self.subspaces: List[Dict[str, KolmogorovSmirnovDriftDetector]] = []
+        self.subspaces: List[np.ndarray] = []
+        self.features = np.empty(0, dtype=int)
+        self.detectors: List[KolmogorovSmirnovDriftDetector] = []
+        self.memberships = np.empty((0, 0), dtype=bool)
         self.alpha = alpha
         self.window_size = window_size
         self.rng = np.random.default_rng(self.seed)
@@ -58,35 +65,82 @@ class EDFS(UnsupervisedDriftDetector):
         """
         Update the detector with the given features.
 
+        :param features: the features
+        :return: True if a drift occurred, else False
+        """
+        return self._update(list(features.values()))
+
+    def update_array(self, features: np.ndarray) -> bool:
+        """
+        Update the detector with the given features as array.
+
+        :param features: the features
+        :return: True if a drift occurred, else False
+        """
+        return self._update(features)
+
+    def _update(self, features: Sequence) -> bool:
+        """
+        Update the detector with the given feature values, which are indexed by their position.
+
         :param features: the features
         :return: True if a drift occurred, else False
         """
         if len(self.subspaces) == 0:
             self.reset(features)
-        drift = self._detect_drift(features)
+        with self._measure("test"):
+            drift = self._detect_drift(features)
         if drift:
+            self._count("reset")
             self.reset(features)
         return drift
 
-    def _detect_drift(self, features: dict) -> bool:
+    def _n_buffering_updates(self) -> int:
+        """
+        Get the number of samples the univariate detectors buffer before any of them performs a test.
+
+        :return: the number of samples
+        """
+        return min((detector._n_buffering_updates() for detector in self.detectors), default=0)
+
+    def _buffer(self, data: np.ndarray):
+        """
+        Add each feature of the samples to the univariate detectors monitoring the feature.
+
+        :param data: the samples
+        """
+        for feature, detector in zip(self.features, self.detectors):
+            detector._buffer(data[:, feature].tolist())
+
+    def _get_window_occupancy(self) -> int:
+        """
+        Get the number of samples currently stored by the univariate detectors, which all store the same samples.
+
+        :return: the number of samples
+        """
+        for detector in self.detectors:
+            return len(detector.reference_data) + len(detector.recent_data)
+        return 0
+
+    def _detect_drift(self, features: Sequence) -> bool:
         """
         Detect if a concept drift occurred.
 
         :return: True if a drift occurred, else False
         """
-        for subspace in self.subspaces:
-            drifts = []
-            for feature, detector in subspace.items():
-                drift = detector.update(features[feature])
-                drifts.append(drift)
-            if sum(drifts) > len(features) * self.feature_percentage / 2:
-                # majority vote
-                return True
-        return False
+        drifts = np.fromiter(
+            (detector.update(features[feature]) for feature, detector in zip(self.features, self.detectors)),
+            dtype=bool,
+            count=len(self.detectors),
+        )
+        # majority vote
+        votes = self.memberships @ drifts.astype(int)
+        return bool(np.any(votes > len(features) * self.feature_percentage / 2))
 
     def reset(self, sample):
         """
-        Resets the feature subspaces using the method specified at initialization.
+        Resets the feature subspaces using the method specified at initialization. Features are identified by their
+        position in the sample.
         """
         self.n_features = len(sample)
         self.n_features_per_space = int(np.ceil(self.n_features * self.feature_percentage))
@@ -102,12 +156,14 @@ class EDFS(UnsupervisedDriftDetector):
         Resets by choosing feature subspaces randomly.
         """
         self.subspaces = [
-            {
-                feature: KolmogorovSmirnovDriftDetector(self.window_size, self.alpha)
-                for feature in self.rng.choice(list(sample.keys()), size=self.n_features_per_space, replace=False)
-            }
+            self.rng.choice(self.n_features, size=self.n_features_per_space, replace=False)
             for _ in range(self.n_subspaces)
         ]
+        self.features = np.unique(np.concatenate(self.subspaces)) if self.subspaces else np.empty(0, dtype=int)
+        self.detectors = [KolmogorovSmirnovDriftDetector(self.window_size, self.alpha) for _ in self.features]
+        self.memberships = np.zeros((self.n_subspaces, len(self.features)), dtype=bool)
+        for i, subspace in enumerate(self.subspaces):
+            self.memberships[i, np.searchsorted(self.features, subspace)] = True
 
     def __subspace_selection_reset(self):
         raise NotImplementedError(
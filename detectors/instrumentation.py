@@ -0,0 +1,68 @@
+import time
+from collections import Counter
+from contextlib import contextmanager
+from typing import Optional
+
+
+class Instrumentation:
+    """
+    Instrumentation records where a detector spends its time. It measures the wall time and the number of calls of
+    three phases: buffering blocks of samples, testing for concept drift and refitting the detector's models or
+    thresholds. Phases may be nested, e.g., tests include the time of refits performed as part of the test.
+    Additionally, it counts resets of the detector.
+    """
+
+    phases = ["buffer", "test", "refit"]
+    keys = [
+        "time (buffer)",
+        "time (test)",
+        "time (refit)",
+        "n buffer",
+        "n test",
+        "n refit",
+        "n reset",
+        "window occupancy",
+    ]
+
+    def __init__(self):
+        """
+        Init a new Instrumentation without any records.
+        """
+        self.times = dict.fromkeys(self.phases, 0.0)
+        self.counts = Counter()
+
+    @contextmanager
+    def measure(self, phase: str):
+        """
+        Measure the wall time of the code executed in the context and count it as a call of the given phase.
+
+        :param phase: the phase, one of phases
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.times[phase] += time.perf_counter() - start
+            self.counts[phase] += 1
+
+    def count(self, event: str):
+        """
+        Count an event, e.g., a reset.
+
+        :param event: the event
+        """
+        self.counts[event] += 1
+
+    def snapshot(self, window_occupancy: Optional[int] = None) -> dict:
+        """
+        Get all records.
+
+        :param window_occupancy: the number of samples currently stored by the detector or None if unknown
+        :return: a dict containing a value for each of keys
+        """
+        return {
+            **{f"time ({phase})": self.times[phase] for phase in self.phases},
+            **{f"n {phase}": self.counts[phase] for phase in self.phases},
+            "n reset": self.counts["reset"],
+            "window occupancy": window_occupancy,
+        }
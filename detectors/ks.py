@@ -1,5 +1,9 @@
+from bisect import bisect_left, insort
 from collections import deque
+from functools import lru_cache
+from typing import Sequence
 
+import numpy as np
 from scipy.stats import ks_2samp
 
 from .base import UnsupervisedDriftDetector
@@ -8,6 +12,12 @@ from .base import UnsupervisedDriftDetector
 class KolmogorovSmirnovDriftDetector(UnsupervisedDriftDetector):
     """
     A simple unsupervised univariate drift detector based on the Kolmogorov-Smirnov two sample test.
+
+    Both data windows are additionally kept sorted, so that the test statistic is computed from the sorted windows
+    without sorting them on every update. If both windows have the same size n, the statistic is a multiple of 1 / n
+    and its p-value is decreasing in the statistic, so the test reduces to comparing the statistic with the smallest
+    multiple of 1 / n whose p-value is below the threshold. Otherwise, i.e., while the recent data window refills after
+    a reset, the test is performed by ks_2samp.
     """
 
     def __init__(
@@ -24,6 +34,8 @@ class KolmogorovSmirnovDriftDetector(UnsupervisedDriftDetector):
         self.window_size = window_size
         self.recent_data = deque(maxlen=window_size)
         self.reference_data = deque(maxlen=window_size)
+        self.sorted_recent_data = []
+        self.sorted_reference_data = []
         self.threshold = threshold
         self.reset_after_drift = reset_after_drift
 
@@ -34,19 +46,104 @@ class KolmogorovSmirnovDriftDetector(UnsupervisedDriftDetector):
         :param feature: the feature
         """
         if len(self.recent_data) == self.window_size:
-            self.reference_data.append(self.recent_data[0])
+            leaving = self.recent_data[0]
+            if len(self.reference_data) == self.window_size:
+                _remove(self.sorted_reference_data, self.reference_data[0])
+            self.reference_data.append(leaving)
+            insort(self.sorted_reference_data, leaving)
+            _remove(self.sorted_recent_data, leaving)
         self.recent_data.append(feature)
+        insort(self.sorted_recent_data, feature)
         if len(self.reference_data) == self.window_size:
-            statistic, p_value = ks_2samp(self.reference_data, self.recent_data)
-            if p_value < self.threshold and statistic > 0.1:
+            if len(self.recent_data) == self.window_size:
+                distance = self._get_distance()
+                drift = (
+                    distance >= get_critical_distance(self.window_size, self.threshold)
+                    and distance / self.window_size > 0.1
+                )
+            else:
+                statistic, p_value = ks_2samp(self.sorted_reference_data, self.sorted_recent_data)
+                drift = p_value < self.threshold and statistic > 0.1
+            if drift:
                 if self.reset_after_drift:
                     self.reset()
                 return True
         return False
 
+    def _get_distance(self) -> int:
+        """
+        Get the Kolmogorov-Smirnov statistic of the data windows of equal size multiplied by the window size, i.e., the
+        maximum absolute difference of the number of values in either window that are smaller than or equal to any
+        value.
+
+        :return: the statistic multiplied by the window size
+        """
+        sorted_reference_data = np.asarray(self.sorted_reference_data)
+        sorted_recent_data = np.asarray(self.sorted_recent_data)
+        values = np.concatenate((sorted_reference_data, sorted_recent_data))
+        differences = np.searchsorted(sorted_reference_data, values, side="right") - np.searchsorted(
+            sorted_recent_data, values, side="right"
+        )
+        return int(np.max(np.abs(differences)))
+
+    def _n_buffering_updates(self) -> int:
+        """
+        Get the number of values that are added to the data windows before the reference data window is full and tests
+        are performed.
+
+        :return: the number of values
+        """
+        if len(self.reference_data) == self.window_size:
+            return 0
+        return 2 * self.window_size - len(self.recent_data) - len(self.reference_data) - 1
+
+    def _buffer(self, features: Sequence[float]):
+        """
+        Add the values to the data windows exactly as consecutive updates would, i.e., values leaving the recent data
+        window enter the reference data window.
+
+        :param features: the values
+        """
+        n_leaving = max(0, len(self.recent_data) + len(features) - self.window_size)
+        leaving = (list(self.recent_data) + list(features))[:n_leaving]
+        self.reference_data.extend(leaving)
+        self.recent_data.extend(features)
+        self.sorted_reference_data = sorted(self.reference_data)
+        self.sorted_recent_data = sorted(self.recent_data)
+
     def reset(self):
         """
         Reset the reference data window and recent data window.
         """
         self.reference_data = self.recent_data
+        self.sorted_reference_data = self.sorted_recent_data
         self.recent_data = deque(maxlen=self.window_size)
+        self.sorted_recent_data = []
+
+
+@lru_cache(maxsize=None)
+def get_critical_distance(window_size: int, threshold: float) -> int:
+    """
+    Get the smallest Kolmogorov-Smirnov statistic of two samples of the given size, multiplied by the size, whose
+    p-value is below the threshold. The p-values are computed by ks_2samp from two samples of consecutive integers,
+    shifted against each other by the respective statistic.
+
+    :param window_size: the size of both samples
+    :param threshold: the threshold
+    :return: the statistic multiplied by the window size, greater than the window size if no statistic is significant
+    """
+    sample = np.arange(window_size)
+    for distance in range(window_size + 1):
+        if ks_2samp(sample, sample + distance).pvalue < threshold:
+            return distance
+    return window_size + 1
+
+
+def _remove(sorted_values: list, value: float):
+    """
+    Remove one occurrence of a value from sorted values in place.
+
+    :param sorted_values: the sorted values containing the value
+    :param value: the value
+    """
+    del sorted_values[bisect_left(sorted_values, value)]
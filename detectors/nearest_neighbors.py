@@ -0,0 +1,57 @@
+import numpy as np
+from scipy.spatial import distance
+from sklearn.neighbors import NearestNeighbors
+
+
+class NearestNeighborGraph:
+    """
+    A k-nearest neighbor graph over a fixed number of data points, each point including itself as its nearest neighbor.
+    Points can be replaced one at a time, in which case only the neighborhoods affected by the removed and the inserted
+    point are repaired instead of querying the neighbors of all points again: Points that had the removed point as
+    neighbor are queried again, whereas all other points only check whether the inserted point is closer than their
+    farthest neighbor.
+    """
+
+    def __init__(self, data: np.ndarray, n_neighbors: int):
+        """
+        Init a new NearestNeighborGraph and determine the nearest neighbors of all data points.
+
+        :param data: the data points, one per row
+        :param n_neighbors: the number of neighbors of each data point, including the data point itself
+        """
+        self.data = np.array(data, dtype=float)
+        self.n_neighbors = n_neighbors
+        nearest_neighbors = NearestNeighbors(n_neighbors=n_neighbors, algorithm="kd_tree").fit(self.data)
+        self.distances, self.neighbors = nearest_neighbors.kneighbors(self.data)
+
+    def replace(self, index: int, point: np.ndarray):
+        """
+        Replace the data point at the given index and repair the affected neighborhoods.
+
+        :param index: the index of the replaced data point
+        :param point: the new data point
+        """
+        affected = np.flatnonzero(np.any(self.neighbors == index, axis=1))
+        self.data[index] = point
+        distances = distance.cdist(self.data[index][np.newaxis], self.data)[0]
+        rows = np.arange(len(self.data))
+        farthest = np.argmax(self.distances, axis=1)
+        closer = distances < self.distances[rows, farthest]
+        closer[affected] = False
+        closer[index] = False
+        rows = rows[closer]
+        self.neighbors[rows, farthest[rows]] = index
+        self.distances[rows, farthest[rows]] = distances[rows]
+        repaired = np.union1d(affected, [index])
+        self.distances[repaired], self.neighbors[repaired] = self._query(repaired)
+
+    def _query(self, indices: np.ndarray) -> (np.ndarray, np.ndarray):
+        """
+        Determine the nearest neighbors of the data points at the given indices by comparing them with all data points.
+
+        :param indices: the indices of the data points
+        :return: the distances to the neighbors and the neighbors' indices, one row per data point
+        """
+        distances = distance.cdist(self.data[indices], self.data)
+        neighbors = np.argpartition(distances, self.n_neighbors - 1, axis=1)[:, :self.n_neighbors]
+        return np.take_along_axis(distances, neighbors, axis=1), neighbors
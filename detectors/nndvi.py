@@ -1,11 +1,13 @@
-from collections import deque
-from typing import Iterable, Optional, Tuple
+from typing import Iterable, Optional, Tuple, Union
 
 import numpy as np
+from scipy import sparse
 from scipy.stats import norm
 from sklearn.neighbors import NearestNeighbors
 
 from .base import UnsupervisedDriftDetector
+from .nearest_neighbors import NearestNeighborGraph
+from .window import Window
 
 
 class NNDVI(UnsupervisedDriftDetector):
@@ -15,7 +17,13 @@ class NNDVI(UnsupervisedDriftDetector):
     of each data point in the respective sample and constructing an adjacent matrix. Afterwards, the dissimilarity
     between the particle matrices of the two samples is determined and a custom statistical test is conducted to
     determine if a concept drift occurred. The statistical test revolves around permuting the samples repeatedly to
-    establish a baseline the current dissimilarity needs to exceed.
+    establish a baseline the current dissimilarity needs to exceed. The particle matrix is stored as sparse matrix and
+    the dissimilarities of all permutations are computed at once.
+
+    By default, the nearest neighbors of all data points are determined from scratch for every test. In incremental
+    mode, the k-nearest neighbor graph is maintained as the sliding window shifts and only the neighborhoods affected by
+    the sample leaving and the sample entering the sliding window are repaired. Both modes yield the same particles,
+    except for ties between equidistant neighbors, which occur, e.g., while the windows share samples after a drift.
 
     TODO instance weights are unused right now
     TODO number of neighbors in kNN
@@ -31,6 +39,7 @@ class NNDVI(UnsupervisedDriftDetector):
         k_neighbors: int = 30,
         n_permutations: int = 500,
         significance_level: float = 0.01,
+        incremental: bool = False,
         seed: Optional[int] = None,
     ):
         """
@@ -40,15 +49,19 @@ class NNDVI(UnsupervisedDriftDetector):
         :param k_neighbors: the number of neighbors used to construct particles
         :param n_permutations: the number of permutations used in the statistical test
         :param significance_level: the significance_level that determines the drift threshold
+        :param incremental: True if the k-nearest neighbor graph shall be maintained incrementally, else False
         """
         super().__init__(seed)
         self.n_samples = n_samples
-        self.reference_window = deque(maxlen=self.n_samples)
-        self.sliding_window = deque(maxlen=self.n_samples)
+        self.reference_window = Window(maxlen=self.n_samples)
+        self.sliding_window = Window(maxlen=self.n_samples)
         self.k_neighbors = k_neighbors
         self.n_permutations = n_permutations
         self.significance_level = significance_level
         self.rng = np.random.default_rng(self.seed)
+        self.incremental = incremental
+        self.graph = None
+        self.sliding_offset = 0
 
     def update(self, features) -> bool:
         """
@@ -57,36 +70,68 @@ class NNDVI(UnsupervisedDriftDetector):
         :param features: the data
         :returns: True if a concept drift occurred, else False
         """
-        features = np.fromiter(features.values(), dtype=float)
+        return self.update_array(np.fromiter(features.values(), dtype=float))
+
+    def update_array(self, features: np.ndarray) -> bool:
+        """
+        Update the drift detector with a new data given as array and determine if a concept drift occured.
+
+        :param features: the data
+        :returns: True if a concept drift occurred, else False
+        """
         self.sliding_window.append(features)
         if len(self.reference_window) < self.n_samples:
             self.reference_window.append(features)
-        elif self._detect_drift():
-            self.reference_window = self.sliding_window.copy()
-            return True
+        else:
+            with self._measure("test"):
+                drift = self._detect_drift()
+            if drift:
+                self._count("reset")
+                self.reference_window = self.sliding_window.copy()
+                self.graph = None
+                return True
         return False
 
+    def _n_buffering_updates(self) -> int:
+        """
+        Get the number of samples that are added to the windows before the reference window is full.
+
+        :return: the number of samples
+        """
+        return self.n_samples - len(self.reference_window)
+
+    def _buffer(self, data: np.ndarray):
+        """
+        Add the samples to the reference window and the sliding window.
+
+        :param data: the samples
+        """
+        self.sliding_window.extend(data)
+        self.reference_window.extend(data)
+
+    def _get_window_occupancy(self) -> int:
+        """
+        Get the number of samples currently stored in the reference window and the sliding window.
+
+        :return: the number of samples
+        """
+        return len(self.reference_window) + len(self.sliding_window)
+
     def _detect_drift(self) -> bool:
         """
         Detect whether a concept drift occurred.
 
         :returns: True if a concept drift occurred, else False
         """
-        # data = self._create_data_set()
-        data = np.concatenate((np.array(self.reference_window), np.array(self.sliding_window)))
-        particle_matrix = self._get_particle_matrix(data)
-        reference_indices, sliding_indices = self._get_indices(len(data))
-        distance = self._get_nnps_distance(
-            particle_matrix, reference_indices, sliding_indices
-        )
-        distances = []
-        for _ in range(self.n_permutations):
-            first_set, second_set = self._get_permutation(
-                reference_indices, sliding_indices
-            )
-            distances.append(
-                self._get_nnps_distance(particle_matrix, first_set, second_set)
-            )
+        if self.incremental:
+            particle_matrix = self._update_particle_matrix()
+        else:
+            # data = self._create_data_set()
+            data = np.concatenate((self.reference_window.view(), self.sliding_window.view()))
+            particle_matrix = self._get_particle_matrix(data)
+        reference_indices, sliding_indices = self._get_indices(particle_matrix.shape[0])
+        first_sets, second_sets = self._get_permutations(reference_indices, sliding_indices)
+        distance, *distances = self._get_nnps_distances(particle_matrix, first_sets, second_sets)
         threshold = norm.ppf(
             1 - self.significance_level, loc=np.mean(distances), scale=np.std(distances)
         )
@@ -114,23 +159,25 @@ class NNDVI(UnsupervisedDriftDetector):
         second_set = np.arange(self.n_samples) + data_len - self.n_samples
         return first_set, second_set
 
-    def _get_permutation(
+    def _get_permutations(
         self, first_set: np.array, second_set: np.array
-    ) -> Tuple[np.array, np.array]:
+    ) -> Tuple[np.ndarray, np.ndarray]:
         """
         Permute the given index arrays for a Monte Carlo permutation test.
 
         :param first_set: the index array of the reference window
         :param second_set: the index array of the sliding window
-        :returns: a new tuple containing two numpy arrays with shuffled indices
+        :returns: a tuple containing two numpy arrays with one row of indices per partition, the given partition first
+            followed by n_permutations permutations
         """
         indices = np.concatenate((first_set, second_set))
-        self.rng.shuffle(indices)
-        return indices[: self.n_samples], indices[self.n_samples:]
+        permutations = self.rng.permuted(np.tile(indices, (self.n_permutations, 1)), axis=1)
+        partitions = np.vstack((indices, permutations))
+        return partitions[:, :len(first_set)], partitions[:, len(first_set):]
 
-    def _get_particle_matrix(self, data) -> np.ndarray:
+    def _get_particle_matrix(self, data) -> sparse.csr_matrix:
         """
-        Compute a particle/adjacent matrix from the data set.
+        Compute a sparse particle/adjacent matrix from the data set.
 
         :param data: the data set established from the reference window and the sliding window
         :returns: the particle/adjacent matrix
@@ -140,19 +187,54 @@ class NNDVI(UnsupervisedDriftDetector):
             + 1,  # add one because the datapoint itself is included in the subsequent fit
             algorithm="kd_tree",
         )
-        neighbors.fit(data)
+        with self._measure("refit"):
+            neighbors.fit(data)
         _, indices = neighbors.kneighbors(data)
-        particle_matrix = np.zeros((len(data), len(data)), dtype=int)
-        for i, row in enumerate(indices):
-            for column in row:
-                particle_matrix[i][column] = 1
         # TODO add identity matrix?  --  probably not necessary since we already include the point itself in the knn
         # TODO weights
-        return particle_matrix
+        return self._to_particle_matrix(indices)
+
+    def _update_particle_matrix(self) -> sparse.csr_matrix:
+        """
+        Update the k-nearest neighbor graph with the sample that most recently entered the sliding window, replacing
+        the sample that left it, and compute the particle matrix from the graph. The graph is built from scratch if it
+        does not exist yet, i.e., before the first test and after a drift.
+
+        The graph stores the sliding window as ring buffer, so its rows are reordered to match the data set
+        established from the reference window and the sliding window.
+
+        :returns: the particle/adjacent matrix
+        """
+        if self.graph is None:
+            data = np.concatenate((self.reference_window.view(), self.sliding_window.view()))
+            with self._measure("refit"):
+                self.graph = NearestNeighborGraph(data, self.k_neighbors + 1)
+            self.sliding_offset = 0
+        else:
+            self.graph.replace(self.n_samples + self.sliding_offset, self.sliding_window[-1])
+            self.sliding_offset = (self.sliding_offset + 1) % self.n_samples
+        sliding_indices = self.n_samples + (self.sliding_offset + np.arange(self.n_samples)) % self.n_samples
+        indices = np.concatenate((np.arange(self.n_samples), sliding_indices))
+        positions = np.empty_like(indices)
+        positions[indices] = np.arange(len(indices))
+        return self._to_particle_matrix(positions[self.graph.neighbors[indices]])
+
+    @staticmethod
+    def _to_particle_matrix(indices: np.ndarray) -> sparse.csr_matrix:
+        """
+        Compute a sparse particle/adjacent matrix from the indices of each data point's nearest neighbors.
+
+        :param indices: the indices of the nearest neighbors, one row per data point
+        :returns: the particle/adjacent matrix
+        """
+        rows = np.repeat(np.arange(len(indices)), indices.shape[1])
+        return sparse.csr_matrix(
+            (np.ones(indices.size, dtype=int), (rows, indices.ravel())), shape=(len(indices), len(indices))
+        )
 
     @staticmethod
     def _get_nnps_distance(
-        particle_matrix: np.ndarray, first_set: Iterable, second_set: Iterable
+        particle_matrix: Union[np.ndarray, sparse.spmatrix], first_set: Iterable, second_set: Iterable
     ) -> float:
         """
         Compute and get the distance between the reference window's particles and the sliding
@@ -163,15 +245,40 @@ class NNDVI(UnsupervisedDriftDetector):
         :param second_set: the indices of the sliding window
         :returns: the distance
         """
-        # pylint: disable=R0201
-        cardinalities = np.sum(particle_matrix, axis=1)
+        return NNDVI._get_nnps_distances(particle_matrix, np.array([first_set]), np.array([second_set]))[0]
+
+    @staticmethod
+    def _get_nnps_distances(
+        particle_matrix: Union[np.ndarray, sparse.spmatrix], first_sets: np.ndarray, second_sets: np.ndarray
+    ) -> np.ndarray:
+        """
+        Compute and get the distances between the reference window's particles and the sliding window's particles of
+        multiple partitions at once. The weighted particle sets are computed only once and the particles of all
+        partitions are summed up by a single product of the particle sets with the partitions' indicator matrix.
+
+        :param particle_matrix: the particle matrix
+        :param first_sets: the indices of the reference window, one row per partition
+        :param second_sets: the indices of the sliding window, one row per partition
+        :returns: the distance of each partition
+        """
+        particle_matrix = sparse.csr_matrix(particle_matrix)
+        n_partitions, n_particles = len(first_sets), particle_matrix.shape[0]
+        cardinalities = np.asarray(particle_matrix.sum(axis=1)).ravel()
         lcm = np.lcm.reduce(cardinalities)
         weights = lcm / cardinalities
-        particle_sets = (particle_matrix.T * weights).T
-        first_particles = np.sum(particle_sets[first_set], axis=0)
-        second_particles = np.sum(particle_sets[second_set], axis=0)
-        distance = np.sum(
+        particle_sets = sparse.csr_matrix(particle_matrix.multiply(weights[:, np.newaxis]))
+        # count how often each index occurs in each set, i.e., indicators[i, j] is the multiplicity of index j in the
+        # i-th set
+        offsets = np.arange(2 * n_partitions)[:, np.newaxis] * n_particles
+        indicators = np.bincount(
+            np.concatenate((first_sets + offsets[:n_partitions], second_sets + offsets[n_partitions:]), axis=None),
+            minlength=2 * n_partitions * n_particles,
+        ).reshape(2 * n_partitions, n_particles)
+        particles = indicators @ particle_sets
+        first_particles, second_particles = particles[:n_partitions], particles[n_partitions:]
+        distances = np.sum(
             np.abs(first_particles - second_particles)
-            / (first_particles + second_particles)
-        ) / (len(particle_matrix))
-        return distance
+            / (first_particles + second_particles),
+            axis=1,
+        ) / n_particles
+        return distances
@@ -5,6 +5,7 @@ import numpy as np
 from sklearn.svm import OneClassSVM
 
 from .base import UnsupervisedDriftDetector
+from .window import Window
 
 
 class OneClassDriftDetector(UnsupervisedDriftDetector):
@@ -13,6 +14,12 @@ class OneClassDriftDetector(UnsupervisedDriftDetector):
     outliers exceeds a pre-determined threshold, a drift is signalled. Furthermore, the outlier detector is re-fitted
     on the most recent data.
 
+    The number of outliers among the recent predictions is counted as predictions enter and leave the window. Samples
+    are predicted in micro-batches where possible: samples arriving while the data window refills after a retraining
+    are buffered and predicted at once, and update_batch predicts the samples monitored by the current outlier
+    detector in batches of batch_size. For large data windows, the approximate NystroemOneClassSVM of the one_class
+    module can be used as outlier detector, which is retrained in a fraction of the time of OneClassSVM.
+
     Source: Gözüaçık, Ö.; Can, F. (2020). Concept learning using one-class classifiers for implicit drift detection in
         evolving data streams. Artificial Intelligence Review. Springer Link.
     """
@@ -23,6 +30,7 @@ class OneClassDriftDetector(UnsupervisedDriftDetector):
         threshold: float = 0.3,
         outlier_detector_class: callable = OneClassSVM,
         outlier_detector_kwargs: dict = None,
+        batch_size: int = 64,
         seed: Optional[int] = None,
     ):
         """
@@ -32,13 +40,16 @@ class OneClassDriftDetector(UnsupervisedDriftDetector):
         :param threshold: the ratio of outliers among the recent n_samples data considered normal
         :param outlier_detector_class: the init method of an outlier detector
         :param outlier_detector_kwargs: the key word arguments used to initialize the outlier detector
+        :param batch_size: the number of samples update_batch predicts at once with the current outlier detector
         """
         super().__init__(seed)
         if outlier_detector_kwargs is None:
             outlier_detector_kwargs = {}
         self.n_samples = n_samples
-        self.data = deque(maxlen=n_samples)
+        self.data = Window(maxlen=n_samples)
         self.outliers = deque(maxlen=n_samples)
+        self.n_outliers = 0
+        self.batch_size = batch_size
         self.threshold = threshold
         self.outlier_detector = None
         self.outlier_detector_class = outlier_detector_class
@@ -51,34 +62,122 @@ class OneClassDriftDetector(UnsupervisedDriftDetector):
         :param features: the features
         :return: True if a drift occurred, else False
         """
-        features = np.fromiter(features.values(), dtype=float)
+        return self.update_array(np.fromiter(features.values(), dtype=float))
+
+    def update_array(self, features: np.ndarray) -> bool:
+        """
+        Update the detector with the given features as array.
+
+        :param features: the features
+        :return: True if a drift occurred, else False
+        """
         self.data.append(features)
         if len(self.data) == self.n_samples and self.outlier_detector is None:
             self.setup()
         if self.outlier_detector is not None:
-            outlier = self.outlier_detector.predict([features])
-            self.outliers.append(outlier)
-            if len(self.data) == self.n_samples and self._detect_drift():
+            outlier = self.outlier_detector.predict(features[np.newaxis])[0] == -1
+            return self._add_outlier(outlier)
+        return False
+
+    def update_batch(self, data: np.ndarray) -> np.ndarray:
+        """
+        Update the detector with a block of samples, one sample per row. In addition to buffering samples, the samples
+        monitored by the current outlier detector are predicted in batches of batch_size. Predictions of samples after
+        a drift are discarded, since the outlier detector is retrained.
+
+        :param data: the samples
+        :return: the indices of the rows at which a drift was detected
+        """
+        data = np.array(data, dtype=float)
+        drifts = []
+        i = 0
+        while i < len(data):
+            n_buffered = min(self._n_buffering_updates(), len(data) - i)
+            if n_buffered > 0:
+                with self._measure("buffer"):
+                    self._buffer(data[i: i + n_buffered])
+                i += n_buffered
+            elif self.outlier_detector is None:
+                if self.update_array(data[i]):
+                    drifts.append(i)
+                i += 1
+            else:
+                batch = data[i: i + self.batch_size]
+                outliers = self.outlier_detector.predict(batch) == -1
+                for features, outlier in zip(batch, outliers):
+                    self.data.append(features)
+                    i += 1
+                    if self._add_outlier(outlier):
+                        drifts.append(i - 1)
+                        break
+        return np.array(drifts, dtype=int)
+
+    def _add_outlier(self, outlier: bool) -> bool:
+        """
+        Add the prediction of the most recent sample, which was already added to the data, and detect if a concept drift
+        occurred once the data window is full.
+
+        :param outlier: True if the sample is an outlier, else False
+        :return: True if a drift occurred, else False
+        """
+        if len(self.outliers) == self.n_samples:
+            self.n_outliers -= self.outliers[0]
+        self.outliers.append(outlier)
+        self.n_outliers += outlier
+        if len(self.data) == self.n_samples:
+            with self._measure("test"):
+                drift = self._detect_drift()
+            if drift:
                 self.reset()
                 return True
         return False
 
+    def _n_buffering_updates(self) -> int:
+        """
+        Get the number of samples that are added to the data before the initial outlier detector is trained, or before
+        the data window is full again after the outlier detector was trained.
+
+        :return: the number of samples
+        """
+        if self.outlier_detector is None:
+            return self.n_samples - 1 - len(self.data)
+        return max(0, self.n_samples - 1 - len(self.data))
+
+    def _buffer(self, data: np.ndarray):
+        """
+        Add the samples to the data and, if the outlier detector is trained, add their predictions.
+
+        :param data: the samples
+        """
+        self.data.extend(data)
+        if self.outlier_detector is not None:
+            self.outliers.extend((self.outlier_detector.predict(data) == -1).tolist())
+            self.n_outliers = sum(self.outliers)
+
+    def _get_window_occupancy(self) -> int:
+        """
+        Get the number of samples currently stored in the data window.
+
+        :return: the number of samples
+        """
+        return len(self.data)
+
     def _detect_drift(self):
         """
         Detect if a concept drift occurred.
 
         :return: True if a drift occurred, else False
         """
-        outlier_rate = np.mean(np.array(self.outliers) == -1)
+        outlier_rate = self.n_outliers / len(self.outliers)
         return outlier_rate >= self.threshold
 
     def reset(self):
         """
         Drop the oldest samples and retrain the outlier detector.
         """
+        self._count("reset")
         n_dropped = int(self.n_samples * (1 - self.threshold))
-        for _ in range(n_dropped):
-            self.data.pop()
+        self.data.remove_newest(n_dropped)
         self.setup()
 
     def setup(self):
@@ -94,5 +193,7 @@ class OneClassDriftDetector(UnsupervisedDriftDetector):
             self.outlier_detector = self.outlier_detector_class(
                 **self.outlier_detector_kwargs
             )
-        self.outlier_detector.fit(self.data)
-        self.data = deque(maxlen=self.n_samples)
+        with self._measure("refit"):
+            self.outlier_detector.fit(self.data.view())
+        # the outlier detector may keep a reference to the training data, so it is not overwritten
+        self.data = Window(maxlen=self.n_samples)
@@ -0,0 +1,87 @@
+from typing import Optional, Union
+
+import numpy as np
+from sklearn.kernel_approximation import Nystroem
+from sklearn.linear_model import SGDOneClassSVM
+
+
+class NystroemOneClassSVM:
+    """
+    An approximate one-class SVM with RBF kernel. The samples are mapped by a Nyström approximation of the kernel's
+    feature map and separated by a linear one-class SVM trained by stochastic gradient descent. In contrast to
+    OneClassSVM, fitting takes time linear in the number of samples, so it can replace OneClassSVM as outlier detector of
+    the OneClassDriftDetector for large data windows. Predictions follow the convention of OneClassSVM, i.e., -1 for
+    outliers and 1 for inliers.
+    """
+
+    def __init__(
+        self,
+        nu: float = 0.5,
+        kernel: str = "rbf",
+        gamma: Union[str, float] = "scale",
+        n_components: int = 100,
+        random_state: Optional[int] = None,
+        **kwargs
+    ):
+        """
+        Init a new NystroemOneClassSVM.
+
+        :param nu: the upper bound on the fraction of training errors, as in OneClassSVM
+        :param kernel: the kernel, only "rbf" is supported; accepted so that the key word arguments of OneClassSVM apply
+        :param gamma: the RBF kernel coefficient, either a number, "scale" or "auto", as in OneClassSVM
+        :param n_components: the number of training samples used to construct the feature map
+        :param random_state: the seed for the sampling of the feature map's components and the SGD
+        :param kwargs: further key word arguments of the SGDOneClassSVM
+        :raise: ValueError if the kernel is not "rbf"
+        """
+        if kernel != "rbf":
+            raise ValueError(f"NystroemOneClassSVM only supports the rbf kernel, got {kernel!r}")
+        self.nu = nu
+        self.kernel = kernel
+        self.gamma = gamma
+        self.n_components = n_components
+        self.random_state = random_state
+        self.kwargs = kwargs
+        self.feature_map = None
+        self.one_class_svm = None
+
+    def fit(self, data: np.ndarray) -> "NystroemOneClassSVM":
+        """
+        Fit the feature map and the linear one-class SVM.
+
+        :param data: the training data, one sample per row
+        :return: the fitted NystroemOneClassSVM
+        """
+        data = np.asarray(data, dtype=float)
+        self.feature_map = Nystroem(
+            gamma=self._get_gamma(data),
+            n_components=min(self.n_components, len(data)),
+            random_state=self.random_state,
+        )
+        features = self.feature_map.fit_transform(data)
+        self.one_class_svm = SGDOneClassSVM(nu=self.nu, random_state=self.random_state, **self.kwargs)
+        self.one_class_svm.fit(features)
+        return self
+
+    def predict(self, data: np.ndarray) -> np.ndarray:
+        """
+        Predict whether the samples are outliers.
+
+        :param data: the samples, one sample per row
+        :return: -1 for each outlier and 1 for each inlier
+        """
+        return self.one_class_svm.predict(self.feature_map.transform(data))
+
+    def _get_gamma(self, data: np.ndarray) -> float:
+        """
+        Get the RBF kernel coefficient for the training data, resolving "scale" and "auto" as OneClassSVM does.
+
+        :param data: the training data
+        :return: the coefficient
+        """
+        if self.gamma == "scale":
+            variance = data.var()
+            return 1.0 / (data.shape[1] * variance) if variance != 0 else 1.0
+        if self.gamma == "auto":
+            return 1.0 / data.shape[1]
+        return self.gamma
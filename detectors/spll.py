@@ -7,6 +7,7 @@ from scipy.stats import chi2
 from sklearn.cluster import KMeans
 
 from .base import UnsupervisedDriftDetector
+from .window import Window
 
 
 class SemiParametricLogLikelihood(UnsupervisedDriftDetector):
@@ -18,6 +19,18 @@ class SemiParametricLogLikelihood(UnsupervisedDriftDetector):
     per component. Incoming data are assigned to the closest component of the Gaussian mixture model as determined with
     the Mahalanobis distance.
 
+    By default, the k-means clustering is fitted from scratch on every test as in the original publication. In warm
+    start mode, the clustering is fitted once and then updated incrementally: each sample entering the reference data
+    window is assigned to its closest centroid and each sample leaving the window is removed from its cluster, and the
+    centroids are the means of the clusters. Optionally, the clustering is refitted periodically, initialized with the
+    current centroids.
+
+    Likewise, the inverse covariance matrix of the reference data window is computed from scratch on every test by
+    default. In incremental covariance mode, the window's mean and scatter matrix are updated with rank-one updates as
+    samples enter and leave the window, and the inverse is updated with the Sherman-Morrison formula. The inverse is
+    recomputed exactly in regular intervals and whenever an update is numerically unstable. If the covariance matrix
+    is singular, its pseudo-inverse is recomputed on every test instead.
+
     Source: Kuncheva, L. (2013). Change detection in streaming multivariate data using likelihood detectors. IEEE
         Transactions on Knowledge and Data Engineering.
     """
@@ -27,6 +40,10 @@ class SemiParametricLogLikelihood(UnsupervisedDriftDetector):
         n_samples: int,
         n_clusters: int,
         threshold: float,
+        warm_start: bool = False,
+        refit_interval: Optional[int] = None,
+        incremental_covariance: bool = False,
+        refactorization_interval: int = 100,
         seed: Optional[int] = None,
     ):
         """
@@ -35,14 +52,34 @@ class SemiParametricLogLikelihood(UnsupervisedDriftDetector):
         :param n_samples: the size of the reference and recent data windows
         :param n_clusters: the number of clusters created by the kmeans algorithm
         :param threshold: the threshold for a drift detection
+        :param warm_start: True if the clustering shall be updated incrementally between tests, else False
+        :param refit_interval: the number of tests after which the clustering is refitted in warm start mode or None
+            if it shall only be refitted after drifts
+        :param incremental_covariance: True if the inverse covariance matrix shall be updated incrementally between
+            tests, else False
+        :param refactorization_interval: the number of incremental updates after which the inverse covariance matrix
+            is recomputed exactly
         """
         super().__init__(seed)
         self.n_samples = n_samples
-        self.recent_data = deque(maxlen=n_samples)
-        self.reference_data = deque(maxlen=n_samples)
+        self.recent_data = Window(maxlen=n_samples)
+        self.reference_data = Window(maxlen=n_samples)
         self.n_clusters = n_clusters
         self.kmeans = KMeans(n_clusters=self.n_clusters, random_state=self.seed)
         self.threshold = threshold
+        self.warm_start = warm_start
+        self.refit_interval = refit_interval
+        self.cluster_centers = None
+        self.cluster_sums = None
+        self.cluster_counts = None
+        self.reference_labels = deque(maxlen=n_samples)
+        self.n_tests_since_fit = 0
+        self.incremental_covariance = incremental_covariance
+        self.refactorization_interval = refactorization_interval
+        self.reference_mean = None
+        self.reference_scatter = None
+        self.inverse_reference_scatter = None
+        self.n_updates_since_factorization = 0
 
     def update(self, features: dict) -> bool:
         """
@@ -51,28 +88,80 @@ class SemiParametricLogLikelihood(UnsupervisedDriftDetector):
         :param features: the features
         :return: True if a drift was detected, else False
         """
-        features = np.fromiter(features.values(), dtype=float)
+        return self.update_array(np.fromiter(features.values(), dtype=float))
+
+    def update_array(self, features: np.ndarray) -> bool:
+        """
+        Update the detector with the most recent features given as array.
+
+        :param features: the features
+        :return: True if a drift was detected, else False
+        """
         if len(self.recent_data) == self.n_samples:
+            if self.warm_start and self.cluster_sums is not None:
+                self._shift_clusters(self.recent_data[0], self.reference_data[0])
+            if self.incremental_covariance and self.reference_scatter is not None:
+                self._shift_covariance(self.recent_data[0], self.reference_data[0])
             self.reference_data.append(self.recent_data[0])
         self.recent_data.append(features)
         if len(self.reference_data) == self.n_samples and len(self.recent_data) == self.n_samples:
-            drift = self._detect_drift()
+            with self._measure("test"):
+                drift = self._detect_drift()
             if drift:
                 self.reset()
                 return True
         return False
 
+    def _n_buffering_updates(self) -> int:
+        """
+        Get the number of samples that are added to the data windows before both windows are full.
+
+        :return: the number of samples
+        """
+        n_missing = 2 * self.n_samples - len(self.recent_data) - len(self.reference_data)
+        return max(0, n_missing - 1)
+
+    def _buffer(self, data: np.ndarray):
+        """
+        Add the samples to the data windows exactly as consecutive updates would, i.e., samples leaving the recent data
+        window enter the reference data window.
+
+        :param data: the samples
+        """
+        n_leaving = max(0, len(self.recent_data) + len(data) - self.n_samples)
+        n_leaving_recent = min(n_leaving, len(self.recent_data))
+        self.reference_data.extend(self.recent_data.view()[:n_leaving_recent])
+        self.reference_data.extend(data[:n_leaving - n_leaving_recent])
+        self.recent_data.extend(data)
+
+    def _get_window_occupancy(self) -> int:
+        """
+        Get the number of samples currently stored in the reference data window and the recent data window.
+
+        :return: the number of samples
+        """
+        return len(self.reference_data) + len(self.recent_data)
+
     def _detect_drift(self) -> bool:
         """
         Detect if a concept drift occurred.
 
         :return: True if a drift occurred, else False
         """
-        reference_data = np.array(self.reference_data)
-        self.kmeans.fit(reference_data)
+        if (
+            not self.warm_start
+            or self.cluster_sums is None
+            or (self.refit_interval is not None and self.n_tests_since_fit >= self.refit_interval)
+        ):
+            with self._measure("refit"):
+                self._fit_clusters(self.reference_data.view())
+        self.n_tests_since_fit += 1
         # Kuncheva suggests computing the covariance matrix over the entire dataset instead of over components for
         # improved stability
-        inverse_covariance_matrix = np.linalg.pinv(np.cov(reference_data.T))
+        if self.incremental_covariance:
+            inverse_covariance_matrix = self._get_inverse_covariance_matrix()
+        else:
+            inverse_covariance_matrix = np.linalg.pinv(np.cov(self.reference_data.view().T))
         closest_centroids = self._calculate_closest_centroids(inverse_covariance_matrix)
         spll = self._calculate_spll(inverse_covariance_matrix, closest_centroids)
         probability = np.exp(-spll)
@@ -82,6 +171,123 @@ class SemiParametricLogLikelihood(UnsupervisedDriftDetector):
         drift = quantile < self.threshold
         return drift
 
+    def _fit_clusters(self, reference_data: np.ndarray):
+        """
+        Fit the k-means clustering on the reference data. In warm start mode, a clustering fitted before initializes
+        the new clustering and the clusters' sums and sizes are stored for incremental updates.
+
+        :param reference_data: the reference data
+        """
+        if self.warm_start and self.cluster_sums is not None:
+            kmeans = KMeans(n_clusters=self.n_clusters, init=self.cluster_centers, n_init=1, random_state=self.seed)
+        else:
+            kmeans = self.kmeans
+        kmeans.fit(reference_data)
+        self.cluster_centers = kmeans.cluster_centers_
+        self.n_tests_since_fit = 0
+        if self.warm_start:
+            self.reference_labels = deque(kmeans.labels_, maxlen=self.n_samples)
+            self.cluster_counts = np.bincount(kmeans.labels_, minlength=self.n_clusters)
+            self.cluster_sums = np.zeros_like(self.cluster_centers)
+            np.add.at(self.cluster_sums, kmeans.labels_, reference_data)
+
+    def _shift_clusters(self, entering: np.ndarray, leaving: np.ndarray):
+        """
+        Update the clusters as the reference data window shifts by one sample. The leaving sample is removed from its
+        cluster, the entering sample is added to the cluster of its closest centroid and the centroids of both clusters
+        are moved to the clusters' means.
+
+        :param entering: the sample entering the reference data window
+        :param leaving: the sample leaving the reference data window
+        """
+        leaving_label = self.reference_labels.popleft()
+        entering_label = int(np.argmin(np.sum((self.cluster_centers - entering) ** 2, axis=1)))
+        self.reference_labels.append(entering_label)
+        self.cluster_sums[leaving_label] -= leaving
+        self.cluster_counts[leaving_label] -= 1
+        self.cluster_sums[entering_label] += entering
+        self.cluster_counts[entering_label] += 1
+        self.cluster_centers = self.cluster_centers.copy()
+        for label in {leaving_label, entering_label}:
+            if self.cluster_counts[label] > 0:
+                self.cluster_centers[label] = self.cluster_sums[label] / self.cluster_counts[label]
+
+    def _get_inverse_covariance_matrix(self) -> np.ndarray:
+        """
+        Get the inverse covariance matrix of the reference data window from the incrementally updated inverse scatter
+        matrix. The scatter matrix and its inverse are recomputed exactly if they are not available or if the
+        refactorization interval elapsed.
+
+        :return: the inverse covariance matrix
+        """
+        if self.reference_scatter is None or self.n_updates_since_factorization >= self.refactorization_interval:
+            with self._measure("refit"):
+                reference_data = self.reference_data.view()
+                self.reference_mean = np.mean(reference_data, axis=0)
+                centered = reference_data - self.reference_mean
+                self.reference_scatter = centered.T @ centered
+                self.inverse_reference_scatter = self._invert(self.reference_scatter)
+                self.n_updates_since_factorization = 0
+        if self.inverse_reference_scatter is None:
+            # the covariance matrix is singular
+            return np.linalg.pinv(self.reference_scatter / (self.n_samples - 1))
+        return (self.n_samples - 1) * self.inverse_reference_scatter
+
+    @staticmethod
+    def _invert(matrix: np.ndarray) -> Optional[np.ndarray]:
+        """
+        Invert the given matrix if it is well-conditioned.
+
+        :param matrix: the matrix
+        :return: the inverse or None if the matrix is singular or ill-conditioned
+        """
+        if np.linalg.cond(matrix) > 1e12:
+            return None
+        return np.linalg.inv(matrix)
+
+    def _shift_covariance(self, entering: np.ndarray, leaving: np.ndarray):
+        """
+        Update the mean and the scatter matrix of the reference data window and the scatter matrix's inverse as the
+        window shifts by one sample. The entering sample is added first, followed by the removal of the leaving sample,
+        each a rank-one update of the scatter matrix. If an update of the inverse is numerically unstable, the inverse
+        is discarded and recomputed exactly on the next test.
+
+        :param entering: the sample entering the reference data window
+        :param leaving: the sample leaving the reference data window
+        """
+        n = self.n_samples
+        entering_deviation = entering - self.reference_mean
+        mean = self.reference_mean + entering_deviation / (n + 1)
+        leaving_deviation = leaving - mean
+        self.reference_mean = (mean * (n + 1) - leaving) / n
+        updates = [(n / (n + 1), entering_deviation), (-(n + 1) / n, leaving_deviation)]
+        for weight, deviation in updates:
+            self.reference_scatter += weight * np.outer(deviation, deviation)
+        self.n_updates_since_factorization += 1
+        if self.inverse_reference_scatter is None:
+            return
+        for weight, deviation in updates:
+            self.inverse_reference_scatter = self._sherman_morrison(self.inverse_reference_scatter, weight, deviation)
+            if self.inverse_reference_scatter is None:
+                self.reference_scatter = None
+                return
+
+    @staticmethod
+    def _sherman_morrison(inverse: np.ndarray, weight: float, vector: np.ndarray) -> Optional[np.ndarray]:
+        """
+        Compute the inverse of A + weight * vector vector^T from the inverse of A with the Sherman-Morrison formula.
+
+        :param inverse: the inverse of A
+        :param weight: the weight of the rank-one update
+        :param vector: the vector of the rank-one update
+        :return: the updated inverse or None if the update is numerically unstable
+        """
+        inverse_vector = inverse @ vector
+        denominator = 1 + weight * (vector @ inverse_vector)
+        if abs(denominator) < 1e-8:
+            return None
+        return inverse - weight * np.outer(inverse_vector, inverse_vector) / denominator
+
     def _calculate_closest_centroids(
         self,
         inverse_covariance_matrix: np.array,
@@ -93,16 +299,13 @@ class SemiParametricLogLikelihood(UnsupervisedDriftDetector):
         :return: the closest centroids
         """
         distances_to_centers = distance.cdist(
-            self.recent_data,
-            self.kmeans.cluster_centers_,
+            self.recent_data.view(),
+            self.cluster_centers,
             metric="mahalanobis",
             VI=inverse_covariance_matrix,
         )
         centroid_indices = np.argmin(distances_to_centers, axis=1)
-        centroids = [
-            self.kmeans.cluster_centers_[closest] for closest in centroid_indices
-        ]
-        return np.array(centroids)
+        return self.cluster_centers[centroid_indices]
 
     def _calculate_spll(
         self,
@@ -117,13 +320,10 @@ class SemiParametricLogLikelihood(UnsupervisedDriftDetector):
         :param closest_centroids: the closest centroid of each recent sample
         :return: the log likelihood
         """
-        recent_data = np.array(self.recent_data)
+        recent_data = self.recent_data.view()
         centered = recent_data - closest_centroids
-        likelihoods = []
-        for i in range(self.n_samples):
-            normalized_x = np.matmul(centered[i], inverse_covariance_matrix)
-            likelihood = np.matmul(normalized_x, centered[i])
-            likelihoods.append(likelihood)
+        # the quadratic form (x - c)^T S^-1 (x - c) of all samples at once
+        likelihoods = np.einsum("ij,jk,ik->i", centered, inverse_covariance_matrix, centered)
         spll = np.sum(likelihoods) / self.n_samples
         return spll
 
@@ -131,5 +331,9 @@ class SemiParametricLogLikelihood(UnsupervisedDriftDetector):
         """
         Reset the drift detector by clearing the recent data and resetting the KMeans.
         """
+        self._count("reset")
         self.reference_data = self.recent_data
-        self.recent_data = deque(maxlen=self.n_samples)
+        self.recent_data = Window(maxlen=self.n_samples)
+        self.cluster_sums = None
+        self.cluster_counts = None
+        self.reference_scatter = None
@@ -1,12 +1,12 @@
-from collections import deque
 from typing import Optional
 
 import numpy as np
-from scipy.spatial.distance import minkowski
+from scipy.spatial import distance
 from scipy.stats import beta
 from sklearn.cluster import KMeans
 
 from .base import UnsupervisedDriftDetector
+from .window import Window
 
 
 class UCDD(UnsupervisedDriftDetector):
@@ -27,6 +27,7 @@ class UCDD(UnsupervisedDriftDetector):
         n_recent_samples: int = 500,
         threshold: float = 0.05,
         stability_offset: float = 1e-9,
+        block_size: int = 1024,
         seed: Optional[int] = None,
     ):
         """
@@ -35,12 +36,15 @@ class UCDD(UnsupervisedDriftDetector):
         :param n_reference_samples: the number of samples stored in the reference data window
         :param n_recent_samples: the number of samples stored in the recent data window
         :param threshold: the threshold for concept drift detection
+        :param block_size: the maximum number of data points whose distances to all neighbor candidates are computed at
+            once
         """
         super().__init__(seed)
-        self.window = deque(maxlen=n_recent_samples + n_reference_samples)
+        self.window = Window(maxlen=n_recent_samples + n_reference_samples)
         self.n_reference_samples = n_reference_samples
         self.threshold = threshold
         self.stability_offset = stability_offset
+        self.block_size = block_size
         self.kmeans = KMeans(n_clusters=2, random_state=self.seed)
 
     def update(self, features: dict) -> bool:
@@ -50,25 +54,67 @@ class UCDD(UnsupervisedDriftDetector):
         :param features: the features
         :return: True if a drift occurred, else False
         """
-        self.window.append(np.fromiter(features.values(), dtype=float))
+        return self.update_array(np.fromiter(features.values(), dtype=float))
+
+    def update_array(self, features: np.ndarray) -> bool:
+        """
+        Update the detector with the given features as array.
+
+        :param features: the features
+        :return: True if a drift occurred, else False
+        """
+        self.window.append(features)
         if len(self.window) == self.window.maxlen:
-            kmeans = self.kmeans.fit(self.window)
-            (
-                reference_positive,
-                reference_negative,
-                recent_positive,
-                recent_negative,
-            ) = self._separate_data(kmeans.labels_)
-            beta_positive = self._compute_beta(
-                recent_positive, recent_negative, reference_negative
-            )
-            beta_negative = self._compute_beta(
-                recent_negative, recent_positive, reference_positive
-            )
-            if beta_positive < self.threshold or beta_negative < self.threshold:
-                return True
+            with self._measure("test"):
+                return self._detect_drift()
         return False
 
+    def _detect_drift(self) -> bool:
+        """
+        Cluster the data window and detect if a concept drift occurred.
+
+        :return: True if a drift occurred, else False
+        """
+        with self._measure("refit"):
+            kmeans = self.kmeans.fit(self.window.view())
+        (
+            reference_positive,
+            reference_negative,
+            recent_positive,
+            recent_negative,
+        ) = self._separate_data(kmeans.labels_)
+        beta_positive = self._compute_beta(
+            recent_positive, recent_negative, reference_negative
+        )
+        beta_negative = self._compute_beta(
+            recent_negative, recent_positive, reference_positive
+        )
+        return beta_positive < self.threshold or beta_negative < self.threshold
+
+    def _n_buffering_updates(self) -> int:
+        """
+        Get the number of samples that are added to the window before it is full.
+
+        :return: the number of samples
+        """
+        return self.window.maxlen - 1 - len(self.window)
+
+    def _buffer(self, data: np.ndarray):
+        """
+        Add the samples to the window.
+
+        :param data: the samples
+        """
+        self.window.extend(data)
+
+    def _get_window_occupancy(self) -> int:
+        """
+        Get the number of samples currently stored in the window.
+
+        :return: the number of samples
+        """
+        return len(self.window)
+
     def _compute_beta(
         self,
         evaluated_data: np.array,
@@ -86,27 +132,29 @@ class UCDD(UnsupervisedDriftDetector):
         :param reference_data: the reference data which the evaluated data is compared to
         :return: the probability
         """
-        windows = (set(), set())
-        for d in evaluated_data:
-            if len(recent_data) > 0:
-                windows[0].add(self._find_closest_neighbor_index(d, recent_data))
-            if len(reference_data) > 0:
-                windows[1].add(self._find_closest_neighbor_index(d, reference_data))
-        return beta.cdf(0.5, len(windows[0]) + self.stability_offset, len(windows[1]) + self.stability_offset)
+        n_neighbors = [
+            len(np.unique(self._find_closest_neighbor_indices(evaluated_data, candidates)))
+            for candidates in (recent_data, reference_data)
+        ]
+        return beta.cdf(0.5, n_neighbors[0] + self.stability_offset, n_neighbors[1] + self.stability_offset)
 
-    @staticmethod
-    def _find_closest_neighbor_index(data_point: np.array, neighbor_candidates: np.array) -> int:
+    def _find_closest_neighbor_indices(self, data_points: np.array, neighbor_candidates: np.array) -> np.ndarray:
         """
-        Find the closest neighbors index of the given data point in the provided neighbor candidates.
+        Find the closest neighbor's index of each of the given data points in the provided neighbor candidates. The
+        distances are computed in blocks of data points to bound the memory usage.
 
-        :param data_point: the data point
+        :param data_points: the data points
         :param neighbor_candidates: the potential neighbors
-        :return: the neighbor's index
+        :return: the neighbors' indices, empty if there are no data points or no neighbor candidates
         """
-        distances = [
-            minkowski(data_point, candidate) for candidate in neighbor_candidates
-        ]
-        return int(np.argmin(distances))
+        if len(data_points) == 0 or len(neighbor_candidates) == 0:
+            return np.empty(0, dtype=int)
+        return np.concatenate(
+            [
+                np.argmin(distance.cdist(data_points[i:i + self.block_size], neighbor_candidates), axis=1)
+                for i in range(0, len(data_points), self.block_size)
+            ]
+        )
 
     def _separate_data(self, labels: np.array) -> (np.array, np.array, np.array, np.array):
         """
@@ -116,7 +164,7 @@ class UCDD(UnsupervisedDriftDetector):
         :return: first class reference data, second class reference data, first class recent data, second class recent
             data
         """
-        data = np.array(self.window)
+        data = self.window.view()
         reference_labels = labels[:self.n_reference_samples]
         recent_labels = labels[self.n_reference_samples:]
         reference_positive = data[:self.n_reference_samples][reference_labels == 0]
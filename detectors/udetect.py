@@ -1,8 +1,7 @@
-from collections import deque
-
 import numpy as np
 
 from .base import UnsupervisedDriftDetector
+from .window import Window
 
 
 class UDetect(UnsupervisedDriftDetector):
@@ -12,6 +11,11 @@ class UDetect(UnsupervisedDriftDetector):
     statistic exceeds certain thresholds, a concept drift is signalled. The thresholds are determined on multiple
     windows of data through statistical process control.
 
+    The statistic is computed from the running sum and sum of squares of the samples in the window, which are updated
+    as samples enter and leave the window. To limit cancellation, the sums are taken over the samples shifted by a
+    point close to the window's mean, and they are recomputed from the window whenever all of its samples have been
+    replaced.
+
     Source: Bashir, S.; Petrovski, A.; Doolan, D. (2017). A framework for unsupervised change detection in activity
         recognition. International Journal of Pervasive Computing and Communications.
     """
@@ -31,8 +35,12 @@ class UDetect(UnsupervisedDriftDetector):
         super().__init__(seed)
         self.n_windows = n_windows
         self.n_samples = n_samples
-        self.data = deque(maxlen=n_samples)
+        self.data = Window(maxlen=n_samples)
         self.summaries = []
+        self.shift = None
+        self.shifted_sum = None
+        self.shifted_squared_sum = 0.0
+        self.n_removed_samples = 0
         self.disjoint_training_windows = disjoint_training_windows
         self.upper_range_limit = None
         self.upper_individual_limit = None
@@ -45,21 +53,61 @@ class UDetect(UnsupervisedDriftDetector):
         :param features: the features
         :return: True if a drift occurred, else False
         """
-        self.data.append(np.fromiter(features.values(), dtype=float))
+        return self.update_array(np.fromiter(features.values(), dtype=float))
+
+    def update_array(self, features: np.ndarray) -> bool:
+        """
+        Update the detector with the given features as array and detect if a concept drift occurred.
+
+        :param features: the features
+        :return: True if a drift occurred, else False
+        """
+        if self.data.is_full():
+            self._remove_from_sums(self.data[0])
+        self.data.append(features)
+        self._add_to_sums(features[np.newaxis])
         if len(self.data) == self.data.maxlen:
             if len(self.summaries) < self.n_windows:
                 summary = self._calculate_window_summary()
                 self.summaries.append(summary)
                 if self.disjoint_training_windows:
-                    self.data = deque(maxlen=self.n_samples)
+                    self._clear()
             elif self.upper_range_limit is None:
-                self._calculate_thresholds()
+                with self._measure("refit"):
+                    self._calculate_thresholds()
             else:
-                if self._detect_drift():
+                with self._measure("test"):
+                    drift = self._detect_drift()
+                if drift:
                     self.reset()
                     return True
         return False
 
+    def _n_buffering_updates(self) -> int:
+        """
+        Get the number of samples that are added to the data window before it is full.
+
+        :return: the number of samples
+        """
+        return self.data.maxlen - 1 - len(self.data)
+
+    def _buffer(self, data: np.ndarray):
+        """
+        Add the samples to the data window.
+
+        :param data: the samples
+        """
+        self.data.extend(data)
+        self._add_to_sums(data)
+
+    def _get_window_occupancy(self) -> int:
+        """
+        Get the number of samples currently stored in the data window.
+
+        :return: the number of samples
+        """
+        return len(self.data)
+
     def _detect_drift(self) -> bool:
         """
         Detect if a concept drift occurred.
@@ -77,16 +125,62 @@ class UDetect(UnsupervisedDriftDetector):
 
     def _calculate_window_summary(self) -> float:
         """
-        Calculate the summary statistics for the current data window.
+        Calculate the summary statistics for the current data window, i.e., half the sum of the squared distances of
+        the samples to the window's mean, from the running sums.
 
         :return: the summary
         """
-        mean = np.mean(self.data, axis=0)
-        data = np.array(self.data)
-        distances = np.sum((data - mean) ** 2) ** 1/2  # minkowski_2
-        summary = float(np.mean(distances))
+        if self.n_removed_samples >= self.n_samples:
+            self._sum_window()
+        squared_distances = self.shifted_squared_sum - self.shifted_sum @ self.shifted_sum / len(self.data)
+        summary = float(squared_distances / 2)
         return summary
 
+    def _add_to_sums(self, data: np.ndarray):
+        """
+        Add samples entering the data window to the running sums.
+
+        :param data: the samples
+        """
+        if self.shift is None:
+            self.shift = np.array(data[0], dtype=float)
+            self.shifted_sum = np.zeros(len(self.shift))
+        shifted_data = data - self.shift
+        self.shifted_sum += np.sum(shifted_data, axis=0)
+        self.shifted_squared_sum += np.sum(shifted_data ** 2)
+
+    def _remove_from_sums(self, sample: np.ndarray):
+        """
+        Remove a sample leaving the data window from the running sums.
+
+        :param sample: the sample
+        """
+        shifted_sample = sample - self.shift
+        self.shifted_sum -= shifted_sample
+        self.shifted_squared_sum -= shifted_sample @ shifted_sample
+        self.n_removed_samples += 1
+
+    def _sum_window(self):
+        """
+        Recompute the running sums from the data window, shifting the samples by the window's mean.
+        """
+        data = self.data.view()
+        self.shift = np.mean(data, axis=0)
+        shifted_data = data - self.shift
+        self.shifted_sum = np.sum(shifted_data, axis=0)
+        self.shifted_squared_sum = np.sum(shifted_data ** 2)
+        self.n_removed_samples = 0
+
+    def _clear(self):
+        """
+        Remove all samples from the data window and reset the running sums.
+        """
+        self.data.clear()
+        self.shift = None
+        self.shifted_sum = None
+        self.shifted_squared_sum = 0.0
+        self.n_removed_samples = 0
+
     def _calculate_thresholds(self):
         """
         Calculate the thresholds that indicate a concept drift occurred.
@@ -100,7 +194,8 @@ class UDetect(UnsupervisedDriftDetector):
         self.lower_individual_limit = mean_summary - 2.66 * mean_range
 
     def reset(self):
+        self._count("reset")
         self.upper_range_limit = None
         self.upper_individual_limit = None
         self.lower_individual_limit = None
-        self.data = deque(maxlen=self.n_samples)
+        self._clear()
@@ -0,0 +1,128 @@
+import numpy as np
+
+
+class Window:
+    """
+    A sliding window storing up to maxlen samples in a preallocated, contiguous 2-D array. Appending a sample to a full
+    window discards the oldest sample in O(1) without shifting the remaining samples.
+
+    Each sample is written twice, at its position in the ring buffer and maxlen rows later, so that the samples in order
+    of arrival always form a contiguous slice of the array. Therefore, view returns the samples as array without
+    copying them. The array is allocated on the first append, once the number of features is known.
+    """
+
+    def __init__(self, maxlen: int):
+        """
+        Init a new, empty Window.
+
+        :param maxlen: the maximum number of samples
+        """
+        self.maxlen = maxlen
+        self.buffer = None
+        self.start = 0
+        self.length = 0
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        if copy:
+            return np.array(self.view(), dtype=dtype)
+        return np.asarray(self.view(), dtype=dtype)
+
+    def __getitem__(self, index):
+        return self.view()[index]
+
+    def __iter__(self):
+        return iter(self.view())
+
+    def is_full(self) -> bool:
+        """
+        Check whether the window stores maxlen samples.
+
+        :return: True if the window is full, else False
+        """
+        return self.length == self.maxlen
+
+    def view(self) -> np.ndarray:
+        """
+        Get the samples in order of arrival without copying them. The view reflects the window's current state only,
+        i.e., it must not be used after the next modification of the window.
+
+        :return: the samples, one sample per row
+        """
+        if self.buffer is None:
+            return np.empty((0, 0))
+        return self.buffer[self.start: self.start + self.length]
+
+    def append(self, sample: np.ndarray):
+        """
+        Append a sample, discarding the oldest sample if the window is full.
+
+        :param sample: the sample
+        """
+        if self.buffer is None:
+            self.buffer = np.empty((2 * self.maxlen, len(sample)))
+        position = (self.start + self.length) % self.maxlen
+        self.buffer[position] = sample
+        self.buffer[position + self.maxlen] = sample
+        if self.length == self.maxlen:
+            self.start = (self.start + 1) % self.maxlen
+        else:
+            self.length += 1
+
+    def extend(self, data: np.ndarray):
+        """
+        Append multiple samples, discarding the oldest samples if the window is full.
+
+        :param data: the samples, one sample per row
+        """
+        data = np.asarray(data, dtype=float)[-self.maxlen:]
+        if len(data) == 0:
+            return
+        if self.buffer is None:
+            self.buffer = np.empty((2 * self.maxlen, data.shape[1]))
+        positions = (self.start + self.length + np.arange(len(data))) % self.maxlen
+        self.buffer[positions] = data
+        self.buffer[positions + self.maxlen] = data
+        length = min(self.length + len(data), self.maxlen)
+        self.start = (self.start + self.length + len(data) - length) % self.maxlen
+        self.length = length
+
+    def remove_oldest(self, n_samples: int = 1):
+        """
+        Discard the oldest samples.
+
+        :param n_samples: the number of samples to discard, at most all samples are discarded
+        """
+        n_samples = min(n_samples, self.length)
+        self.start = (self.start + n_samples) % self.maxlen
+        self.length -= n_samples
+
+    def remove_newest(self, n_samples: int = 1):
+        """
+        Discard the newest samples.
+
+        :param n_samples: the number of samples to discard, at most all samples are discarded
+        """
+        self.length -= min(n_samples, self.length)
+
+    def clear(self):
+        """
+        Discard all samples, keeping the allocated array.
+        """
+        self.start = 0
+        self.length = 0
+
+    def copy(self) -> "Window":
+        """
+        Copy the window including its samples.
+
+        :return: the copy
+        """
+        window = Window(self.maxlen)
+        if self.buffer is not None:
+            window.buffer = self.buffer.copy()
+        window.start = self.start
+        window.length = self.length
+        return window
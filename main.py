@@ -1,15 +1,48 @@
-import sys
+import argparse
 import time
 
 from runner import run
 
 
 def main():
-    if len(sys.argv) > 1:
-        experiment_name = sys.argv[1]
-    else:
-        experiment_name = int(time.time())
-    run(experiment_name)
+    parser = argparse.ArgumentParser(description="Test all configurations of all detectors listed in config.py.")
+    parser.add_argument(
+        "experiment_name",
+        nargs="?",
+        default=int(time.time()),
+        help="the name of the experiment, defaults to the current UNIX time",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="the number of worker processes executing configurations in parallel, defaults to 1",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="continue an interrupted experiment by skipping all runs of configurations that were logged already",
+    )
+    parser.add_argument(
+        "--cache-drifts",
+        action="store_true",
+        help="store the drifts detected by configurations with fixed seeds in 'results/cache/drifts' and reuse them "
+        "instead of running the detectors again. Detectors configured without seeds, as in the shipped config.py, "
+        "are not cached, and a warning is issued for each of them",
+    )
+    parser.add_argument(
+        "--instrument",
+        action="store_true",
+        help="log the time each detector spends buffering, testing and refitting as additional columns",
+    )
+    args = parser.parse_args()
+    run(
+        args.experiment_name,
+        n_workers=args.workers,
+        resume=args.resume,
+        cache_drifts=args.cache_drifts,
+        instrument=args.instrument,
+    )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,93 @@
+from collections import Counter
+from typing import Any, Iterable, List
+
+import numpy as np
+
+
+class ConfusionMatrix:
+    """
+    ConfusionMatrix counts how often each combination of true and predicted label occurred. Confusion matrices of
+    disjoint parts of a data stream add up to the confusion matrix of the whole data stream, so that accuracy and macro
+    f1 score can be computed without storing any predictions.
+    """
+
+    def __init__(self):
+        """
+        Init a new, empty ConfusionMatrix.
+        """
+        self.counts = Counter()
+
+    def update(self, y_true: Any, y_pred: Any):
+        """
+        Count a single prediction.
+
+        :param y_true: the true label
+        :param y_pred: the predicted label
+        """
+        self.counts[(y_true, y_pred)] += 1
+
+    def update_batch(self, y_true: Iterable[Any], y_pred: Iterable[Any]):
+        """
+        Count multiple predictions.
+
+        :param y_true: the true labels
+        :param y_pred: the predicted labels
+        """
+        self.counts.update(zip(y_true, y_pred))
+
+    def __add__(self, other: "ConfusionMatrix") -> "ConfusionMatrix":
+        result = ConfusionMatrix()
+        result.counts = self.counts + other.counts
+        return result
+
+    def __iadd__(self, other: "ConfusionMatrix") -> "ConfusionMatrix":
+        self.counts.update(other.counts)
+        return self
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, ConfusionMatrix) and self.counts == other.counts
+
+    @property
+    def n_samples(self) -> int:
+        return sum(self.counts.values())
+
+    def get_labels(self) -> List[Any]:
+        """
+        Get all labels that occurred either as true or as predicted label, sorted if possible.
+
+        :return: the labels
+        """
+        labels = {label for pair in self.counts for label in pair}
+        try:
+            return sorted(labels)
+        except TypeError:
+            return list(labels)
+
+    def accuracy(self) -> float:
+        """
+        Calculate the accuracy, i.e., the share of correct predictions.
+
+        :return: the accuracy
+        """
+        correct = sum(count for (y_true, y_pred), count in self.counts.items() if y_true == y_pred)
+        return correct / self.n_samples
+
+    def f1_score(self) -> float:
+        """
+        Calculate the macro f1 score like sklearn's f1_score, i.e., the unweighted mean of the f1 scores of all labels
+        that occurred either as true or as predicted label.
+
+        :return: the macro f1 score
+        """
+        labels = self.get_labels()
+        index = {label: i for i, label in enumerate(labels)}
+        true_positives = np.zeros(len(labels))
+        true_counts = np.zeros(len(labels))
+        predicted_counts = np.zeros(len(labels))
+        for (y_true, y_pred), count in self.counts.items():
+            true_counts[index[y_true]] += count
+            predicted_counts[index[y_pred]] += count
+            if y_true == y_pred:
+                true_positives[index[y_true]] += count
+        f1_scores = 2 * true_positives / (true_counts + predicted_counts)
+        return float(np.mean(f1_scores))
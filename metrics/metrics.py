@@ -1,9 +1,6 @@
 from dataclasses import dataclass
 from typing import List
 
-import numpy as np
-from sklearn.metrics import accuracy_score, f1_score
-
 from .drift import calculate_drift_metrics
 from .lift_per_drift import lift_per_drift
 
@@ -27,6 +24,7 @@ class ExperimentResult:
     mtr: float = None
     mtd: float = None
     mdr: float = None
+    instrumentation: dict = None
 
     def to_dict(self, include_drift_metrics: bool) -> dict:
         """
@@ -55,28 +53,23 @@ class ExperimentResult:
         return results
 
 
-def get_metrics(stream, predicted_drifts, true_labels, predicted_labels) -> ExperimentResult:
+def get_metrics(stream, predicted_drifts, accuracies, f1_scores) -> ExperimentResult:
     """
-    Calculate performance metrics based on the predicted drifts, the predicted labels and the true labels to calculate
-    accuracies, f1 scores and lift-per-drift. If stream contains ground truth concept drift, mtr, mtfa, mtd and mdr are
-    calculated as well.
+    Calculate performance metrics based on the predicted drifts and the classifiers' accuracies and f1 scores to
+    calculate lift-per-drift. If stream contains ground truth concept drift, mtr, mtfa, mtd and mdr are calculated as
+    well.
 
     :param stream: the data stream the experiment was conducted on
     :param predicted_drifts: the positions of detected drifts
-    :param true_labels: the true class labels
-    :param predicted_labels: the predicted class labels
+    :param accuracies: the accuracies of the Hoeffding tree and the naive Bayes classifier operating without the
+        concept drift detector followed by the accuracies of both classifiers assisted by the concept drift detector
+    :param f1_scores: the f1 scores in the same order as the accuracies
     :return: an ExperimentResult data class storing the corresponding metrics
     """
     if hasattr(stream, "drifts"):
         drift_metrics = calculate_drift_metrics(stream.drifts, predicted_drifts)
     else:
         drift_metrics = {"mtfa": None, "mdr": None, "mtr": None, "mtd": None}
-    f1_scores = []
-    accuracies = []
-    predicted_labels = np.array(predicted_labels).transpose()
-    for predictions in predicted_labels:
-        f1_scores.append(f1_score(y_true=true_labels, y_pred=predictions, average="macro"))
-        accuracies.append(accuracy_score(y_true=true_labels, y_pred=predictions))
     lpd_hoeffding_tree = lift_per_drift(
         base_accuracy=accuracies[0],
         assisted_accuracy=accuracies[2],
@@ -0,0 +1,80 @@
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+
+from metrics.confusion_matrix import ConfusionMatrix
+from .classifiers import Classifiers
+
+
+@dataclass
+class Baseline:
+    """
+    This data class stores the number of samples of a data stream as well as the accuracies and f1 scores of a
+    Hoeffding tree and a naive Bayes classifier operating on the data stream without the use of a concept drift
+    detector.
+    """
+    n_samples: int
+    accuracies: List[float]
+    f1_scores: List[float]
+
+
+_baselines: Dict[Tuple[str, int], Baseline] = {}
+
+
+def get_stream_key(stream) -> str:
+    """
+    Get a key identifying the given data stream by its class and its configuration, i.e., all attributes of simple
+    types. Attributes that are None are skipped, since data streams such as SineClusters initialize state like their
+    random number generator with None and only set it when iterated. Hence, the key is identical for equally
+    configured instances of a data stream, before and after iterating them and even across processes.
+
+    :param stream: the data stream
+    :return: the key
+    """
+    attributes = sorted(
+        (name, value)
+        for name, value in vars(stream).items()
+        if isinstance(value, (bool, int, float, str))
+    )
+    return f"{stream.__class__.__name__}{attributes}"
+
+
+def get_baseline(stream, n_training_samples: int) -> Baseline:
+    """
+    Get the baseline of the classifiers operating without concept drift detector on the given data stream. Since these
+    classifiers are only trained on the first n_training_samples and never depend on a detector, the baseline is only
+    computed once per data stream and number of training samples and cached afterwards.
+
+    :param stream: the data stream
+    :param n_training_samples: the number of training samples
+    :return: the baseline
+    """
+    key = (get_stream_key(stream), n_training_samples)
+    if key not in _baselines:
+        _baselines[key] = _compute_baseline(stream, n_training_samples)
+    return _baselines[key]
+
+
+def _compute_baseline(stream, n_training_samples: int) -> Baseline:
+    """
+    Compute the baseline by training the classifiers on the first n_training_samples and testing them on all but the
+    first sample in a prequential fashion. Predictions are accumulated in confusion matrices instead of being stored.
+
+    :param stream: the data stream
+    :param n_training_samples: the number of training samples
+    :return: the baseline
+    """
+    classifiers = Classifiers()
+    confusion_matrices = [ConfusionMatrix(), ConfusionMatrix()]
+    n_samples = 0
+    for i, (x, y) in enumerate(stream):
+        if i != 0:
+            for confusion_matrix, prediction in zip(confusion_matrices, classifiers.predict(x)):
+                confusion_matrix.update(y, prediction)
+        if i < n_training_samples:
+            classifiers.fit(x, y)
+        n_samples += 1
+    return Baseline(
+        n_samples=n_samples,
+        accuracies=[confusion_matrix.accuracy() for confusion_matrix in confusion_matrices],
+        f1_scores=[confusion_matrix.f1_score() for confusion_matrix in confusion_matrices],
+    )
@@ -4,57 +4,44 @@ from river.tree import HoeffdingTreeClassifier
 
 class Classifiers:
     """
-    Classifiers provides an interface to operate two HoeffdingTreeClassifiers and two GaussianNBs for a concept drift
-    detector. One of each is assisted by the concept drift detector, whereas the remaining classifiers operate
-    independently.
+    Classifiers provides an interface to operate a HoeffdingTreeClassifier and a GaussianNB side by side. Classifiers
+    assisted by a concept drift detector are reset whenever a concept drift is detected, whereas classifiers operating
+    independently of concept drift detectors are never reset.
     """
 
     def __init__(self):
         """
-        Init two HoeffdingTreeClassifiers and two GaussianNBs.
+        Init a HoeffdingTreeClassifier and a GaussianNB.
         """
-        self.base_hoeffding_tree = HoeffdingTreeClassifier()
-        self.base_gaussian_nb = GaussianNB()
-        self.assisted_hoeffding_tree = HoeffdingTreeClassifier()
-        self.assisted_gaussian_nb = GaussianNB()
-        self.nonadaptive_trains = 0
-        self.adaptive_trains = 0
+        self.hoeffding_tree = HoeffdingTreeClassifier()
+        self.gaussian_nb = GaussianNB()
 
     def predict(self, x):
         """
         Predict the label of the features x.
 
         :param x: the features
-        :return: the label
+        :return: the labels predicted by the Hoeffding tree and the naive Bayes classifier
         """
         predictions = (
-            self.base_hoeffding_tree.predict_one(x),
-            self.base_gaussian_nb.predict_one(x),
-            self.assisted_hoeffding_tree.predict_one(x),
-            self.assisted_gaussian_nb.predict_one(x),
+            self.hoeffding_tree.predict_one(x),
+            self.gaussian_nb.predict_one(x),
         )
         return predictions
 
-    def fit(self, x, y, nonadaptive):
+    def fit(self, x, y):
         """
-        Fit the classifiers on the training data consisting of x and y. If nonadaptive is True, the base classifiers are
-        trained as well.
+        Fit the classifiers on the training data consisting of x and y.
 
         :param x: the features
         :param y: the label
-        :param nonadaptive: True if base classifiers shall be trained as well, else False
         """
-        if nonadaptive:
-            self.base_hoeffding_tree.learn_one(x, y)
-            self.base_gaussian_nb.learn_one(x, y)
-            self.nonadaptive_trains += 1
-        self.adaptive_trains += 1
-        self.assisted_hoeffding_tree.learn_one(x, y)
-        self.assisted_gaussian_nb.learn_one(x, y)
+        self.hoeffding_tree.learn_one(x, y)
+        self.gaussian_nb.learn_one(x, y)
 
     def reset(self):
         """
-        Reset the classifiers assisted by concept drift detectors.
+        Reset the classifiers.
         """
-        self.assisted_hoeffding_tree = HoeffdingTreeClassifier()
-        self.assisted_gaussian_nb = GaussianNB()
+        self.hoeffding_tree = HoeffdingTreeClassifier()
+        self.gaussian_nb = GaussianNB()
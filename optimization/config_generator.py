@@ -19,6 +19,7 @@ class ConfigGenerator:
         """
         self.parameters = sorted(parameters, key=lambda p: p.name)
         self.seeds = seeds
+        self._last_seed = None
 
     def get_parameter_names(self):
         """
@@ -33,7 +34,9 @@ class ConfigGenerator:
     def __iter__(self):
         """
         Creates all combinations of configurations from the parameters and yields them. If no seeds were provided,
-        the current UNIX time is used as seed instead.
+        the current UNIX time is used as seed instead. Seeds generated this way are strictly increasing, so that
+        configurations generated within the same second, e.g., when expanding all runs into jobs up front, still
+        receive distinct seeds.
 
         :return: the configurations
         """
@@ -44,7 +47,19 @@ class ConfigGenerator:
                 for j, parameter in enumerate(self.parameters)
             }
             if self.seeds is None:
-                config["seed"] = int(time.time())
+                config["seed"] = self._get_time_seed()
             else:
                 config["seed"] = self.seeds[i]
             yield config
+
+    def _get_time_seed(self) -> int:
+        """
+        Get the current UNIX time as seed or the previous seed plus one if the time did not advance since.
+
+        :return: the seed
+        """
+        seed = int(time.time())
+        if self._last_seed is not None and seed <= self._last_seed:
+            seed = self._last_seed + 1
+        self._last_seed = seed
+        return seed
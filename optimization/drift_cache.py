@@ -0,0 +1,110 @@
+"""This module provides a content-addressed cache of the drifts detected by configurations of detectors."""
+import hashlib
+import json
+import os
+from os import path
+from typing import Dict, List, Optional, Tuple
+
+from .baseline import get_stream_key
+
+_file_hashes: Dict[Tuple[str, int, int], str] = {}
+
+
+def get_stream_fingerprint(stream) -> str:
+    """
+    Get a fingerprint of the given data stream. The fingerprint covers the stream's configuration and, for file-backed
+    data streams, the content of the file, i.e., a changed file yields a different fingerprint.
+
+    :param stream: the data stream
+    :return: the fingerprint as hex digest
+    """
+    digest = hashlib.sha256(get_stream_key(stream).encode())
+    full_path = getattr(stream, "full_path", None)
+    if isinstance(full_path, str) and path.exists(full_path):
+        digest.update(_get_file_hash(full_path).encode())
+    return digest.hexdigest()
+
+
+def _get_file_hash(file_path: str) -> str:
+    """
+    Get the hash of the file's content. Hashes are stored per process as long as the file's size and modification time
+    do not change.
+
+    :param file_path: the path of the file
+    :return: the hash as hex digest
+    """
+    stats = os.stat(file_path)
+    key = (file_path, stats.st_size, stats.st_mtime_ns)
+    if key not in _file_hashes:
+        digest = hashlib.sha256()
+        with open(file_path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+        _file_hashes[key] = digest.hexdigest()
+    return _file_hashes[key]
+
+
+class DriftCache:
+    """
+    DriftCache stores the drifts a configuration of a detector detected on a data stream. Entries are addressed by the
+    fingerprint of the data stream, the name of the detector and the configuration including the seed. Since detectors
+    are deterministic given their seed, a cached entry replaces running the detector again, e.g., when evaluating
+    different classifiers or numbers of training samples. The fingerprint is passed by the caller, so that it is taken
+    once per run, before the data stream is iterated.
+    """
+
+    def __init__(self, directory: str = path.join("results", "cache", "drifts")):
+        """
+        Init a new DriftCache.
+
+        :param directory: the directory storing the cache entries
+        """
+        self.directory = directory
+
+    def get_path(self, stream_fingerprint: str, model: str, config: dict) -> str:
+        """
+        Get the path of the cache entry of the given configuration of the detector on the data stream.
+
+        :param stream_fingerprint: the fingerprint of the data stream, see get_stream_fingerprint
+        :param model: the name of the detector
+        :param config: the configuration including the seed
+        :return: the path
+        """
+        key = json.dumps(
+            [stream_fingerprint, model, config],
+            sort_keys=True,
+            default=repr,
+        )
+        return path.join(self.directory, hashlib.sha256(key.encode()).hexdigest() + ".json")
+
+    def get(self, stream_fingerprint: str, model: str, config: dict) -> Optional[List[int]]:
+        """
+        Get the cached drifts of the given configuration of the detector on the data stream.
+
+        :param stream_fingerprint: the fingerprint of the data stream, see get_stream_fingerprint
+        :param model: the name of the detector
+        :param config: the configuration including the seed
+        :return: the drifts or None if they are not cached
+        """
+        entry_path = self.get_path(stream_fingerprint, model, config)
+        if not path.exists(entry_path):
+            return None
+        with open(entry_path) as f:
+            return json.load(f)["drifts"]
+
+    def put(self, stream_fingerprint: str, model: str, config: dict, drifts: List[int]):
+        """
+        Store the drifts of the given configuration of the detector on the data stream. The entry is written to a
+        temporary file first, so that concurrent readers never see an incomplete entry.
+
+        :param stream_fingerprint: the fingerprint of the data stream, see get_stream_fingerprint
+        :param model: the name of the detector
+        :param config: the configuration including the seed
+        :param drifts: the detected drifts
+        """
+        entry_path = self.get_path(stream_fingerprint, model, config)
+        os.makedirs(self.directory, exist_ok=True)
+        temporary_path = f"{entry_path}.{os.getpid()}.tmp"
+        with open(temporary_path, "w") as f:
+            json.dump({"drifts": [int(drift) for drift in drifts]}, f)
+        os.replace(temporary_path, entry_path)
@@ -0,0 +1,70 @@
+import multiprocessing
+from typing import Iterable, Optional
+
+from threadpoolctl import threadpool_limits
+
+from .model_optimizer import Job
+
+
+def _init_worker(n_threads: Optional[int]):
+    """
+    Limit the number of threads used by native libraries, e.g., the OpenMP and BLAS pools used by numpy and
+    scikit-learn, in a worker process to avoid oversubscribing the available cores.
+
+    :param n_threads: the number of threads per worker or None to keep the libraries' defaults
+    """
+    if n_threads is not None:
+        threadpool_limits(limits=n_threads)
+
+
+def _execute(indexed_job):
+    """
+    Execute a job in a worker process.
+
+    :param indexed_job: a tuple containing the index of the job and the job
+    :return: the index of the job, the metrics and the detected drifts
+    """
+    index, job = indexed_job
+    metrics, drifts = job.execute()
+    return index, metrics, drifts
+
+
+class ParallelExecutor:
+    """
+    ParallelExecutor executes independent jobs on a pool of worker processes. Workers only compute the results of
+    their jobs. All results are sent back to the main process, which is the only process writing to the experiment
+    logs. Hence, rows of concurrently running jobs never interleave in the result files.
+    """
+
+    def __init__(self, n_workers: int, n_threads_per_worker: Optional[int] = 1):
+        """
+        Init a new ParallelExecutor.
+
+        :param n_workers: the number of worker processes
+        :param n_threads_per_worker: the number of threads native libraries may use in each worker, None to keep the
+            libraries' defaults. Defaults to 1
+        """
+        if n_workers < 1:
+            raise ValueError(f"The number of workers must be at least 1 but is {n_workers}")
+        self.n_workers = n_workers
+        self.n_threads_per_worker = n_threads_per_worker
+
+    def run(self, jobs: Iterable[Job], verbose=False):
+        """
+        Execute all jobs and log their results as soon as they finish. The order of the logged rows therefore depends
+        on the order in which jobs finish.
+
+        :param jobs: the jobs
+        :param verbose: True if each finished job shall be printed, else False
+        """
+        jobs = list(jobs)
+        with multiprocessing.Pool(
+            processes=self.n_workers,
+            initializer=_init_worker,
+            initargs=(self.n_threads_per_worker,),
+        ) as pool:
+            for index, metrics, drifts in pool.imap_unordered(_execute, enumerate(jobs)):
+                job = jobs[index]
+                if verbose:
+                    print(f"{job.logger.stream_name} - {job.logger.model}: {job.config}")
+                job.logger.log(job.config, metrics, drifts)
@@ -1,6 +1,9 @@
 import csv
 import os.path
+from collections import Counter
+from typing import Tuple
 
+from detectors.instrumentation import Instrumentation
 from metrics.metrics import ExperimentResult
 
 
@@ -9,7 +12,7 @@ class ExperimentLogger:
     ExperimentLogger logs the results of each tested configuration by storing the configuration, the metrics and the
     detected drifts in a file named after the tested detector in a folder named after the used data stream.
     """
-    def __init__(self, stream, model, experiment_name, config_keys):
+    def __init__(self, stream, model, experiment_name, config_keys, resume=False, log_instrumentation=False):
         """
         Init a new ExperimentLogger.
 
@@ -17,11 +20,17 @@ class ExperimentLogger:
         :param model: the detector under test
         :param experiment_name: the name of the file
         :param config_keys: the names of the model's configuration parameters
+        :param resume: True if an existing log of an interrupted experiment shall be continued, else False
+        :param log_instrumentation: True if the records of the detector's instrumentation shall be logged in
+            additional columns, else False
         """
         self.stream = stream
         self.stream_name = stream.__class__.__name__
         self.model = model
         self.experiment_name = experiment_name
+        self.config_keys = config_keys
+        self.resume = resume
+        self.log_instrumentation = log_instrumentation
         self.file_name = f"{model}_{experiment_name}.csv"
         self.path = os.path.join("results", self.stream_name)
         self.full_path = os.path.join(self.path, self.file_name)
@@ -39,19 +48,83 @@ class ExperimentLogger:
         ]
         if hasattr(stream, "drifts"):
             self.columns += ["mtr", "mtfa", "mtd", "mdr"]
+        if log_instrumentation:
+            self.columns += Instrumentation.keys
         self.columns.append("drifts")
         self._create_log()
 
     def _create_log(self):
         """
         Create a new log if it doesn't exist in 'results/<data stream>/<detector name>_<experiment_name>.csv'.
+
+        :raise: ValueError if the log exists, but its header does not match the columns, e.g., because it was written
+            with a different log_instrumentation setting
         """
         if not os.path.exists(self.path):
             os.makedirs(self.path)
-        if not os.path.exists(self.full_path):
+        header = self._read_header() if os.path.exists(self.full_path) else None
+        if header is None:
             with open(self.full_path, "w") as csvfile:
                 writer = csv.DictWriter(csvfile, fieldnames=self.columns)
                 writer.writeheader()
+        else:
+            if header != self.columns:
+                raise ValueError(
+                    f"The columns of the existing log {self.full_path} do not match the logged columns, "
+                    f"{header} != {self.columns}. Log with the same settings or to a new experiment."
+                )
+            if self.resume:
+                self._remove_incomplete_row()
+
+    def _read_header(self):
+        """
+        Read the header of the existing log.
+
+        :return: the column names or None if the log is empty
+        """
+        with open(self.full_path, newline="") as csvfile:
+            return next(csv.reader(csvfile), None)
+
+    def _remove_incomplete_row(self):
+        """
+        Remove the last row of the log if it was not written completely, e.g., because the experiment was killed while
+        writing it. The configuration of the incomplete row is then not considered completed and executed again.
+        """
+        with open(self.full_path, "rb+") as csvfile:
+            content = csvfile.read()
+            if len(content) > 0 and not content.endswith(b"\n"):
+                csvfile.truncate(content.rfind(b"\n") + 1)
+
+    def get_config_key(self, config, include_seed: bool) -> Tuple[Tuple[str, str], ...]:
+        """
+        Get a key identifying the given configuration in the log. Values are converted to strings the same way the csv
+        module writes them.
+
+        :param config: the configuration, either as passed to log or as read from the log
+        :param include_seed: True if the seed identifies the configuration, else False
+        :return: the key
+        """
+        return tuple(
+            (name, "" if config[name] is None else str(config[name]))
+            for name in self.config_keys
+            if include_seed or name != "seed"
+        )
+
+    def get_completed_runs(self, include_seed: bool) -> Counter:
+        """
+        Count how often each configuration was logged already.
+
+        :param include_seed: True if the seed identifies the configuration, else False
+        :return: a counter mapping the key of each configuration to the number of its logged runs
+        """
+        completed_runs = Counter()
+        with open(self.full_path, newline="") as csvfile:
+            for row in csv.DictReader(csvfile):
+                if None in row or None in row.values():
+                    # rows with missing or surplus fields are not complete
+                    continue
+                completed_runs[self.get_config_key(row, include_seed)] += 1
+        return completed_runs
 
     def log(self, config, results: ExperimentResult, drifts):
         """
@@ -65,6 +138,8 @@ class ExperimentLogger:
             **results.to_dict(hasattr(self.stream, "drifts")),
             "drifts": drifts,
         }
+        if self.log_instrumentation and results.instrumentation is not None:
+            row.update(results.instrumentation)
         with open(self.full_path, "a") as csvfile:
             writer = csv.DictWriter(csvfile, fieldnames=self.columns)
             writer.writerow(row)
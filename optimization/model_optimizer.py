@@ -1,10 +1,120 @@
-from typing import List, Optional
+import warnings
+from dataclasses import dataclass
+from typing import Any, List, Optional
 
-from metrics.metrics import get_metrics
-from .classifiers import Classifiers
+from metrics.metrics import ExperimentResult, get_metrics
+from .baseline import get_baseline
 from .config_generator import ConfigGenerator
+from .drift_cache import DriftCache, get_stream_fingerprint
 from .logger import ExperimentLogger
 from .parameter import Parameter
+from .segments import get_confusion_matrices
+
+
+@dataclass
+class Job:
+    """
+    This data class describes a single run of a single configuration of a detector on a data stream. Jobs are
+    independent of each other and may be executed in any order and in any process. The logger is only used by the
+    process collecting the results.
+    """
+    stream: Any
+    base_model: callable
+    config: dict
+    n_training_samples: int
+    logger: ExperimentLogger
+    drift_cache: Optional[DriftCache] = None
+    instrument: bool = False
+
+    def execute(self) -> (ExperimentResult, List[int]):
+        """
+        Init the detector with the job's configuration and evaluate it on the job's data stream. If the job has a drift
+        cache, the detector is only run if its drifts are not cached yet. The data stream's fingerprint addressing the
+        cache is taken before the detector iterates the data stream, which may change the data stream's attributes. If
+        the job is instrumented, the records of the detector's instrumentation are added to the metrics, unless the
+        drifts were cached.
+
+        :return: the metrics and the detected drifts
+        """
+        model_name = self.base_model.__name__
+        drifts = None
+        stream_fingerprint = None
+        if self.drift_cache is not None:
+            stream_fingerprint = get_stream_fingerprint(self.stream)
+            drifts = self.drift_cache.get(stream_fingerprint, model_name, self.config)
+        instrumentation = None
+        if drifts is None:
+            model = self.base_model(**self.config)
+            if self.instrument:
+                model.enable_instrumentation()
+            drifts = detect(model, self.stream)
+            if self.instrument:
+                instrumentation = model.get_instrumentation_snapshot()
+            if self.drift_cache is not None:
+                self.drift_cache.put(stream_fingerprint, model_name, self.config, drifts)
+        metrics = score(drifts, self.stream, self.n_training_samples)
+        if self.instrument:
+            metrics.instrumentation = instrumentation
+        return metrics, drifts
+
+
+def evaluate(model, stream, n_training_samples) -> (ExperimentResult, List[int]):
+    """
+    Evaluate the initialized model on the given data stream in two phases: first, only the model is run on the data
+    stream to detect drifts. Second, the classifiers are evaluated on the data stream with and without the detected
+    drifts.
+
+    :param model: the initialized detector under test
+    :param stream: the data stream
+    :param n_training_samples: the number of training samples of the classifiers operating without the detector
+    :return: the metrics and the detected drifts
+    """
+    drifts = detect(model, stream)
+    return score(drifts, stream, n_training_samples), drifts
+
+
+def detect(model, stream) -> List[int]:
+    """
+    Run the initialized model on the given data stream without any classifiers. If the data stream can be
+    materialized, the model is updated with blocks of its feature matrix, else with each sample's features.
+
+    :param model: the initialized detector under test
+    :param stream: the data stream
+    :return: the detected drifts
+    """
+    cache = stream.materialize() if hasattr(stream, "materialize") else None
+    drifts = []
+    if cache is None:
+        for i, (x, _) in enumerate(stream):
+            if model.update(x):
+                drifts.append(i)
+    else:
+        for start in range(0, len(cache), cache.block_size):
+            block_drifts = model.update_batch(cache.features[start: start + cache.block_size])
+            drifts.extend((start + block_drifts).tolist())
+    return drifts
+
+
+def score(drifts: List[int], stream, n_training_samples) -> ExperimentResult:
+    """
+    Compute the metrics of the given drifts by operating classifiers with and without the drifts. The classifiers
+    operating with the drifts are reset at each drift and are evaluated segment by segment, reusing segments evaluated
+    for other drifts. The classifiers operating without the drifts do not depend on the drifts and are therefore
+    retrieved from the baseline cache.
+
+    :param drifts: the detected drifts
+    :param stream: the data stream
+    :param n_training_samples: the number of training samples of the classifiers operating without the detector
+    :return: the metrics
+    """
+    baseline = get_baseline(stream, n_training_samples)
+    confusion_matrices = get_confusion_matrices(stream, drifts, n_samples=baseline.n_samples)
+    return get_metrics(
+        stream,
+        drifts,
+        accuracies=list(baseline.accuracies) + [matrix.accuracy() for matrix in confusion_matrices],
+        f1_scores=list(baseline.f1_scores) + [matrix.f1_score() for matrix in confusion_matrices],
+    )
 
 
 class ModelOptimizer:
@@ -25,50 +135,87 @@ class ModelOptimizer:
         """
         self.base_model = base_model
         self.configs = ConfigGenerator(parameters, seeds=seeds)
-        self.classifiers = None
         self.n_runs = n_runs
 
-    def _model_generator(self):
+    def jobs(self, stream, experiment_name, n_training_samples, resume=False, drift_cache=None, instrument=False):
         """
-        A generator that yields initialized models using configurations provided by the ConfigGenerator.
-
-        :return: the initialized models
-        """
-        for config in self.configs:
-            yield self.base_model(**config), config
-
-    def optimize(self, stream, experiment_name, n_training_samples, verbose=False):
-        """
-        Optimize the model on the given data stream and log the results using the ExperimentLogger.
+        A generator that expands all runs of all configurations on the given data stream into independent jobs. When
+        resuming an experiment, runs of configurations already found in the experiment's log are skipped. If the seeds
+        are generated from the time, configurations are identified by all parameters but the seed, else by all
+        parameters including the seed. The drift cache is only used if seeds are provided, since seeds generated from
+        the time never repeat. A warning is issued if a drift cache is given, but disabled for this reason.
 
         :param stream: the data stream
         :param experiment_name: the name of the experiment
         :param n_training_samples: the number of training samples
+        :param resume: True if runs already logged shall be skipped, else False
+        :param drift_cache: the DriftCache storing the detected drifts or None
+        :param instrument: True if the detectors' instrumentation shall be enabled and logged, else False
+        :return: the jobs
         """
+        if self.configs.seeds is None and drift_cache is not None:
+            warnings.warn(
+                f"The drift cache is disabled for {self.base_model.__name__}, since its configurations do not use fixed "
+                f"seeds. Provide seeds to cache its drifts."
+            )
+            drift_cache = None
+        completed_runs = None
         for run in range(self.n_runs):
             logger = ExperimentLogger(
                 stream=stream,
                 model=self.base_model.__name__,
                 experiment_name=experiment_name,
                 config_keys=self.configs.get_parameter_names(),
+                resume=resume,
+                log_instrumentation=instrument,
             )
-            for model, config in self._model_generator():
-                if verbose:
-                    print(f"{logger.model}: {config}")
-                self.classifiers = Classifiers()
-                drifts = []
-                labels = []
-                predictions = []
-                train_steps = 0
-                for i, (x, y) in enumerate(stream):
-                    if i != 0:
-                        predictions.append(self.classifiers.predict(x))
-                        labels.append(y)
-                    if model.update(x):
-                        drifts.append(i)
-                        self.classifiers.reset()
-                        train_steps = 0
-                    self.classifiers.fit(x, y, nonadaptive=i < n_training_samples)
-                    train_steps += 1
-                metrics = get_metrics(stream, drifts, labels, predictions)
-                logger.log(config, metrics, drifts)
+            if resume and completed_runs is None:
+                completed_runs = logger.get_completed_runs(include_seed=self.configs.seeds is not None)
+            for config in self.configs:
+                if resume:
+                    key = logger.get_config_key(config, include_seed=self.configs.seeds is not None)
+                    if completed_runs[key] > run:
+                        continue
+                yield Job(
+                    stream=stream,
+                    base_model=self.base_model,
+                    config=config,
+                    n_training_samples=n_training_samples,
+                    logger=logger,
+                    drift_cache=drift_cache,
+                    instrument=instrument,
+                )
+
+    def optimize(
+        self,
+        stream,
+        experiment_name,
+        n_training_samples,
+        verbose=False,
+        resume=False,
+        drift_cache=None,
+        instrument=False,
+    ):
+        """
+        Optimize the model on the given data stream and log the results using the ExperimentLogger.
+
+        :param stream: the data stream
+        :param experiment_name: the name of the experiment
+        :param n_training_samples: the number of training samples
+        :param resume: True if runs already logged by an interrupted experiment shall be skipped, else False
+        :param drift_cache: the DriftCache storing the detected drifts or None
+        :param instrument: True if the detectors' instrumentation shall be enabled and logged, else False
+        """
+        jobs = self.jobs(
+            stream,
+            experiment_name,
+            n_training_samples,
+            resume=resume,
+            drift_cache=drift_cache,
+            instrument=instrument,
+        )
+        for job in jobs:
+            if verbose:
+                print(f"{job.logger.model}: {job.config}")
+            metrics, drifts = job.execute()
+            job.logger.log(job.config, metrics, drifts)
@@ -0,0 +1,84 @@
+"""
+This module provides the evaluation of classifiers assisted by a concept drift detector. The assisted classifiers are
+reset at each detected drift, so their predictions between two consecutive drifts, i.e., in a segment, only depend on
+the segment's start and end and never on the detector or configuration that detected the drifts. Therefore, the
+confusion matrices of each segment are computed once per data stream and cached afterwards. Only the segments of the
+most recently evaluated data stream are cached, so that the cache does not grow with the number of data streams.
+"""
+from typing import Dict, List, Optional, Tuple
+
+from metrics.confusion_matrix import ConfusionMatrix
+from .baseline import get_stream_key
+from .classifiers import Classifiers
+
+_stream_key: Optional[str] = None
+_segments: Dict[Tuple[int, int], List[ConfusionMatrix]] = {}
+
+
+def get_segments(drifts: List[int], n_samples: int) -> List[Tuple[int, int]]:
+    """
+    Split a data stream into segments at the given drifts. The assisted classifiers are trained from the start of a
+    segment on and predict all samples after the start up to and including the end of the segment.
+
+    :param drifts: the detected drifts
+    :param n_samples: the number of samples of the data stream
+    :return: the start and end of each segment containing at least one prediction
+    """
+    starts = sorted({0, *(drift for drift in drifts if 0 <= drift < n_samples)})
+    ends = starts[1:] + [n_samples - 1]
+    return [(start, end) for start, end in zip(starts, ends) if end > start]
+
+
+def get_confusion_matrices(stream, drifts: List[int], n_samples: int) -> List[ConfusionMatrix]:
+    """
+    Get the confusion matrices of the Hoeffding tree and the naive Bayes classifier that are reset at each of the given
+    drifts. Segments not cached yet are computed in a single pass over the data stream. The cached segments of any other
+    data stream are discarded.
+
+    :param stream: the data stream
+    :param drifts: the detected drifts
+    :param n_samples: the number of samples of the data stream
+    :return: the confusion matrices of the Hoeffding tree and the naive Bayes classifier
+    """
+    global _stream_key
+    stream_key = get_stream_key(stream)
+    if stream_key != _stream_key:
+        _segments.clear()
+        _stream_key = stream_key
+    segments = get_segments(drifts, n_samples)
+    missing_segments = [segment for segment in segments if segment not in _segments]
+    if len(missing_segments) > 0:
+        _compute_segments(stream, missing_segments)
+    confusion_matrices = [ConfusionMatrix(), ConfusionMatrix()]
+    for segment in segments:
+        for confusion_matrix, segment_confusion_matrix in zip(confusion_matrices, _segments[segment]):
+            confusion_matrix += segment_confusion_matrix
+    return confusion_matrices
+
+
+def _compute_segments(stream, segments: List[Tuple[int, int]]):
+    """
+    Compute the confusion matrices of the given segments and add them to the cache. The segments must be sorted and
+    must not overlap, except that a segment may start where the previous one ends.
+
+    :param stream: the data stream
+    :param segments: the start and end of each segment
+    """
+    j = 0
+    classifiers = None
+    confusion_matrices = None
+    for i, (x, y) in enumerate(stream):
+        if classifiers is not None:
+            for confusion_matrix, prediction in zip(confusion_matrices, classifiers.predict(x)):
+                confusion_matrix.update(y, prediction)
+            if i == segments[j][1]:
+                _segments[segments[j]] = confusion_matrices
+                classifiers = None
+                j += 1
+                if j == len(segments):
+                    break
+        if classifiers is None and i == segments[j][0]:
+            classifiers = Classifiers()
+            confusion_matrices = [ConfusionMatrix(), ConfusionMatrix()]
+        if classifiers is not None:
+            classifiers.fit(x, y)
@@ -1,7 +1,34 @@
 from config import Configuration
+from optimization.drift_cache import DriftCache
+from optimization.executor import ParallelExecutor
 
 
-def run(experiment_name):
-    for stream in Configuration.streams:
-        for model in Configuration.models:
-            model.optimize(stream, experiment_name, Configuration.n_training_samples, verbose=True)
+def run(experiment_name, n_workers=1, resume=False, cache_drifts=False, instrument=False):
+    drift_cache = DriftCache() if cache_drifts else None
+    if n_workers == 1:
+        for stream in Configuration.streams:
+            for model in Configuration.models:
+                model.optimize(
+                    stream,
+                    experiment_name,
+                    Configuration.n_training_samples,
+                    verbose=True,
+                    resume=resume,
+                    drift_cache=drift_cache,
+                    instrument=instrument,
+                )
+    else:
+        jobs = (
+            job
+            for stream in Configuration.streams
+            for model in Configuration.models
+            for job in model.jobs(
+                stream,
+                experiment_name,
+                Configuration.n_training_samples,
+                resume=resume,
+                drift_cache=drift_cache,
+                instrument=instrument,
+            )
+        )
+        ParallelExecutor(n_workers).run(jobs, verbose=True)
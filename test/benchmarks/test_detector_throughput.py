@@ -0,0 +1,34 @@
+import inspect
+import unittest
+
+import detectors
+from benchmarks.detector_throughput import DETECTORS, run, summarize
+from detectors.base import UnsupervisedDriftDetector
+
+
+class DetectorThroughputTest(unittest.TestCase):
+    def test_all_detectors_registered(self):
+        detector_names = {
+            name
+            for name, member in vars(detectors).items()
+            if inspect.isclass(member) and issubclass(member, UnsupervisedDriftDetector)
+        }
+        self.assertSetEqual(detector_names, set(DETECTORS))
+
+    def test_run_and_summarize(self):
+        results = run(
+            ["ImageBasedDriftDetector", "UDetect"],
+            window_sizes=[10, 20, 100],
+            n_features=[2],
+            stream_lengths=[100],
+        )
+        self.assertEqual(4, len(results))
+        for result in results:
+            self.assertGreater(result["samples_per_second"], 0)
+        lines = summarize(results).splitlines()
+        self.assertEqual(4, len(lines))
+        self.assertIn("w=20 [1/s]", lines[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+import os
+import tempfile
+import unittest
+from os import path
+
+import numpy as np
+from river import stream
+from river.datasets import base
+
+from datasets.cache import CachedFileDataset
+
+
+class CSVDataset(CachedFileDataset):
+    def __init__(self, directory_path, converters):
+        super().__init__(
+            n_samples=0,
+            n_features=len(converters) - 1,
+            task=base.MULTI_CLF,
+            filename="data.csv",
+        )
+        self.full_path = path.join(directory_path, self.filename)
+        self.converters = converters
+        self.n_parses = []
+
+    def _iter_source(self):
+        self.n_parses.append(None)
+        return stream.iter_csv(self.full_path, target="class", converters=self.converters)
+
+
+class CachedFileDatasetTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.rng = np.random.default_rng(42)
+        self._write_csv(5000)
+
+    def _write_csv(self, n_rows):
+        with open(path.join(self.directory.name, "data.csv"), "w") as f:
+            f.write("a,b,c,class\n")
+            for _ in range(n_rows):
+                a = self.rng.random()
+                b = self.rng.integers(0, 10)
+                c = self.rng.choice(["x", "y", "z"])
+                label = self.rng.choice(["UP", "DOWN"])
+                f.write(f"{a},{b},{c},{label}\n")
+
+    def _get_dataset(self, c_converter=None):
+        if c_converter is None:
+            # nominal attributes with numeric values like the day of the week in Elec2
+            c_converter = lambda value: str(ord(value))
+        return CSVDataset(self.directory.name, {"a": float, "b": int, "c": c_converter, "class": str})
+
+    def test_missing_iter_source(self):
+        class UnparsedDataset(CachedFileDataset):
+            pass
+
+        with self.assertRaises(TypeError):
+            UnparsedDataset(n_samples=0, n_features=1, task=base.MULTI_CLF, filename="data.csv")
+
+    def test_replay_equals_source(self):
+        dataset = self._get_dataset()
+        expected = list(dataset._iter_source())
+        self.assertListEqual(expected, list(dataset))
+        self.assertListEqual(expected, list(dataset))
+        # one parse for the expected samples, one to create the cache
+        self.assertEqual(2, len(dataset.n_parses))
+        for (x, y), (expected_x, expected_y) in zip(dataset, expected):
+            self.assertIs(type(expected_x["b"]), type(x["b"]))
+            self.assertIs(type(expected_x["c"]), type(x["c"]))
+
+    def test_memory_mapped(self):
+        cache = self._get_dataset().materialize()
+        self.assertIsInstance(cache.features, np.memmap)
+        self.assertIsInstance(cache.label_codes, np.memmap)
+        self.assertListEqual(["a", "b", "c"], cache.feature_names)
+        self.assertEqual((5000, 3), cache.features.shape)
+
+    def test_arrays_equal_detector_view(self):
+        dataset = self._get_dataset()
+        for (x, y), (array, array_y) in zip(dataset._iter_source(), dataset.materialize().iter_arrays()):
+            np.testing.assert_array_equal(np.fromiter(x.values(), dtype=float), array)
+            self.assertEqual(y, array_y)
+
+    def test_rebuilt_after_change(self):
+        dataset = self._get_dataset()
+        list(dataset)
+        self._write_csv(100)
+        os.utime(dataset.full_path, ns=(0, 0))
+        self.assertEqual(100, len(list(dataset)))
+
+    def test_not_cacheable(self):
+        dataset = self._get_dataset(c_converter=str)
+        self.assertIsNone(dataset.materialize())
+        self.assertListEqual(list(dataset._iter_source()), list(dataset))
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+
+if __name__ == "__main__":
+    unittest.main()
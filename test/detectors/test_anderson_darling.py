@@ -0,0 +1,46 @@
+import unittest
+import warnings
+
+import numpy as np
+from scipy.stats import anderson_ksamp
+
+from detectors.anderson_darling import CRITICAL_VALUES, AndersonDarlingTest
+
+
+class AndersonDarlingTestTest(unittest.TestCase):
+    def setUp(self) -> None:
+        warnings.filterwarnings("ignore", category=UserWarning)
+        self.rng = np.random.default_rng(0)
+
+    def assert_statistics_equal(self, reference_data, data):
+        test = AndersonDarlingTest(reference_data)
+        expected = [
+            anderson_ksamp([reference_data[:, feature], data[:, feature]]).statistic
+            for feature in range(data.shape[1])
+        ]
+        np.testing.assert_allclose(expected, test.get_statistics(data))
+
+    def test_statistics(self):
+        for n_reference, n_recent in [(3, 1), (1, 3), (20, 20), (50, 7)]:
+            with self.subTest(n_reference=n_reference, n_recent=n_recent):
+                self.assert_statistics_equal(
+                    self.rng.normal(size=(n_reference, 3)), self.rng.normal(0.5, size=(n_recent, 3))
+                )
+
+    def test_statistics_with_ties(self):
+        reference_data = np.round(self.rng.normal(size=(40, 3)), 1)
+        self.assert_statistics_equal(reference_data, np.round(self.rng.normal(size=(30, 3)), 1))
+        self.assert_statistics_equal(reference_data, reference_data[:10])
+
+    def test_critical_values(self):
+        result = anderson_ksamp([self.rng.normal(size=10), self.rng.normal(size=10)])
+        np.testing.assert_allclose(result.critical_values, CRITICAL_VALUES)
+
+    def test_single_distinct_value(self):
+        test = AndersonDarlingTest(np.ones((5, 2)))
+        with self.assertRaises(ValueError):
+            test.get_statistics(np.hstack((np.ones((3, 1)), np.arange(3)[:, np.newaxis])))
+
+
+if __name__ == "__main__":
+    unittest.main()
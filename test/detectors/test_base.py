@@ -0,0 +1,70 @@
+import unittest
+
+import numpy as np
+
+from detectors import (
+    BayesianNonparametricDetectionMethod,
+    ClusteredStatisticalTestDriftDetectionMethod,
+    DiscriminativeDriftDetector2019,
+    EDFS,
+    ImageBasedDriftDetector,
+    NNDVI,
+    OneClassDriftDetector,
+    SemiParametricLogLikelihood,
+    UCDD,
+    UDetect,
+)
+
+
+def get_detectors():
+    return [
+        BayesianNonparametricDetectionMethod(n_samples=20, seed=1),
+        ClusteredStatisticalTestDriftDetectionMethod(n_samples=20, n_clusters=2, feature_proportion=0.5, seed=2),
+        DiscriminativeDriftDetector2019(n_reference_samples=30, recent_samples_proportion=0.5, seed=3),
+        EDFS(n_subspaces=3, feature_percentage=0.5, window_size=20, alpha=0.05, seed=4),
+        ImageBasedDriftDetector(n_samples=20, update_interval=5, n_permutations=10, seed=5),
+        NNDVI(n_samples=20, k_neighbors=3, n_permutations=20, seed=6),
+        OneClassDriftDetector(n_samples=20, seed=7),
+        SemiParametricLogLikelihood(n_samples=20, n_clusters=2, threshold=0.1, seed=8),
+        UCDD(n_reference_samples=20, n_recent_samples=20, seed=9),
+        UDetect(n_windows=3, n_samples=10, seed=10),
+    ]
+
+
+class BatchUpdateTest(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(42)
+        self.data = np.concatenate(
+            [rng.normal(0, 1, size=(150, 4)), rng.normal(3, 1, size=(150, 4)), rng.normal(-2, 2, size=(150, 4))]
+        )
+        self.rng = rng
+
+    def _get_dict_drifts(self, detector):
+        return [i for i, x in enumerate(self.data) if detector.update(dict(enumerate(x)))]
+
+    def test_update_array_equals_update(self):
+        for expected_detector, detector in zip(get_detectors(), get_detectors()):
+            with self.subTest(detector=type(detector).__name__):
+                expected = self._get_dict_drifts(expected_detector)
+                drifts = [i for i, x in enumerate(self.data) if detector.update_array(x.copy())]
+                self.assertListEqual(expected, drifts)
+
+    def test_update_batch_equals_update(self):
+        for expected_detector, detector in zip(get_detectors(), get_detectors()):
+            with self.subTest(detector=type(detector).__name__):
+                expected = self._get_dict_drifts(expected_detector)
+                splits = np.sort(self.rng.choice(np.arange(1, len(self.data)), size=15, replace=False))
+                drifts = []
+                for start, block in zip([0, *splits], np.split(self.data, splits)):
+                    drifts.extend(start + detector.update_batch(block))
+                self.assertListEqual(expected, drifts)
+
+    def test_update_batch_single_block(self):
+        for expected_detector, detector in zip(get_detectors(), get_detectors()):
+            with self.subTest(detector=type(detector).__name__):
+                expected = self._get_dict_drifts(expected_detector)
+                self.assertListEqual(expected, detector.update_batch(self.data).tolist())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,11 +2,60 @@ import unittest
 
 import numpy as np
 from scipy import stats
+from scipy.special import betaln
 
 from detectors import BayesianNonparametricDetectionMethod
 from test.detectors.helper import get_simple_stream_drifts
 
 
+def polya_tree_test(bndm, sample_one, sample_two, level, partition=""):
+    """
+    Perform the Polya tree two-sample test of one feature recursively, as reference for the vectorized test of BNDM.
+    """
+    if level > bndm.max_depth:
+        return 0
+    partition_left = partition + "0"
+    partition_right = partition + "1"
+    n_one_left, n_two_left = get_interval_count(bndm, sample_one, sample_two, partition_left)
+    n_one_right, n_two_right = get_interval_count(bndm, sample_one, sample_two, partition_right)
+    n_left = n_one_left + n_two_left
+    n_right = n_one_right + n_two_right
+    if n_one_left + n_one_right == 0 or n_two_left + n_two_right == 0:
+        return 0
+
+    alpha = bndm.const * (level + 1) ** 2
+    contribution_num = -betaln(alpha, alpha) + betaln(alpha + n_left, alpha + n_right)
+    contribution_den = (
+        -2 * betaln(alpha, alpha)
+        + betaln(alpha + n_one_left, alpha + n_one_right)
+        + betaln(alpha + n_two_left, alpha + n_two_right)
+    )
+    contribution = contribution_num - contribution_den
+    contribution_left = polya_tree_test(bndm, sample_one, sample_two, level + 1, partition_left)
+    contribution_right = polya_tree_test(bndm, sample_one, sample_two, level + 1, partition_right)
+    return contribution + contribution_left + contribution_right
+
+
+def get_interval_count(bndm, sample_one, sample_two, partition):
+    interval = get_interval(bndm, partition)
+    n_one = np.sum((sample_one > interval[0]) & (sample_one <= interval[1]))
+    n_two = np.sum((sample_two > interval[0]) & (sample_two <= interval[1]))
+    return n_one, n_two
+
+
+def get_interval(bndm, partition):
+    partition_index = int(partition, 2)
+    level = len(partition)
+    quantile_start = partition_index / 2 ** level
+    quantile_end = (partition_index + 1) / 2 ** level
+    return bndm.distribution.ppf([quantile_start, quantile_end])
+
+
+def get_samples(bndm, feature_index):
+    data = bndm._normalize(np.asarray(bndm.data_window))
+    return data[: bndm.n_samples, feature_index], data[bndm.n_samples:, feature_index]
+
+
 class PolyaTreeTestTest(unittest.TestCase):
     def setUp(self) -> None:
         self.bndm = BayesianNonparametricDetectionMethod(10)
@@ -26,43 +75,58 @@ class PolyaTreeTestTest(unittest.TestCase):
 
     def test_polya_tree_test_no_overlap(self):
         array_one, array_two = self.normalize(np.zeros(10), np.zeros(10) + 100)
-        log_odd_ratios = self.bndm.polya_tree_test(array_one, array_two, 0, "")
+        log_odd_ratios = polya_tree_test(self.bndm, array_one, array_two, 0, "")
         test_statistic = 1 / (1 + np.exp(-log_odd_ratios))
         self.assertAlmostEqual(0, test_statistic, places=4)
 
     def test_polya_tree_test_full_overlap(self):
         array_one, array_two = self.normalize(np.arange(10), np.arange(10))
-        log_odd_ratios = self.bndm.polya_tree_test(array_one, array_two, 0, "")
+        log_odd_ratios = polya_tree_test(self.bndm, array_one, array_two, 0, "")
         test_statistic = 1 / (1 + np.exp(-log_odd_ratios))
         self.assertTrue(test_statistic > 0.5)
 
+    def test_log_odd_ratios(self):
+        rng = np.random.default_rng(11)
+        sample_one = rng.normal(size=(30, 4))
+        sample_two = rng.normal(size=(30, 4)) * [1, 2, 0.1, 1] + [0, 0, 0, 3]
+        log_odd_ratios = self.bndm._get_log_odd_ratios(sample_one, sample_two)
+        for i in range(4):
+            self.assertAlmostEqual(
+                polya_tree_test(self.bndm, sample_one[:, i], sample_two[:, i], 0), log_odd_ratios[i]
+            )
+
 
 class GetIntervalTest(unittest.TestCase):
     def setUp(self) -> None:
         self.bndm = BayesianNonparametricDetectionMethod(0)
 
     def test_initial_partitions(self):
-        lower, upper = self.bndm._get_interval("0")
+        lower, upper = get_interval(self.bndm, "0")
         self.assertEqual(-np.inf, lower)
         self.assertEqual(0, upper)
-        lower, upper = self.bndm._get_interval("1")
+        lower, upper = get_interval(self.bndm, "1")
         self.assertEqual(0, lower)
         self.assertEqual(np.inf, upper)
 
     def test_second_level_partitions(self):
-        lower, upper = self.bndm._get_interval("00")
+        lower, upper = get_interval(self.bndm, "00")
         self.assertAlmostEqual(-np.inf, lower)
         self.assertAlmostEqual(-0.6745, upper, places=4)
-        lower, upper = self.bndm._get_interval("01")
+        lower, upper = get_interval(self.bndm, "01")
         self.assertAlmostEqual(-0.6745, lower, places=4)
         self.assertAlmostEqual(0, upper)
-        lower, upper = self.bndm._get_interval("10")
+        lower, upper = get_interval(self.bndm, "10")
         self.assertAlmostEqual(0, lower)
         self.assertAlmostEqual(0.6745, upper, places=4)
-        lower, upper = self.bndm._get_interval("11")
+        lower, upper = get_interval(self.bndm, "11")
         self.assertAlmostEqual(0.6745, lower, places=4)
         self.assertAlmostEqual(np.inf, upper)
 
+    def test_boundaries(self):
+        bndm = BayesianNonparametricDetectionMethod(0, max_depth=2)
+        upper_bounds = [get_interval(bndm, format(i, "03b"))[1] for i in range(7)]
+        self.assertTrue(np.allclose(upper_bounds, bndm.boundaries))
+
 
 class GetSamplesTest(unittest.TestCase):
     def setUp(self) -> None:
@@ -82,7 +146,7 @@ class GetSamplesTest(unittest.TestCase):
         self.bndm.data_window = np.concatenate(
             (sample_one_exp, sample_two_exp)
         ).reshape((20, 1))
-        sample_one, sample_two = self.bndm._get_samples(0)
+        sample_one, sample_two = get_samples(self.bndm, 0)
         self.assertAlmostEqual(0, sum(sample_one - sample_one_exp))
         self.assertAlmostEqual(0, sum(sample_two - sample_two_exp))
 
@@ -96,7 +160,7 @@ class GetSamplesTest(unittest.TestCase):
             self.bndm.data_window = np.concatenate(
                 (sample_one_exp, sample_two_exp)
             ).reshape((20, 2))
-            sample_one, sample_two = self.bndm._get_samples(i)
+            sample_one, sample_two = get_samples(self.bndm, i)
             self.assertTrue(np.array_equal(sample_one_result, sample_one))
             self.assertTrue(np.array_equal(sample_two_result, sample_two))
 
@@ -1,6 +1,8 @@
 import unittest
 import warnings
 
+import numpy as np
+
 from detectors import ClusteredStatisticalTestDriftDetectionMethod
 from test.detectors.helper import get_simple_stream_drifts
 
@@ -18,6 +20,19 @@ class CSDDMTest(unittest.TestCase):
         self.assertEqual(1, sum(drifts))
         self.assertEqual(1, sum(drifts[50:70]))
 
+    def test_recent_data_in_clusters(self):
+        detector = ClusteredStatisticalTestDriftDetectionMethod(n_samples=50, n_clusters=3, seed=0)
+        rng = np.random.default_rng(0)
+        detector.update_batch(rng.normal(size=(50, 10)))
+        detector.update_batch(rng.normal(size=(30, 10)))
+        for features in rng.normal(size=(40, 10)):
+            detector.update_array(features)
+        transformed_data = detector.pca.transform(detector.recent_data.view())
+        clusters = detector.kmeans.predict(transformed_data)
+        self.assertEqual(clusters.tolist(), list(detector.recent_clusters))
+        for i, window in enumerate(detector.recent_data_in_clusters):
+            np.testing.assert_allclose(transformed_data[clusters == i], window.view())
+
 
 if __name__ == "__main__":
     unittest.main()
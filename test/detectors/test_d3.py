@@ -1,7 +1,12 @@
 import unittest
 import warnings
 
+import numpy as np
+from sklearn.linear_model import LogisticRegression
+from sklearn.metrics import roc_auc_score
+
 from detectors import DiscriminativeDriftDetector2019
+from detectors.d3 import fit_logistic_regression, get_auc_score
 from test.detectors.helper import get_simple_stream_drifts
 
 
@@ -18,6 +23,29 @@ class D3Test(unittest.TestCase):
         self.assertEqual(1, sum(drifts))
         self.assertEqual(1, sum(drifts[50:70]))
 
+    def test_warm_start_detection(self):
+        detector = DiscriminativeDriftDetector2019(n_reference_samples=10, recent_samples_proportion=1, warm_start=True)
+        drifts = get_simple_stream_drifts(detector)
+        self.assertEqual(1, sum(drifts))
+        self.assertEqual(1, sum(drifts[50:70]))
+
+    def test_auc_score(self):
+        rng = np.random.default_rng(0)
+        labels = np.repeat([0, 1], [30, 20])
+        # rounding yields ties
+        predictions = np.round(rng.random(50), 1)
+        self.assertAlmostEqual(roc_auc_score(labels, predictions), get_auc_score(labels, predictions))
+
+    def test_fit_logistic_regression(self):
+        rng = np.random.default_rng(0)
+        data = rng.normal(size=(60, 4))
+        labels = (data[:, 0] + rng.normal(size=60) > 0).astype(float)
+        discriminator = LogisticRegression(solver="liblinear", tol=1e-10).fit(data, labels)
+        expected = np.append(discriminator.coef_[0], discriminator.intercept_)
+        data = np.hstack((data, np.ones((60, 1))))
+        np.testing.assert_allclose(expected, fit_logistic_regression(data, labels), atol=1e-6)
+        np.testing.assert_allclose(expected, fit_logistic_regression(data, labels, 10 * np.ones(5)), atol=1e-6)
+
 
 if __name__ == "__main__":
     unittest.main()
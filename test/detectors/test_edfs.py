@@ -44,6 +44,15 @@ class ResetTest(unittest.TestCase):
             for subspace in edfs.subspaces:
                 self.assertEqual(len(subspace), n_features)
 
+    def test_shared_detectors(self):
+        edfs = EDFS(10, 0.3, seed=0)
+        edfs.reset({f"{i}": i for i in range(10)})
+        features = set().union(*(subspace.tolist() for subspace in edfs.subspaces))
+        self.assertEqual(sorted(features), edfs.features.tolist())
+        self.assertEqual(len(features), len(edfs.detectors))
+        for subspace, memberships in zip(edfs.subspaces, edfs.memberships):
+            self.assertEqual(sorted(subspace.tolist()), edfs.features[memberships].tolist())
+
 
 class UpdateTest(unittest.TestCase):
     def test_update_no_drift(self):
@@ -1,5 +1,7 @@
 import unittest
 
+import numpy as np
+
 from detectors import ImageBasedDriftDetector
 from test.detectors.helper import get_simple_stream_drifts
 
@@ -16,6 +18,14 @@ class IBDDTest(unittest.TestCase):
         self.assertEqual(3, sum(drifts))
         self.assertEqual(3, sum(drifts[50:70]))
 
+    def test_mean_squared_deviation(self):
+        data = np.random.default_rng(4).normal(loc=100, size=(80, 3))
+        self.detector.update_batch(data[:10])
+        for i in range(10, 80):
+            self.detector.recent_data.append(data[i])
+            expected = np.mean((data[:10] - data[i - 9: i + 1]) ** 2)
+            self.assertAlmostEqual(expected, self.detector._update_mean_squared_deviation())
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,35 @@
+import unittest
+
+import numpy as np
+
+from detectors.instrumentation import Instrumentation
+from test.detectors.test_base import get_detectors
+
+
+class InstrumentationTest(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(42)
+        self.data = np.concatenate([rng.normal(0, 1, size=(150, 4)), rng.normal(3, 1, size=(150, 4))])
+
+    def test_disabled_by_default(self):
+        for detector in get_detectors():
+            with self.subTest(detector=type(detector).__name__):
+                detector.update_batch(self.data)
+                self.assertIsNone(detector.get_instrumentation_snapshot())
+
+    def test_snapshot(self):
+        for expected_detector, detector in zip(get_detectors(), get_detectors()):
+            with self.subTest(detector=type(detector).__name__):
+                detector.enable_instrumentation()
+                drifts = detector.update_batch(self.data)
+                np.testing.assert_array_equal(expected_detector.update_batch(self.data), drifts)
+                snapshot = detector.get_instrumentation_snapshot()
+                self.assertListEqual(Instrumentation.keys, list(snapshot))
+                self.assertGreater(snapshot["n test"], 0)
+                self.assertGreater(snapshot["time (test)"], 0)
+                self.assertGreaterEqual(snapshot["n buffer"], 1)
+                self.assertIsInstance(snapshot["window occupancy"], int)
+
+
+if __name__ == "__main__":
+    unittest.main()
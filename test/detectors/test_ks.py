@@ -0,0 +1,59 @@
+import unittest
+from collections import deque
+
+import numpy as np
+from scipy.stats import ks_2samp
+
+from detectors.ks import KolmogorovSmirnovDriftDetector, get_critical_distance
+
+
+def get_expected_drifts(values, window_size, threshold, reset_after_drift):
+    reference_data = deque(maxlen=window_size)
+    recent_data = deque(maxlen=window_size)
+    drifts = []
+    for i, value in enumerate(values):
+        if len(recent_data) == window_size:
+            reference_data.append(recent_data[0])
+        recent_data.append(value)
+        if len(reference_data) == window_size:
+            statistic, p_value = ks_2samp(reference_data, recent_data)
+            if p_value < threshold and statistic > 0.1:
+                drifts.append(i)
+                if reset_after_drift:
+                    reference_data = recent_data
+                    recent_data = deque(maxlen=window_size)
+    return drifts
+
+
+class KolmogorovSmirnovDriftDetectorTest(unittest.TestCase):
+    def setUp(self) -> None:
+        rng = np.random.default_rng(21)
+        # rounding yields ties within and across the windows
+        self.values = np.round(np.concatenate((rng.normal(size=300), rng.normal(1, size=300))), 1)
+
+    def test_drifts(self):
+        for reset_after_drift in [False, True]:
+            with self.subTest(reset_after_drift=reset_after_drift):
+                detector = KolmogorovSmirnovDriftDetector(30, 0.01, reset_after_drift)
+                drifts = [i for i, value in enumerate(self.values) if detector.update(value)]
+                self.assertLess(0, len(drifts))
+                self.assertEqual(get_expected_drifts(self.values, 30, 0.01, reset_after_drift), drifts)
+
+    def test_sorted_data(self):
+        detector = KolmogorovSmirnovDriftDetector(30, 0.01)
+        detector._buffer(self.values[:40].tolist())
+        for value in self.values[40:100]:
+            detector.update(value)
+        np.testing.assert_array_equal(np.sort(detector.reference_data), detector.sorted_reference_data)
+        np.testing.assert_array_equal(np.sort(detector.recent_data), detector.sorted_recent_data)
+
+    def test_critical_distance(self):
+        distance = get_critical_distance(50, 0.05)
+        sample = np.arange(50)
+        self.assertLess(ks_2samp(sample, sample + distance).pvalue, 0.05)
+        self.assertGreaterEqual(ks_2samp(sample, sample + distance - 1).pvalue, 0.05)
+        self.assertEqual(51, get_critical_distance(50, 0.0))
+
+
+if __name__ == "__main__":
+    unittest.main()
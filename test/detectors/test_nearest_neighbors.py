@@ -0,0 +1,23 @@
+import unittest
+
+import numpy as np
+
+from detectors.nearest_neighbors import NearestNeighborGraph
+
+
+class NearestNeighborGraphTest(unittest.TestCase):
+    def test_replace(self):
+        rng = np.random.default_rng(3)
+        graph = NearestNeighborGraph(rng.normal(size=(40, 3)), n_neighbors=5)
+        for i in range(100):
+            graph.replace(int(rng.integers(40)), rng.normal(size=3))
+            distances = np.linalg.norm(graph.data[:, np.newaxis] - graph.data[np.newaxis], axis=2)
+            expected = np.sort(np.argsort(distances, axis=1)[:, :5], axis=1)
+            np.testing.assert_array_equal(expected, np.sort(graph.neighbors, axis=1))
+            np.testing.assert_allclose(
+                np.take_along_axis(distances, graph.neighbors, axis=1), graph.distances, atol=1e-12
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
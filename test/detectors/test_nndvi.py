@@ -20,6 +20,25 @@ class NNDVITest(unittest.TestCase):
         self.assertEqual(1, sum(drifts[50:70]))
 
 
+    def test_incremental_detection(self):
+        detector = NNDVI(n_samples=10, k_neighbors=3, n_permutations=50, incremental=True, seed=128)
+        drifts = get_simple_random_stream_drifts(detector, seed=723)
+        self.assertEqual(1, sum(drifts))
+        self.assertEqual(1, sum(drifts[50:70]))
+
+    def test_incremental_particle_matrix(self):
+        detector = NNDVI(n_samples=15, k_neighbors=4, incremental=True)
+        data = np.random.default_rng(2).normal(size=(60, 3))
+        detector.reference_window.extend(data[:15])
+        detector.sliding_window.extend(data[15:30])
+        for sample in data[30:]:
+            detector.sliding_window.append(sample)
+            data_set = np.concatenate((np.array(detector.reference_window), np.array(detector.sliding_window)))
+            np.testing.assert_array_equal(
+                detector._get_particle_matrix(data_set).toarray(), detector._update_particle_matrix().toarray()
+            )
+
+
 class GetDistanceTest(unittest.TestCase):
     """
     This class tests the _get_nnps_distance method of the NNDVI class.
@@ -70,6 +89,39 @@ class GetDistanceTest(unittest.TestCase):
         self.assertEqual(distance, 0)
 
 
+    def test_batched_distances(self):
+        """
+        Test that the distances of multiple partitions computed at once equal their individual distances.
+        """
+        nndvi = NNDVI(n_samples=10, k_neighbors=3, n_permutations=20, seed=5)
+        data = np.random.default_rng(5).normal(size=(20, 2))
+        particle_matrix = nndvi._get_particle_matrix(data)
+        first_sets, second_sets = nndvi._get_permutations(*nndvi._get_indices(len(data)))
+        self.assertEqual((21, 10), first_sets.shape)
+        distances = nndvi._get_nnps_distances(particle_matrix, first_sets, second_sets)
+        for distance, first_set, second_set in zip(distances, first_sets, second_sets):
+            self.assertAlmostEqual(
+                distance, nndvi._get_nnps_distance(particle_matrix.toarray(), first_set, second_set)
+            )
+
+
+class GetParticleMatrixTest(unittest.TestCase):
+    def test_particle_matrix(self):
+        nndvi = NNDVI(n_samples=3, k_neighbors=1)
+        data = np.array([[0.0], [0.1], [1.0], [1.2], [3.0], [3.5]])
+        expected = np.array(
+            [
+                [1, 1, 0, 0, 0, 0],
+                [1, 1, 0, 0, 0, 0],
+                [0, 0, 1, 1, 0, 0],
+                [0, 0, 1, 1, 0, 0],
+                [0, 0, 0, 0, 1, 1],
+                [0, 0, 0, 0, 1, 1],
+            ]
+        )
+        np.testing.assert_array_equal(expected, nndvi._get_particle_matrix(data).toarray())
+
+
 class GetIndicesTest(unittest.TestCase):
     """
     This class tests the _get_indices method of the NNDVI class.
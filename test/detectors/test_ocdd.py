@@ -1,8 +1,10 @@
 import unittest
 
+import numpy as np
 from sklearn.svm import OneClassSVM
 
 from detectors import OneClassDriftDetector
+from detectors.one_class import NystroemOneClassSVM
 from test.detectors.helper import get_simple_random_stream_drifts
 
 
@@ -21,6 +23,29 @@ class OCDDTest(unittest.TestCase):
         self.assertEqual(1, sum(drifts))
         self.assertEqual(1, sum(drifts[50:70]))
 
+    def test_update_batch(self):
+        rng = np.random.default_rng(0)
+        data = np.vstack((rng.normal(size=(300, 3)), rng.normal(1, size=(300, 3))))
+        kwargs = {"n_samples": 40, "threshold": 0.6, "outlier_detector_kwargs": {"nu": 0.3}, "batch_size": 16}
+        detector = OneClassDriftDetector(**kwargs)
+        expected = [i for i, features in enumerate(data) if detector.update_array(features)]
+        detector = OneClassDriftDetector(**kwargs)
+        self.assertLess(0, len(expected))
+        self.assertEqual(expected, detector.update_batch(data).tolist())
+        self.assertEqual(sum(detector.outliers), detector.n_outliers)
+
+    def test_nystroem_one_class_svm(self):
+        detector = OneClassDriftDetector(
+            n_samples=20,
+            threshold=0.9,
+            outlier_detector_class=NystroemOneClassSVM,
+            outlier_detector_kwargs={"nu": 0.5, "kernel": "rbf", "gamma": "auto"},
+            seed=0,
+        )
+        drifts = get_simple_random_stream_drifts(detector, seed=22)
+        self.assertEqual(1, sum(drifts))
+        self.assertEqual(1, sum(drifts[50:70]))
+
 
 if __name__ == "__main__":
     unittest.main()
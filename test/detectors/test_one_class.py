@@ -0,0 +1,40 @@
+import unittest
+
+import numpy as np
+from sklearn.svm import OneClassSVM
+
+from detectors.one_class import NystroemOneClassSVM
+
+
+class NystroemOneClassSVMTest(unittest.TestCase):
+    def setUp(self) -> None:
+        rng = np.random.default_rng(0)
+        self.data = rng.normal(size=(1000, 4))
+        self.inliers = rng.normal(size=(1000, 4))
+        self.outliers = rng.normal(3, size=(1000, 4))
+
+    def test_predict(self):
+        predictions = NystroemOneClassSVM(nu=0.2, random_state=0).fit(self.data).predict(self.inliers)
+        self.assertEqual({-1, 1}, set(predictions.tolist()))
+
+    def test_outlier_rate(self):
+        expected = OneClassSVM(nu=0.2).fit(self.data)
+        one_class_svm = NystroemOneClassSVM(nu=0.2, random_state=0).fit(self.data)
+        for data in [self.inliers, self.outliers]:
+            self.assertAlmostEqual(
+                np.mean(expected.predict(data) == -1), np.mean(one_class_svm.predict(data) == -1), delta=0.1
+            )
+
+    def test_gamma(self):
+        self.assertEqual(1 / (4 * self.data.var()), NystroemOneClassSVM()._get_gamma(self.data))
+        self.assertEqual(0.25, NystroemOneClassSVM(gamma="auto")._get_gamma(self.data))
+        self.assertEqual(0.5, NystroemOneClassSVM(gamma=0.5)._get_gamma(self.data))
+
+    def test_kernel(self):
+        self.assertEqual("rbf", NystroemOneClassSVM(kernel="rbf").kernel)
+        with self.assertRaises(ValueError):
+            NystroemOneClassSVM(kernel="linear")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,7 @@
 import unittest
 
+import numpy as np
+
 from detectors import SemiParametricLogLikelihood
 from test.detectors.helper import get_simple_random_stream_drifts
 
@@ -17,5 +19,49 @@ class SPLLTest(unittest.TestCase):
         self.assertEqual(1, sum(drifts[50:70]))
 
 
+class WarmStartTest(unittest.TestCase):
+    def test_simple_detection(self):
+        detector = SemiParametricLogLikelihood(n_samples=20, n_clusters=2, threshold=0.0005, warm_start=True)
+        drifts = get_simple_random_stream_drifts(detector, seed=33)
+        self.assertEqual(1, sum(drifts))
+        self.assertEqual(1, sum(drifts[50:70]))
+
+    def test_centroids_are_cluster_means(self):
+        detector = SemiParametricLogLikelihood(
+            n_samples=50, n_clusters=3, threshold=0.0, warm_start=True, refit_interval=40, seed=4
+        )
+        detector.update_batch(np.random.default_rng(4).normal(size=(230, 3)))
+        self.assertEqual(11, detector.n_tests_since_fit)
+        reference_data = np.array(detector.reference_data)
+        labels = np.array(detector.reference_labels)
+        for label in range(3):
+            if np.any(labels == label):
+                np.testing.assert_allclose(
+                    reference_data[labels == label].mean(axis=0), detector.cluster_centers[label]
+                )
+
+
+class IncrementalCovarianceTest(unittest.TestCase):
+    def test_simple_detection(self):
+        detector = SemiParametricLogLikelihood(
+            n_samples=20, n_clusters=2, threshold=0.0005, incremental_covariance=True
+        )
+        drifts = get_simple_random_stream_drifts(detector, seed=33)
+        self.assertEqual(1, sum(drifts))
+        self.assertEqual(1, sum(drifts[50:70]))
+
+    def test_inverse_covariance_matrix(self):
+        detector = SemiParametricLogLikelihood(
+            n_samples=50, n_clusters=2, threshold=0.0, incremental_covariance=True, refactorization_interval=1000
+        )
+        detector.update_batch(np.random.default_rng(5).normal(size=(180, 4)))
+        self.assertGreater(detector.n_updates_since_factorization, 0)
+        reference_data = np.array(detector.reference_data)
+        np.testing.assert_allclose(np.mean(reference_data, axis=0), detector.reference_mean, atol=1e-10)
+        np.testing.assert_allclose(
+            np.linalg.pinv(np.cov(reference_data.T)), detector._get_inverse_covariance_matrix(), atol=1e-8
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,5 +1,7 @@
 import unittest
 
+import numpy as np
+
 from detectors import UCDD
 from test.detectors.helper import get_simple_random_stream_drifts
 
@@ -20,6 +22,17 @@ class UCDDTest(unittest.TestCase):
         self.assertEqual(1, sum(drifts))
         self.assertEqual(1, sum(drifts[50:70]))
 
+    def test_find_closest_neighbor_indices(self):
+        rng = np.random.default_rng(7)
+        data_points = rng.normal(size=(25, 3))
+        neighbor_candidates = rng.normal(size=(12, 3))
+        self.detector.block_size = 4
+        expected = [np.argmin(np.linalg.norm(neighbor_candidates - point, axis=1)) for point in data_points]
+        np.testing.assert_array_equal(
+            expected, self.detector._find_closest_neighbor_indices(data_points, neighbor_candidates)
+        )
+        self.assertEqual(0, len(self.detector._find_closest_neighbor_indices(data_points, neighbor_candidates[:0])))
+
 
 if __name__ == "__main__":
     unittest.main()
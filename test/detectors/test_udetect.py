@@ -1,5 +1,7 @@
 import unittest
 
+import numpy as np
+
 from detectors import UDetect
 from test.detectors.helper import get_simple_random_stream_drifts
 
@@ -14,6 +16,16 @@ class UDetectTest(unittest.TestCase):
         self.assertEqual(1, sum(drifts))
         self.assertEqual(1, sum(drifts[50:70]))
 
+    def test_window_summary(self):
+        detector = UDetect(n_windows=100, n_samples=20, disjoint_training_windows=False)
+        rng = np.random.default_rng(0)
+        detector.update_batch(rng.normal(size=(10, 3)))
+        for features in 1000 + rng.normal(size=(45, 3)):
+            detector.update_array(features)
+            data = detector.data.view()
+            expected = np.sum((data - np.mean(data, axis=0)) ** 2) / 2
+            self.assertAlmostEqual(expected, detector._calculate_window_summary(), places=6)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,57 @@
+import unittest
+from collections import deque
+
+import numpy as np
+
+from detectors.window import Window
+
+
+class WindowTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.window = Window(maxlen=5)
+        self.data = np.arange(24, dtype=float).reshape((12, 2))
+
+    def test_append(self):
+        expected = deque(maxlen=5)
+        for sample in self.data:
+            self.window.append(sample)
+            expected.append(sample)
+            self.assertEqual(len(expected), len(self.window))
+            np.testing.assert_array_equal(np.array(expected), self.window.view())
+        self.assertTrue(self.window.is_full())
+        np.testing.assert_array_equal(self.data[7], self.window[0])
+        np.testing.assert_array_equal(self.data[11], self.window[-1])
+
+    def test_view_is_not_copied(self):
+        self.window.extend(self.data[:7])
+        self.assertTrue(np.shares_memory(self.window.view(), self.window.buffer))
+        self.assertTrue(self.window.view().flags["C_CONTIGUOUS"])
+
+    def test_extend(self):
+        expected = deque(maxlen=5)
+        for i, j in [(0, 2), (2, 3), (3, 7), (7, 7), (7, 12)]:
+            self.window.extend(self.data[i:j])
+            expected.extend(self.data[i:j])
+            np.testing.assert_array_equal(np.array(expected), self.window.view())
+
+    def test_remove(self):
+        self.window.extend(self.data[:8])
+        self.window.remove_oldest(2)
+        np.testing.assert_array_equal(self.data[5:8], self.window.view())
+        self.window.remove_newest(1)
+        np.testing.assert_array_equal(self.data[5:7], self.window.view())
+        self.window.append(self.data[8])
+        np.testing.assert_array_equal(self.data[[5, 6, 8]], self.window.view())
+        self.window.remove_oldest(10)
+        self.assertEqual(0, len(self.window))
+
+    def test_copy_and_clear(self):
+        self.window.extend(self.data[:4])
+        copy = self.window.copy()
+        self.window.clear()
+        self.assertEqual(0, len(self.window))
+        np.testing.assert_array_equal(self.data[:4], copy.view())
+
+
+if __name__ == "__main__":
+    unittest.main()
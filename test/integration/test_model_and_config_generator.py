@@ -21,11 +21,21 @@ class ModelGeneratorConfigGeneratorIntegrationTest(unittest.TestCase):
         )
         return model_optimizer, mock_model
 
+    @staticmethod
+    @patch("optimization.model_optimizer.score")
+    @patch("optimization.model_optimizer.detect")
+    def _execute_jobs(model_optimizer, mock_detect, mock_score):
+        configs = []
+        for job in model_optimizer.jobs(MagicMock(), "test", n_training_samples=10):
+            job.execute()
+            configs.append(job.config)
+        return configs
+
     @patch("optimization.model_optimizer.ExperimentLogger")
     def test_single_model(self, mock_logger):
         model_config = [Parameter("a", value=27)]
         model_optimizer, mock_model = self._setup_optimizer(model_config)
-        for model, config in model_optimizer._model_generator():
+        for config in self._execute_jobs(model_optimizer):
             expected_config = {"a": 27, "seed": 0}
             self.assertDictEqual(expected_config, config)
             mock_model.assert_called_with(**config)
@@ -40,7 +50,7 @@ class ModelGeneratorConfigGeneratorIntegrationTest(unittest.TestCase):
                 Parameter("c", value=np.random.random()),
             ]
             model_optimizer, mock_model = self._setup_optimizer(model_config)
-            for model, config in model_optimizer._model_generator():
+            for config in self._execute_jobs(model_optimizer):
                 expected_config = {
                     parameter.name: parameter.value for parameter in model_config
                 }
@@ -57,39 +67,39 @@ class ModelGeneratorConfigGeneratorIntegrationTest(unittest.TestCase):
             Parameter("c", value=0, max_value=4, n_values=3),
         ]
         model_optimizer, mock_model = self._setup_optimizer(model_config)
-        models_and_configs = list(model_optimizer._model_generator())
+        configs = self._execute_jobs(model_optimizer)
         self.assertDictEqual(
-            {"a": 1, "b": 2, "c": 0, "seed": 0}, models_and_configs[0][1]
+            {"a": 1, "b": 2, "c": 0, "seed": 0}, configs[0]
         )
         self.assertDictEqual(
             {"a": 1, "b": 2, "c": 0, "seed": 0}, mock_model.call_args_list[0].kwargs
         )
         self.assertDictEqual(
-            {"a": 1, "b": 2, "c": 2, "seed": 0}, models_and_configs[1][1]
+            {"a": 1, "b": 2, "c": 2, "seed": 0}, configs[1]
         )
         self.assertDictEqual(
             {"a": 1, "b": 2, "c": 2, "seed": 0}, mock_model.call_args_list[1].kwargs
         )
         self.assertDictEqual(
-            {"a": 1, "b": 2, "c": 4, "seed": 0}, models_and_configs[2][1]
+            {"a": 1, "b": 2, "c": 4, "seed": 0}, configs[2]
         )
         self.assertDictEqual(
             {"a": 1, "b": 2, "c": 4, "seed": 0}, mock_model.call_args_list[2].kwargs
         )
         self.assertDictEqual(
-            {"a": 1, "b": 9, "c": 0, "seed": 0}, models_and_configs[3][1]
+            {"a": 1, "b": 9, "c": 0, "seed": 0}, configs[3]
         )
         self.assertDictEqual(
             {"a": 1, "b": 9, "c": 0, "seed": 0}, mock_model.call_args_list[3].kwargs
         )
         self.assertDictEqual(
-            {"a": 1, "b": 9, "c": 2, "seed": 0}, models_and_configs[4][1]
+            {"a": 1, "b": 9, "c": 2, "seed": 0}, configs[4]
         )
         self.assertDictEqual(
             {"a": 1, "b": 9, "c": 2, "seed": 0}, mock_model.call_args_list[4].kwargs
         )
         self.assertDictEqual(
-            {"a": 1, "b": 9, "c": 4, "seed": 0}, models_and_configs[5][1]
+            {"a": 1, "b": 9, "c": 4, "seed": 0}, configs[5]
         )
         self.assertDictEqual(
             {"a": 1, "b": 9, "c": 4, "seed": 0}, mock_model.call_args_list[5].kwargs
@@ -103,9 +113,10 @@ class ModelGeneratorConfigGeneratorIntegrationTest(unittest.TestCase):
             Parameter("c", value=0, max_value=4, n_values=3),
         ]
         model_optimizer, mock_model = self._setup_optimizer(model_config)
-        models_and_configs = list(model_optimizer._model_generator())
-        models_and_configs2 = list(model_optimizer._model_generator())
-        self.assertEqual(models_and_configs, models_and_configs2)
+        configs = self._execute_jobs(model_optimizer)
+        configs2 = self._execute_jobs(model_optimizer)
+        self.assertEqual(configs, configs2)
+        self.assertEqual(mock_model.call_args_list[:6], mock_model.call_args_list[6:])
 
 
 if __name__ == "__main__":
@@ -1,3 +1,5 @@
+import csv
+import itertools
 import os
 import unittest
 from unittest.mock import patch
@@ -32,10 +34,11 @@ class OptimizeTest(unittest.TestCase):
         self.base_name = f"INTEGRATION-TEST-{str(uuid4())}"
 
     @patch("optimization.config_generator.time")
+    @patch("optimization.model_optimizer.get_baseline")
     @patch("optimization.model_optimizer.get_metrics")
-    @patch("optimization.model_optimizer.Classifiers")
+    @patch("optimization.model_optimizer.get_confusion_matrices")
     def test_one_run(
-        self, mock_classifiers, mock_get_metrics, mock_config_gen_time
+        self, mock_get_confusion_matrices, mock_get_metrics, mock_get_baseline, mock_config_gen_time
     ):
         mock_config_gen_time.time.return_value = 112244578
         mock_get_metrics.return_value = ExperimentResult(
@@ -57,9 +60,10 @@ class OptimizeTest(unittest.TestCase):
             "112244578,[10],1,2,3,4,5,6,7,8,9,10,[10]\n", lines[1]
         )
 
+    @patch("optimization.model_optimizer.get_baseline")
     @patch("optimization.model_optimizer.get_metrics")
-    @patch("optimization.model_optimizer.Classifiers")
-    def test_ten_runs(self, mock_classifiers, mock_get_metrics):
+    @patch("optimization.model_optimizer.get_confusion_matrices")
+    def test_ten_runs(self, mock_get_confusion_matrices, mock_get_metrics, mock_get_baseline):
         name = f"{self.base_name}-TEN-RUNS"
         parameters = [Parameter("drift_positions", values=[[i] for i in range(10)])]
         optimizer = ModelOptimizer(TestDetector, parameters, seeds=None, n_runs=10)
@@ -72,6 +76,35 @@ class OptimizeTest(unittest.TestCase):
                     lines = f.readlines()
                     self.assertEqual(101, len(lines))
 
+    @patch("optimization.model_optimizer.get_baseline")
+    @patch("optimization.model_optimizer.get_metrics")
+    @patch("optimization.model_optimizer.get_confusion_matrices")
+    def test_resume(self, mock_get_confusion_matrices, mock_get_metrics, mock_get_baseline):
+        mock_get_metrics.return_value = ExperimentResult(
+            lpd=(1, 2), accuracies=[3, 4, 5, 6], f1_scores=[7, 8, 9, 10]
+        )
+        name = f"{self.base_name}-RESUME"
+        path = os.path.join("results/TestStream", f"TestDetector_{name}.csv")
+        parameters = [Parameter("drift_positions", values=[[i] for i in range(4)])]
+        optimizer = ModelOptimizer(TestDetector, parameters, seeds=None, n_runs=2)
+        jobs = optimizer.jobs(TestStream(20), name, n_training_samples=20)
+        for job in itertools.islice(jobs, 5):
+            metrics, drifts = job.execute()
+            job.logger.log(job.config, metrics, drifts)
+        with open(path, "a") as f:
+            f.write("1666976563,[1],1,2,3")
+
+        optimizer.optimize(TestStream(20), name, n_training_samples=20, resume=True)
+        with open(path, newline="") as f:
+            rows = list(csv.DictReader(f))
+        self.assertEqual(8, len(rows))
+        for i in range(4):
+            self.assertEqual(2, sum(row["drift_positions"] == f"[{i}]" for row in rows))
+
+        optimizer.optimize(TestStream(20), name, n_training_samples=20, resume=True)
+        with open(path, newline="") as f:
+            self.assertEqual(8, len(list(csv.DictReader(f))))
+
     def tearDown(self) -> None:
         for filename in os.listdir("results/TestStream"):
             if self.base_name in filename:
@@ -1,4 +1,5 @@
 import unittest
+from unittest.mock import MagicMock, patch
 
 import numpy as np
 
@@ -22,21 +23,27 @@ class ReproducibilityTest(unittest.TestCase):
             base_model=TestModel,
             parameters=[Parameter("param", values=param_values)],
             seeds=seeds,
-            n_runs=0,
+            n_runs=1,
         )
         return optimizer
 
+    @staticmethod
+    @patch("optimization.model_optimizer.ExperimentLogger")
+    def _get_models_and_configs(optimizer, mock_logger):
+        jobs = optimizer.jobs(MagicMock(), "test", n_training_samples=10)
+        return [(job.base_model(**job.config), job.config) for job in jobs]
+
     def test_seed_usage(self):
         for _ in range(10):
             param_values = np.zeros(np.random.randint(4, 33))
             optimizer = self._get_model_optimizer(param_values)
             seeds = []
-            for model, config in optimizer._model_generator():
+            for model, config in self._get_models_and_configs(optimizer):
                 self.assertEqual(model.seed, config["seed"])
                 seeds.append(model.seed)
 
             optimizer = self._get_model_optimizer(param_values, seeds)
-            for seed, (model, config) in zip(seeds, optimizer._model_generator()):
+            for seed, (model, config) in zip(seeds, self._get_models_and_configs(optimizer)):
                 self.assertEqual(model.seed, config["seed"])
                 self.assertEqual(seed, model.seed)
 
@@ -46,13 +53,13 @@ class ReproducibilityTest(unittest.TestCase):
             optimizer = self._get_model_optimizer(param_values)
             seeds = []
             configs = []
-            for model, config in optimizer._model_generator():
+            for model, config in self._get_models_and_configs(optimizer):
                 self.assertEqual(model.seed, config["seed"])
                 seeds.append(model.seed)
                 configs.append(config)
 
             optimizer = self._get_model_optimizer(param_values, seeds)
-            for i, (model, config) in enumerate(optimizer._model_generator()):
+            for i, (model, config) in enumerate(self._get_models_and_configs(optimizer)):
                 self.assertEqual(model.seed, config["seed"])
                 self.assertEqual(seeds[i], model.seed)
                 self.assertDictEqual(configs[i], config)
@@ -0,0 +1,58 @@
+"""This module tests the confusion matrix."""
+import unittest
+
+import numpy as np
+from sklearn.metrics import accuracy_score, f1_score
+
+from metrics.confusion_matrix import ConfusionMatrix
+
+
+class ConfusionMatrixTest(unittest.TestCase):
+    """
+    This class compares the scores of the confusion matrix to sklearn's scores.
+    """
+
+    def setUp(self):
+        rng = np.random.default_rng(7)
+        self.true_labels = rng.choice(["a", "b", "c"], size=500).tolist()
+        self.predicted_labels = rng.choice(["a", "b", "d"], size=500).tolist()
+
+    def _get_confusion_matrix(self, true_labels, predicted_labels):
+        confusion_matrix = ConfusionMatrix()
+        for y_true, y_pred in zip(true_labels, predicted_labels):
+            confusion_matrix.update(y_true, y_pred)
+        return confusion_matrix
+
+    def test_scores_equal_sklearn(self):
+        """
+        Test that accuracy and macro f1 score equal sklearn's, including labels that are never predicted or true.
+        """
+        confusion_matrix = self._get_confusion_matrix(self.true_labels, self.predicted_labels)
+        self.assertAlmostEqual(accuracy_score(self.true_labels, self.predicted_labels), confusion_matrix.accuracy())
+        self.assertAlmostEqual(
+            f1_score(self.true_labels, self.predicted_labels, average="macro"), confusion_matrix.f1_score()
+        )
+
+    def test_update_batch(self):
+        """
+        Test that counting a batch of predictions equals counting each prediction.
+        """
+        confusion_matrix = ConfusionMatrix()
+        confusion_matrix.update_batch(self.true_labels, self.predicted_labels)
+        self.assertEqual(self._get_confusion_matrix(self.true_labels, self.predicted_labels), confusion_matrix)
+
+    def test_sum_of_parts(self):
+        """
+        Test that the confusion matrices of two parts add up to the confusion matrix of the whole.
+        """
+        whole = self._get_confusion_matrix(self.true_labels, self.predicted_labels)
+        first = self._get_confusion_matrix(self.true_labels[:200], self.predicted_labels[:200])
+        second = self._get_confusion_matrix(self.true_labels[200:], self.predicted_labels[200:])
+        self.assertEqual(whole, first + second)
+        first += second
+        self.assertEqual(whole, first)
+        self.assertEqual(500, first.n_samples)
+
+
+if __name__ == "__main__":
+    unittest.main()
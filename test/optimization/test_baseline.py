@@ -0,0 +1,72 @@
+import io
+import unittest
+from contextlib import redirect_stdout
+
+from sklearn.metrics import accuracy_score, f1_score
+
+from datasets.sine_clusters import SineClusters
+from optimization.baseline import get_baseline, get_stream_key
+from optimization.classifiers import Classifiers
+
+
+class CountingStream:
+    def __init__(self, length, offset=0):
+        self.length = length
+        self.offset = offset
+        self.iterations = []
+
+    def __iter__(self):
+        self.iterations.append(None)
+        for i in range(self.length):
+            yield {"a": float((i + self.offset) % 5), "b": float(i % 3)}, (i + self.offset) % 2
+
+
+class GetStreamKeyTest(unittest.TestCase):
+    def test_equally_configured_streams(self):
+        self.assertEqual(get_stream_key(CountingStream(10)), get_stream_key(CountingStream(10)))
+
+    def test_differently_configured_streams(self):
+        self.assertNotEqual(get_stream_key(CountingStream(10)), get_stream_key(CountingStream(11)))
+        self.assertNotEqual(get_stream_key(CountingStream(10)), get_stream_key(CountingStream(10, offset=1)))
+
+    def test_key_unchanged_by_iteration(self):
+        stream = SineClusters(drift_frequency=50, stream_length=100, seed=3)
+        key = get_stream_key(stream)
+        with redirect_stdout(io.StringIO()):
+            list(stream)
+        self.assertEqual(key, get_stream_key(stream))
+        self.assertEqual(key, get_stream_key(SineClusters(drift_frequency=50, stream_length=100, seed=3)))
+        self.assertNotEqual(key, get_stream_key(SineClusters(drift_frequency=50, stream_length=100, seed=4)))
+
+
+class GetBaselineTest(unittest.TestCase):
+    def test_computed_once(self):
+        stream = CountingStream(50, offset=17)
+        first = get_baseline(stream, n_training_samples=20)
+        second = get_baseline(stream, n_training_samples=20)
+        self.assertIs(first, second)
+        self.assertEqual(1, len(stream.iterations))
+        get_baseline(stream, n_training_samples=10)
+        self.assertEqual(2, len(stream.iterations))
+
+    def test_matches_classifiers_trained_on_training_samples(self):
+        stream = CountingStream(60, offset=3)
+        n_training_samples = 25
+        baseline = get_baseline(stream, n_training_samples)
+        classifiers = Classifiers()
+        labels = []
+        predictions = []
+        for i, (x, y) in enumerate(stream):
+            if i != 0:
+                labels.append(y)
+                predictions.append(classifiers.predict(x))
+            if i < n_training_samples:
+                classifiers.fit(x, y)
+        self.assertEqual(60, baseline.n_samples)
+        for j, classifier_predictions in enumerate(zip(*predictions)):
+            self.assertAlmostEqual(accuracy_score(labels, classifier_predictions), baseline.accuracies[j])
+            self.assertAlmostEqual(f1_score(labels, classifier_predictions, average="macro"), baseline.f1_scores[j])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -139,6 +139,15 @@ class SeedGenerationTest(unittest.TestCase):
             for j in range(i + 1, len(seeds)):
                 self.assertNotEqual(seed, seeds[j])
 
+    @patch("optimization.config_generator.time")
+    def test_different_seeds_within_one_second(self, time_mock):
+        time_mock.time.return_value = 25
+        parameters = [Parameter("a", values=list(range(5)))]
+        configs = ConfigGenerator(parameters)
+        seeds = [config["seed"] for config in configs]
+        seeds += [config["seed"] for config in configs]
+        self.assertListEqual(list(range(25, 35)), seeds)
+
     @patch("optimization.config_generator.time")
     def test_time_called(self, time_mock):
         parameters = [Parameter("a", value=0)]
@@ -0,0 +1,115 @@
+import os
+import tempfile
+import unittest
+import warnings
+from unittest.mock import patch
+
+import numpy as np
+
+from optimization.drift_cache import DriftCache, get_stream_fingerprint
+from optimization.model_optimizer import Job, ModelOptimizer, evaluate
+from optimization.parameter import Parameter
+
+
+class CountingDetector:
+    instances = []
+
+    def __init__(self, drift_positions, seed=None):
+        self.i = -1
+        self.drifts = drift_positions
+        CountingDetector.instances.append(self)
+
+    def update(self, features):
+        self.i += 1
+        return self.i in self.drifts
+
+
+class FileStream:
+    def __init__(self, full_path):
+        self.full_path = full_path
+
+    def __iter__(self):
+        for i in range(40):
+            yield {"a": float(i % 7), "b": float(i % 3)}, i % 2
+
+
+class LazyStream:
+    def __init__(self):
+        self.seed = 3
+        # like the random number generators of synthetic data streams, only set when iterated
+        self.rng = None
+
+    def __iter__(self):
+        self.rng = np.random.default_rng(self.seed)
+        for i in range(40):
+            yield {"a": float(i % 7), "b": self.rng.random()}, i % 2
+
+
+class DriftCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.directory.name, "data.csv")
+        self._write_file("a,b\n1,2\n")
+        self.cache = DriftCache(os.path.join(self.directory.name, "drifts"))
+        CountingDetector.instances = []
+
+    def _write_file(self, content):
+        with open(self.file_path, "w") as f:
+            f.write(content)
+
+    def test_fingerprint_depends_on_content(self):
+        stream = FileStream(self.file_path)
+        fingerprint = get_stream_fingerprint(stream)
+        self.assertEqual(fingerprint, get_stream_fingerprint(FileStream(self.file_path)))
+        self._write_file("a,b\n1,3\n")
+        os.utime(self.file_path, ns=(0, 0))
+        self.assertNotEqual(fingerprint, get_stream_fingerprint(stream))
+
+    def test_get_put(self):
+        fingerprint = get_stream_fingerprint(FileStream(self.file_path))
+        config = {"seed": 1, "drift_positions": [3]}
+        self.assertIsNone(self.cache.get(fingerprint, "CountingDetector", config))
+        self.cache.put(fingerprint, "CountingDetector", config, [3, 17])
+        self.assertListEqual([3, 17], self.cache.get(fingerprint, "CountingDetector", config))
+        self.assertIsNone(self.cache.get(fingerprint, "CountingDetector", {"seed": 2, "drift_positions": [3]}))
+        self.assertIsNone(self.cache.get(fingerprint, "OtherDetector", config))
+
+    def test_job_reuses_cached_drifts(self):
+        stream = FileStream(self.file_path)
+        config = {"seed": 1, "drift_positions": [5, 20]}
+        expected_metrics, expected_drifts = evaluate(CountingDetector(**config), stream, n_training_samples=10)
+        for n_training_samples in [10, 10, 15]:
+            job = Job(stream, CountingDetector, config, n_training_samples, logger=None, drift_cache=self.cache)
+            metrics, drifts = job.execute()
+            self.assertListEqual(expected_drifts, drifts)
+        self.assertEqual(expected_metrics, Job(stream, CountingDetector, config, 10, None, self.cache).execute()[0])
+        # one detector for the expected results, one for the first job
+        self.assertEqual(2, len(CountingDetector.instances))
+
+    def test_second_job_hits_cache(self):
+        config = {"seed": 1, "drift_positions": [5, 20]}
+        for stream in [LazyStream(), LazyStream()]:
+            Job(stream, CountingDetector, config, 10, logger=None, drift_cache=self.cache).execute()
+            Job(stream, CountingDetector, config, 10, logger=None, drift_cache=self.cache).execute()
+        self.assertEqual(1, len(CountingDetector.instances))
+        self.assertEqual(1, len(os.listdir(self.cache.directory)))
+
+    @patch("optimization.model_optimizer.ExperimentLogger")
+    def test_warning_without_seeds(self, mock_logger):
+        parameters = [Parameter("drift_positions", values=[[5]])]
+        optimizer = ModelOptimizer(CountingDetector, parameters, n_runs=1, seeds=None)
+        with self.assertWarns(UserWarning):
+            jobs = list(optimizer.jobs(LazyStream(), "test", n_training_samples=10, drift_cache=self.cache))
+        self.assertIsNone(jobs[0].drift_cache)
+        optimizer = ModelOptimizer(CountingDetector, parameters, n_runs=1, seeds=[1])
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            jobs = list(optimizer.jobs(LazyStream(), "test", n_training_samples=10, drift_cache=self.cache))
+        self.assertIs(self.cache, jobs[0].drift_cache)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+
+if __name__ == "__main__":
+    unittest.main()
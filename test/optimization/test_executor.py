@@ -0,0 +1,73 @@
+import csv
+import os
+import unittest
+from uuid import uuid4
+
+from optimization.executor import ParallelExecutor
+from optimization.model_optimizer import ModelOptimizer
+from optimization.parameter import Parameter
+
+
+class FixedDriftDetector:
+    def __init__(self, drift_positions, seed=None):
+        self.i = -1
+        self.drifts = drift_positions
+
+    def update(self, features):
+        self.i += 1
+        return self.i in self.drifts
+
+
+class ExecutorTestStream:
+    def __init__(self, length):
+        self.length = length
+
+    def __iter__(self):
+        for i in range(self.length):
+            yield {"a": float(i % 7), "b": float(i % 3)}, i % 2
+
+
+class ParallelExecutorTest(unittest.TestCase):
+    path = os.path.join("results", "ExecutorTestStream")
+
+    def setUp(self) -> None:
+        self.base_name = f"EXECUTOR-TEST-{str(uuid4())}"
+
+    def _read_rows(self, name):
+        with open(os.path.join(self.path, f"FixedDriftDetector_{name}.csv"), newline="") as f:
+            return list(csv.DictReader(f))
+
+    def test_invalid_number_of_workers(self):
+        with self.assertRaises(ValueError):
+            ParallelExecutor(0)
+
+    def test_parallel_equals_sequential(self):
+        parameters = [Parameter("drift_positions", values=[[i * 5] for i in range(6)])]
+        stream = ExecutorTestStream(60)
+        sequential_name = f"{self.base_name}-SEQUENTIAL"
+        parallel_name = f"{self.base_name}-PARALLEL"
+
+        optimizer = ModelOptimizer(FixedDriftDetector, parameters, seeds=list(range(6)), n_runs=3)
+        optimizer.optimize(stream, sequential_name, n_training_samples=20)
+        ParallelExecutor(n_workers=3).run(
+            optimizer.jobs(stream, parallel_name, n_training_samples=20)
+        )
+
+        sequential_rows = self._read_rows(sequential_name)
+        parallel_rows = self._read_rows(parallel_name)
+        self.assertEqual(18, len(parallel_rows))
+        key = lambda row: (row["seed"], row["drifts"])
+        self.assertListEqual(sorted(sequential_rows, key=key), sorted(parallel_rows, key=key))
+
+    def tearDown(self) -> None:
+        if not os.path.exists(self.path):
+            return
+        for filename in os.listdir(self.path):
+            if self.base_name in filename:
+                os.remove(os.path.join(self.path, filename))
+        if len(os.listdir(self.path)) == 0:
+            os.rmdir(self.path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,9 @@
+import os
+import tempfile
 import unittest
 from unittest.mock import MagicMock, patch
 
+from detectors.instrumentation import Instrumentation
 from optimization.logger import ExperimentLogger
 
 
@@ -78,6 +81,95 @@ class ExperimentLoggerTest(unittest.TestCase):
             }
         )
 
+    @patch("optimization.logger.os.path.exists")
+    @patch("optimization.logger.csv.DictWriter")
+    @patch("builtins.open")
+    def test_log_instrumentation(self, mock_open, mock_dictwriter, mock_exists):
+        mock_exists.return_value = True
+        mock_dictwriter.return_value = MagicMock()
+        mock_stream = MagicMock()
+        del mock_stream.drifts
+        logger = ExperimentLogger(mock_stream, MagicMock(), "test_log_row", ["key1"], log_instrumentation=True)
+        self.assertListEqual(["key1"] + self.common_columns + Instrumentation.keys + ["drifts"], logger.columns)
+        results = MagicMock()
+        results.to_dict.return_value = {"metric1": 0}
+        results.instrumentation = {"n test": 5}
+        logger.log({"key1": 1}, results, [1])
+        mock_dictwriter.return_value.writerow.assert_called_with(
+            {"key1": 1, "metric1": 0, "drifts": [1], "n test": 5}
+        )
+
+
+class ResumeTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.full_path = os.path.join(self.directory.name, "log.csv")
+
+    def _get_logger(self):
+        with patch.object(ExperimentLogger, "_create_log"):
+            logger = ExperimentLogger(MagicMock(), MagicMock(), "test_resume", ["seed", "a"], resume=True)
+        logger.full_path = self.full_path
+        return logger
+
+    def test_remove_incomplete_row(self):
+        with open(self.full_path, "w") as f:
+            f.write("seed,a,drifts\n1,2,[]\n3,4,[")
+        self._get_logger()._remove_incomplete_row()
+        with open(self.full_path) as f:
+            self.assertEqual("seed,a,drifts\n1,2,[]\n", f.read())
+
+    def test_keep_complete_rows(self):
+        with open(self.full_path, "w") as f:
+            f.write("seed,a,drifts\n1,2,[]\n")
+        self._get_logger()._remove_incomplete_row()
+        with open(self.full_path) as f:
+            self.assertEqual("seed,a,drifts\n1,2,[]\n", f.read())
+
+    def test_get_completed_runs(self):
+        with open(self.full_path, "w") as f:
+            f.write('seed,a,drifts\n1,0.5,"[1, 2]"\n2,0.5,[]\n3,None,[]\n4,0.5\n')
+        logger = self._get_logger()
+        completed_runs = logger.get_completed_runs(include_seed=False)
+        self.assertEqual(2, completed_runs[logger.get_config_key({"seed": 7, "a": 0.5}, include_seed=False)])
+        self.assertEqual(1, completed_runs[logger.get_config_key({"seed": 7, "a": "None"}, include_seed=False)])
+        completed_runs = logger.get_completed_runs(include_seed=True)
+        self.assertEqual(1, completed_runs[logger.get_config_key({"seed": 1, "a": 0.5}, include_seed=True)])
+        self.assertEqual(0, completed_runs[logger.get_config_key({"seed": 4, "a": 0.5}, include_seed=True)])
+
+    def test_resume_with_different_instrumentation(self):
+        working_directory = os.getcwd()
+        os.chdir(self.directory.name)
+        try:
+            stream = MagicMock()
+            del stream.drifts
+            for log_instrumentation in [False, True]:
+                with self.subTest(log_instrumentation=log_instrumentation):
+                    experiment_name = f"test_resume_{log_instrumentation}"
+                    logger = ExperimentLogger(
+                        stream, "model", experiment_name, ["seed"], log_instrumentation=log_instrumentation
+                    )
+                    with open(logger.full_path) as f:
+                        content = f.read()
+                    with self.assertRaises(ValueError):
+                        ExperimentLogger(
+                            stream,
+                            "model",
+                            experiment_name,
+                            ["seed"],
+                            resume=True,
+                            log_instrumentation=not log_instrumentation,
+                        )
+                    with open(logger.full_path) as f:
+                        self.assertEqual(content, f.read())
+                    ExperimentLogger(
+                        stream, "model", experiment_name, ["seed"], resume=True, log_instrumentation=log_instrumentation
+                    )
+        finally:
+            os.chdir(working_directory)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -8,13 +8,13 @@ from optimization.model_optimizer import ModelOptimizer
 
 class ModelGeneratorTest(unittest.TestCase):
     @staticmethod
-    def _setup_optimizer(model_config):
+    def _setup_optimizer(mock_configs, model_config):
         mock_model = MagicMock()
         mock_model.__name__ = MagicMock()
         mock_model.return_value = MagicMock()
         mock_config = MagicMock()
         mock_config.__iter__.return_value = model_config
-        mock_stream = MagicMock()
+        mock_configs.return_value = mock_config
         model_optimizer = ModelOptimizer(
             base_model=mock_model,
             parameters=MagicMock(),
@@ -23,9 +23,15 @@ class ModelGeneratorTest(unittest.TestCase):
         )
         return model_optimizer, mock_model
 
+    @staticmethod
+    def _get_jobs(model_optimizer):
+        return list(model_optimizer.jobs(MagicMock(), "test", n_training_samples=10))
+
+    @patch("optimization.model_optimizer.score")
+    @patch("optimization.model_optimizer.detect")
     @patch("optimization.model_optimizer.ConfigGenerator")
     @patch("optimization.model_optimizer.ExperimentLogger")
-    def test_initial_model(self, mock_logger, mock_configs):
+    def test_initial_model(self, mock_logger, mock_configs, mock_detect, mock_score):
         for _ in range(5):
             model_config = [
                 {
@@ -34,13 +40,13 @@ class ModelGeneratorTest(unittest.TestCase):
                     "c": np.random.random(),
                 }
             ]
-            mock_configs.return_value = model_config
-            model_optimizer, mock_model = self._setup_optimizer(model_config)
-            i = -1
-            for i, (model, _) in enumerate(model_optimizer._model_generator()):
-                self.assertEqual(mock_model.return_value, model)
+            model_optimizer, mock_model = self._setup_optimizer(mock_configs, model_config)
+            jobs = self._get_jobs(model_optimizer)
+            self.assertEqual(len(model_config), len(jobs))
+            for i, job in enumerate(jobs):
+                job.execute()
                 mock_model.assert_called_with(**model_config[i])
-            self.assertEqual(i + 1, len(model_config))
+                self.assertEqual(mock_model.return_value, mock_detect.call_args.args[0])
 
     @patch("optimization.model_optimizer.ConfigGenerator")
     @patch("optimization.model_optimizer.ExperimentLogger")
@@ -53,25 +59,26 @@ class ModelGeneratorTest(unittest.TestCase):
                     "c": np.random.random(),
                 }
             ]
-            mock_configs.return_value = model_config
-            model_optimizer, mock_model = self._setup_optimizer(model_config)
-            i = -1
-            for i, (_, config) in enumerate(model_optimizer._model_generator()):
-                self.assertDictEqual(model_config[0], config)
-            self.assertEqual(i + 1, len(model_config))
+            model_optimizer, mock_model = self._setup_optimizer(mock_configs, model_config)
+            jobs = self._get_jobs(model_optimizer)
+            self.assertEqual(len(model_config), len(jobs))
+            for job in jobs:
+                self.assertDictEqual(model_config[0], job.config)
+                self.assertEqual(mock_model, job.base_model)
 
+    @patch("optimization.model_optimizer.score")
+    @patch("optimization.model_optimizer.detect")
     @patch("optimization.model_optimizer.ConfigGenerator")
     @patch("optimization.model_optimizer.ExperimentLogger")
-    def test_full_sweep_models(self, mock_logger, mock_configs):
+    def test_full_sweep_models(self, mock_logger, mock_configs, mock_detect, mock_score):
         model_config = [
             {"a": np.random.random(), "b": np.random.random(), "c": np.random.random()},
             {"d": np.random.random(), "e": np.random.random()},
             {"f": np.random.random()},
         ]
-        mock_configs.return_value = model_config
-        model_optimizer, mock_model = self._setup_optimizer(model_config)
-        for config, (model, _) in zip(model_config, model_optimizer._model_generator()):
-            self.assertEqual(mock_model.return_value, model)
+        model_optimizer, mock_model = self._setup_optimizer(mock_configs, model_config)
+        for config, job in zip(model_config, self._get_jobs(model_optimizer)):
+            job.execute()
             mock_model.assert_called_with(**config)
 
     @patch("optimization.model_optimizer.ConfigGenerator")
@@ -82,12 +89,11 @@ class ModelGeneratorTest(unittest.TestCase):
             {"d": np.random.random(), "e": np.random.random()},
             {"f": np.random.random(), "g": np.random.random()},
         ]
-        mock_configs.return_value = model_config
-        model_optimizer, mock_model = self._setup_optimizer(model_config)
-        for config, (_, used_config) in zip(
-            model_config, model_optimizer._model_generator()
-        ):
-            self.assertDictEqual(config, used_config)
+        model_optimizer, mock_model = self._setup_optimizer(mock_configs, model_config)
+        jobs = self._get_jobs(model_optimizer)
+        self.assertEqual(len(model_config), len(jobs))
+        for config, job in zip(model_config, jobs):
+            self.assertDictEqual(config, job.config)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,70 @@
+import unittest
+
+import numpy as np
+from sklearn.metrics import accuracy_score, f1_score
+
+from optimization.classifiers import Classifiers
+from optimization import segments
+from optimization.segments import get_confusion_matrices, get_segments
+from test.optimization.test_baseline import CountingStream
+
+
+def get_scores(stream, drifts):
+    classifiers = Classifiers()
+    labels = []
+    predictions = []
+    for i, (x, y) in enumerate(stream):
+        if i != 0:
+            predictions.append(classifiers.predict(x))
+            labels.append(y)
+        if i in drifts:
+            classifiers.reset()
+        classifiers.fit(x, y)
+    predictions = np.array(predictions).transpose()
+    accuracies = [accuracy_score(labels, classifier_predictions) for classifier_predictions in predictions]
+    f1_scores = [f1_score(labels, classifier_predictions, average="macro") for classifier_predictions in predictions]
+    return accuracies, f1_scores
+
+
+class GetSegmentsTest(unittest.TestCase):
+    def test_segments(self):
+        self.assertListEqual([(0, 9)], get_segments([], 10))
+        self.assertListEqual([(0, 3), (3, 7), (7, 9)], get_segments([7, 3], 10))
+        self.assertListEqual([(0, 3), (3, 9)], get_segments([0, 3, 9], 10))
+
+
+class GetConfusionMatricesTest(unittest.TestCase):
+    def test_equals_resetting_classifiers(self):
+        stream = CountingStream(80, offset=11)
+        for drifts in [[], [0], [10, 40], [10, 40, 79], [25, 40, 60]]:
+            with self.subTest(drifts=drifts):
+                accuracies, f1_scores = get_scores(stream, drifts)
+                confusion_matrices = get_confusion_matrices(stream, drifts, n_samples=80)
+                for i, confusion_matrix in enumerate(confusion_matrices):
+                    self.assertEqual(79, confusion_matrix.n_samples)
+                    self.assertAlmostEqual(accuracies[i], confusion_matrix.accuracy())
+                    self.assertAlmostEqual(f1_scores[i], confusion_matrix.f1_score())
+
+    def test_segments_reused(self):
+        stream = CountingStream(60, offset=23)
+        first = get_confusion_matrices(stream, [10, 30], n_samples=60)
+        self.assertEqual(1, len(stream.iterations))
+        self.assertListEqual(first, get_confusion_matrices(stream, [10, 30], n_samples=60))
+        # a drift at the last sample does not change any prediction
+        self.assertListEqual(first, get_confusion_matrices(stream, [0, 10, 30, 59], n_samples=60))
+        self.assertEqual(1, len(stream.iterations))
+        get_confusion_matrices(stream, [10, 45], n_samples=60)
+        self.assertEqual(2, len(stream.iterations))
+
+    def test_cache_scoped_to_stream(self):
+        first_stream = CountingStream(60, offset=31)
+        second_stream = CountingStream(60, offset=32)
+        expected = get_confusion_matrices(first_stream, [10, 30], n_samples=60)
+        get_confusion_matrices(second_stream, [10, 30], n_samples=60)
+        self.assertListEqual([(0, 10), (10, 30), (30, 59)], list(segments._segments))
+        self.assertListEqual(expected, get_confusion_matrices(first_stream, [10, 30], n_samples=60))
+        self.assertEqual(2, len(first_stream.iterations))
+
+
+if __name__ == "__main__":
+    unittest.main()